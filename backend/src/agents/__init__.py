@@ -6,11 +6,12 @@ from .greeting_agent import create_greeting_agent
 from .orchestrator import handle_turn
 from .parser_agent import create_parser_agent
 from .reframing_agent import create_reframing_agent
-from .state import ControlBlock, Phase, SessionState
+from .state import ControlBlock, CoreState, Phase, SessionState
 from .summary_agent import create_summary_agent
 
 __all__ = [
     "ControlBlock",
+    "CoreState",
     "Phase",
     "SessionState",
     "agent",
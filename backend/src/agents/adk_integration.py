@@ -10,7 +10,6 @@ import asyncio
 import json
 import logging
 import re
-from threading import RLock
 from typing import Any
 
 from google.generativeai import GenerativeModel
@@ -18,7 +17,11 @@ from google.generativeai import GenerativeModel
 from src.knowledge.cbt_context import BASE_CBT_CONTEXT
 
 from .orchestrator import handle_turn
-from .state import SessionState
+from .parser_agent import build_parser_instruction, parse_parser_output
+from .speculative import SPECULATIVE_PARSER_ENABLED, SpeculativeParser
+from .state import CoreState
+from .state_store import SessionStateStore
+from .stream_guard import ControlStreamGuard, phase_token_cap
 from .ui_contract import enforce_ui_contract
 
 logger = logging.getLogger(__name__)
@@ -27,18 +30,27 @@ logger = logging.getLogger(__name__)
 class ADKIntegration:
     """Wrapper to integrate new orchestration with existing ADK agents."""
 
-    def __init__(self, model: GenerativeModel | None = None):
-        """Initialize with optional Gemini model."""
+    def __init__(
+        self,
+        model: GenerativeModel | None = None,
+        session_store: SessionStateStore | None = None,
+        speculative_parser: bool = SPECULATIVE_PARSER_ENABLED,
+    ):
+        """
+        Initialize with optional Gemini model and session state store.
+
+        With speculative_parser, CLARIFY/REFRAME turns also run the parser
+        agent in the background; see src/agents/speculative.py.
+        """
         self.model = model or GenerativeModel("gemini-1.5-flash-latest")
-        self.session_store: dict[str, SessionState] = {}
-        self._lock = RLock()
+        self.session_store = session_store or SessionStateStore()
+        self.speculative: SpeculativeParser | None = (
+            SpeculativeParser(self.parser_llm_call) if speculative_parser else None
+        )
 
-    def get_or_create_session(self, session_id: str) -> SessionState:
+    def get_or_create_session(self, session_id: str) -> CoreState:
         """Get existing session or create new one."""
-        with self._lock:
-            if session_id not in self.session_store:
-                self.session_store[session_id] = SessionState()
-            return self.session_store[session_id]
+        return self.session_store.get_or_create(session_id)
 
     def adk_llm_call(self, *, system: str, kb: str, state: dict, user: str) -> str:
         """
@@ -68,29 +80,12 @@ class ADKIntegration:
         # Create messages for the model
         # Note: Adapt this to your specific ADK agent setup
         try:
-            # Generate response using the model
-            response = self.model.generate_content(
-                [full_prompt, f"User: {user}"],
-                generation_config={
-                    "temperature": 0.4,
-                    "max_output_tokens": 350,
-                },
+            # Stream the response and stop reading once the control block
+            # closes (or the phase budget is spent)
+            response_text = self._stream_reply(
+                [full_prompt, f"User: {user}"], phase=state.get("phase")
             )
 
-            # Extract the text response more robustly
-            response_text = getattr(response, "text", None)
-            if not response_text:
-                # Fallbacks for SDK variants
-                candidates = getattr(response, "candidates", None)
-                if candidates:
-                    parts = [
-                        getattr(c, "content", None) or getattr(c, "text", "")
-                        for c in candidates
-                    ]
-                    response_text = " ".join([str(p) for p in parts if p]).strip()
-            if not response_text:
-                response_text = str(response).strip()
-
             # Ensure response has proper format with stricter validation
             ui_match = re.search(r"<ui>(.*?)</ui>", response_text, flags=re.S | re.I)
             ctrl_match = re.search(
@@ -116,30 +111,92 @@ class ADKIntegration:
             logger.exception("adk_llm_call failed")
             # Error fallback
             return f"""<ui>I'm here to listen and help you explore your thoughts. Could you tell me what's on your mind?</ui>
-<control>{{"next_phase":"{state.get('phase', 'warmup')}","missing_fields":[],"suggest_questions":[],"crisis_detected":false}}</control>"""
+<control>{{"next_phase":"{state.get("phase", "warmup")}","missing_fields":[],"suggest_questions":[],"crisis_detected":false}}</control>"""
 
-    def process_turn(self, session_id: str, user_text: str) -> dict[str, Any]:
+    def _stream_reply(self, contents: list[str], phase: str | None) -> str:
         """
-        Process one turn of conversation using the new orchestration system.
+        Generate a reply as a stream, cutting it at the end of the contract.
 
         Args:
-            session_id: Unique session identifier
-            user_text: User's input text
+            contents: Prompt parts for generate_content
+            phase: Current phase value, selects the token budget
 
         Returns:
-            Dict with phase, turn, banner, ui_text, control, state, and end_of_session
+            The reply text up to (and including) a valid control block
+        """
+        cap = phase_token_cap(phase)
+        guard = ControlStreamGuard(max_tokens=cap)
+        stream = self.model.generate_content(
+            contents,
+            generation_config={"temperature": 0.4, "max_output_tokens": cap},
+            stream=True,
+        )
+        chunks = iter(stream)
+        try:
+            for chunk in chunks:
+                try:
+                    chunk_text = chunk.text
+                except ValueError:
+                    # Chunks without text parts (e.g. safety metadata only)
+                    continue
+                if guard.feed(chunk_text or ""):
+                    break
+        finally:
+            # Like aclosing() in the text router: tear the upstream stream
+            # down now when we stop early, not at garbage collection
+            close = getattr(chunks, "close", None)
+            if close is not None:
+                close()
+        if guard.stop_reason is not None:
+            logger.debug(
+                f"Reply stream stopped early ({guard.stop_reason}) "
+                f"after {len(guard.text)} chars"
+            )
+        return guard.text.strip()
+
+    def parser_llm_call(self, thought: str) -> dict[str, Any] | None:
         """
-        # Get or create session state
-        state = self.get_or_create_session(session_id)
+        Run the parser agent prompt on a thought.
 
-        # Process the turn using the new orchestrator
-        result = handle_turn(state, user_text, adk_llm_call=self.adk_llm_call)
+        Args:
+            thought: The user's message
+
+        Returns:
+            Parsed distortion analysis, or None if the reply was not valid JSON
+        """
+        response = self.model.generate_content(
+            [build_parser_instruction(), f"Thought to analyze: {thought}"],
+            generation_config={"temperature": 0.0, "max_output_tokens": 400},
+        )
+        return parse_parser_output(getattr(response, "text", None) or "")
+
+    def process_turn(
+        self, session_id: str, user_text: str, full_state: bool = False
+    ) -> dict[str, Any]:
+        """
+        Process one turn of conversation using the new orchestration system.
 
-        # Update stored session state with thread safety
-        with self._lock:
-            self.session_store[session_id] = SessionState(**result["state"])
+        Args:
+            session_id: Unique session identifier
+            user_text: User's input text
+            full_state: Include the full state snapshot, not only the delta
 
-        return result
+        Returns:
+            Dict with phase, turn, banner, ui_text, control, state_version,
+            state_base_version, state_delta (plus state for full snapshots),
+            and end_of_session
+        """
+        # handle_turn updates the stored state in place; the session lock only
+        # serializes turns of this session
+        with self.session_store.session(session_id) as state:
+            if self.speculative is not None:
+                # Collect last turn's analysis, then analyze this message
+                # while the main reply is generated
+                self.speculative.harvest(state)
+                self.speculative.launch(state, user_text)
+            return handle_turn(
+                state, user_text, adk_llm_call=self.adk_llm_call, full_state=full_state
+            )
 
 
 # Example usage function
@@ -168,7 +225,8 @@ def example_usage():
     if result.get("banner"):
         print(f"Banner: {result['banner']}")
     print(f"Assistant: {result['ui_text']}")
-    print(f"Turn: {result['turn']}/{result['state']['max_turns']}")
+    state = integration.get_or_create_session(session_id)
+    print(f"Turn: {result['turn']}/{state.max_turns}")
 
     # Check if session ended
     if result["end_of_session"]:
@@ -1,6 +1,6 @@
 # SPDX-License-Identifier: MIT
 
-from .state import SessionState
+from .state import AnyState, Phase
 
 # NOTE: No "Action/Task" language. Pure reframing only.
 PERSONA = """You are AURA: warm, validating, **brief**. Use the user's language.
@@ -32,7 +32,7 @@ MICRO_KNOWLEDGE = {
 }
 
 
-def compose_system_prompt(state: SessionState) -> str:
+def compose_system_prompt(state: AnyState) -> str:
     allowed = "warmup|clarify|reframe|summary|followup|closed"
     return f"""{PERSONA}
 PHASE: {state.phase.value}
@@ -43,5 +43,22 @@ Strict output contract (schema, fill actual values):
 """
 
 
-def retrieve_micro_knowledge(state: SessionState) -> str:
-    return MICRO_KNOWLEDGE.get(state.phase.value, "")
+def _precomputed_distortions(analysis: dict) -> str:
+    items = []
+    for item in analysis.get("identified_distortions", [])[:3]:
+        if not isinstance(item, dict) or not item.get("code"):
+            continue
+        evidence = str(item.get("evidence", "")).strip()
+        items.append(f"{item['code']} ({evidence})" if evidence else item["code"])
+    if not items:
+        return ""
+    return "- Likely distortions (pre-analysis, verify): " + "; ".join(items)
+
+
+def retrieve_micro_knowledge(state: AnyState) -> str:
+    kb = MICRO_KNOWLEDGE.get(state.phase.value, "")
+    if state.phase == Phase.REFRAME and state.distortion_analysis:
+        precomputed = _precomputed_distortions(state.distortion_analysis)
+        if precomputed:
+            kb = f"{kb}\n{precomputed}"
+    return kb
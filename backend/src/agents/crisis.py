@@ -1,24 +1,230 @@
 # SPDX-License-Identifier: MIT
+from functools import lru_cache
+
+from src.knowledge.cbt_context import CRISIS_INDICATORS
+from src.utils.aho_corasick import AhoCorasick, normalize_text
 
 # Keep conservative for PoC. Backend-only.
+# A trailing "*" matches any word ending ("overdos*" also catches
+# "overdosed"), like the distortion indicator terms.
 DANGER_TERMS = [
-    "suicide",
+    "suicid*",
     "kill myself",
+    "killing myself",
+    "killed myself",
     "end it all",
-    "self harm",
-    "self-harm",
-    "cutting",
-    "overdose",
+    "self harm*",
+    "self-harm*",
+    "cutting myself",
+    "cut myself",
+    "cutting again",
+    "started cutting",
+    "urge to cut",
+    "overdos*",
     "harm others",
     "hurt someone",
     "no reason to live",
 ]
 
+# Shared indicators too ambiguous to match on their own ("cutting back on
+# coffee", "a way out of the garage", "can't go on vacation"); fuller phrases
+# are listed instead.
+_AMBIGUOUS_INDICATORS = {"cutting", "way out", "can't go on"}
+_CONTEXT_PHRASES = ["no way out", "can't go on anymore", "can't go on living"]
+
+# Per-language term packs, keyed by the base language of SUPPORTED_LANGUAGES.
+# Terms are matched accent- and case-insensitively, so "automutilação" also
+# catches "automutilacao". English merges DANGER_TERMS with the shared
+# CRISIS_INDICATORS list.
+CRISIS_TERM_PACKS: dict[str, list[str]] = {
+    "en": list(
+        dict.fromkeys(
+            DANGER_TERMS
+            + [term for term in CRISIS_INDICATORS if term not in _AMBIGUOUS_INDICATORS]
+            + _CONTEXT_PHRASES
+        )
+    ),
+    "es": [
+        "suicid*",
+        "matarme",
+        "quitarme la vida",
+        "acabar con todo",
+        "quiero morir",
+        "no quiero vivir",
+        "mejor muerto",
+        "mejor muerta",
+        "autolesi*",
+        "hacerme daño",
+        "cortarme",
+        "sobredosis",
+    ],
+    "pt": [
+        "suicid*",
+        "me matar",
+        "tirar minha vida",
+        "acabar com tudo",
+        "quero morrer",
+        "não quero viver",
+        "melhor morto",
+        "melhor morta",
+        "automutilação",
+        "me machucar",
+        "me cortar",
+    ],
+    "de": [
+        "selbstmord*",
+        "suizid*",
+        "mich umbringen",
+        "mir das leben nehmen",
+        "alles beenden",
+        "will sterben",
+        "nicht mehr leben",
+        "selbstverletzung",
+        "mir wehtun",
+        "mich ritzen",
+        "überdosis",
+    ],
+    "fr": [
+        "suicid*",
+        "me tuer",
+        "veux en finir",
+        "en finir avec la vie",
+        "mettre fin à mes jours",
+        "veux mourir",
+        "plus envie de vivre",
+        "automutilation",
+        "me faire du mal",
+        "me scarifier",
+        "surdose",
+    ],
+    "it": [
+        "suicid*",
+        "uccidermi",
+        "togliermi la vita",
+        "farla finita",
+        "voglio morire",
+        "non voglio più vivere",
+        "autolesionismo",
+        "farmi del male",
+        "tagliarmi",
+    ],
+    "nl": [
+        "zelfmoord*",
+        "suïcide",
+        "mezelf doden",
+        "van kant maken",
+        "wil dood",
+        "niet meer leven",
+        "zelfbeschadiging",
+        "mezelf pijn doen",
+        "mezelf snijden",
+        "overdosis",
+    ],
+    "pl": [
+        "samobójstw*",
+        "samobójcz*",
+        "zabić się",
+        "odebrać sobie życie",
+        "chcę umrzeć",
+        "nie chcę żyć",
+        "samookaleczenie",
+        "skrzywdzić siebie",
+        "ciąć się",
+        "przedawkowanie",
+    ],
+    "hi": [
+        "आत्महत्या",
+        "खुद को मार",
+        "मरना चाहता",
+        "मरना चाहती",
+        "जीना नहीं चाहता",
+        "जीना नहीं चाहती",
+        "खुद को नुकसान",
+    ],
+    "ja": [
+        "自殺",
+        "死にたい",
+        "消えたい",
+        "自傷",
+        "リストカット",
+        "過剰摂取",
+        "生きていたくない",
+    ],
+    "ko": [
+        "자살",
+        "죽고 싶",
+        "자해",
+        "살고 싶지 않",
+        "과다복용",
+    ],
+    "zh": [
+        # Simplified and Traditional forms
+        "自杀",
+        "自殺",
+        "想死",
+        "不想活",
+        "自残",
+        "自殘",
+        "轻生",
+        "輕生",
+        "结束生命",
+        "結束生命",
+    ],
+}
+
+
+# Packs matched as plain substrings: Japanese and Chinese are written without
+# spaces, and the Korean and Hindi terms are stems that take suffixes
+# ("자살을", "मारना"). Every other pack only matches whole words.
+_SUBSTRING_LANGUAGES = frozenset({"hi", "ja", "ko", "zh"})
+
+
+def _is_word_char(ch: str) -> bool:
+    return ch.isalnum() or ch == "_"
+
+
+@lru_cache(maxsize=2)
+def _crisis_matcher(substring: bool) -> tuple[AhoCorasick, tuple[bool, ...]]:
+    """Compile the word or substring packs into one automaton (built once).
+
+    Returns the automaton and, per pattern index, whether the term was a
+    "*" prefix term.
+    """
+    terms = [
+        term
+        for language, pack in CRISIS_TERM_PACKS.items()
+        if (language in _SUBSTRING_LANGUAGES) is substring
+        for term in pack
+    ]
+    return (
+        AhoCorasick(term.rstrip("*") for term in terms),
+        tuple(term.endswith("*") for term in terms),
+    )
+
+
+def _word_scan(text: str) -> bool:
+    automaton, prefixes = _crisis_matcher(False)
+    for match in automaton.iter_matches(text, normalized=True):
+        if match.start > 0 and _is_word_char(text[match.start - 1]):
+            continue
+        if (
+            not prefixes[match.pattern_index]
+            and match.end < len(text)
+            and _is_word_char(text[match.end])
+        ):
+            continue
+        return True
+    return False
+
 
 def crisis_scan(text: str) -> bool:
     """
     Scan text for crisis/danger keywords.
 
+    All language packs are checked in two linear passes (words, then
+    substrings), so users writing in a language other than their session
+    language are still covered.
+
     Args:
         text: The text to scan for crisis indicators
 
@@ -28,8 +234,11 @@ def crisis_scan(text: str) -> bool:
     if not text:
         return False
 
-    lower_text = text.lower()
-    return any(term in lower_text for term in DANGER_TERMS)
+    normalized = normalize_text(text)
+    automaton, _ = _crisis_matcher(True)
+    return _word_scan(normalized) or any(
+        automaton.iter_matches(normalized, normalized=True)
+    )
 
 
 def safety_message(language: str | None = "en") -> str:
@@ -9,18 +9,24 @@ from src.utils.logging import get_logger
 
 from .composer import compose_system_prompt, retrieve_micro_knowledge
 from .crisis import crisis_scan, safety_message
-from .state import (
-    PHASE_ORDER,
-    ControlBlock,
-    Phase,
-    SessionState,
-    model_dump,
-    model_validate,
-)
+from .state import PHASE_ORDER, AnyState, ControlData, Phase
+from .state_delta import encode_state, state_snapshot
+
+_TAG_PATTERNS = {
+    tag: re.compile(rf"<{tag}>\s*(.*?)\s*</{tag}>", re.S | re.I)
+    for tag in ("ui", "control")
+}
+_CONTROL_RE = re.compile(r"<control>.*?</control>", re.S | re.I)
+_TOOL_FENCE_RE = re.compile(r"```(?:tool_code|python|json)\s*[\s\S]*?```", re.S | re.I)
+_FENCE_RE = re.compile(r"```\s*([\s\S]*?)\s*```", re.S)
+_WS_RE = re.compile(r"\s+")
+_PHASE_VALUES = frozenset(p.value for p in PHASE_ORDER)
 
 
 def _extract_between(text: str, tag: str) -> str | None:
-    patt = re.compile(rf"<{tag}>\s*(.*?)\s*</{tag}>", re.S | re.I)
+    patt = _TAG_PATTERNS.get(tag) or re.compile(
+        rf"<{tag}>\s*(.*?)\s*</{tag}>", re.S | re.I
+    )
     m = patt.search(text or "")
     return m.group(1).strip() if m else None
 
@@ -36,18 +42,17 @@ def _sanitize_text(raw: str) -> str:
         return ""
     # Lightweight metrics for observability
     raw_len = len(raw)
-    has_control = bool(re.search(r"<control>.*?</control>", raw, flags=re.S | re.I))
+    has_control = bool(_CONTROL_RE.search(raw))
     has_fences = "```" in raw
 
-    txt = re.sub(r"<control>.*?</control>", "", raw, flags=re.S | re.I)
-    # Remove known tool/code blocks entirely
-    txt = re.sub(
-        r"```(?:tool_code|python|json)\s*[\s\S]*?```", "", txt, flags=re.S | re.I
-    )
-    # For any remaining generic fenced blocks, unwrap by keeping inner text
-    txt = re.sub(r"```\s*([\s\S]*?)\s*```", r"\1", txt, flags=re.S)
+    txt = _CONTROL_RE.sub("", raw) if has_control else raw
+    if has_fences:
+        # Remove known tool/code blocks entirely
+        txt = _TOOL_FENCE_RE.sub("", txt)
+        # For any remaining generic fenced blocks, unwrap by keeping inner text
+        txt = _FENCE_RE.sub(r"\1", txt)
     # Normalize whitespace
-    txt = re.sub(r"\s+", " ", txt).strip()
+    txt = _WS_RE.sub(" ", txt).strip()
     cleaned_len = len(txt)
 
     try:
@@ -65,7 +70,7 @@ def _sanitize_text(raw: str) -> str:
     return txt
 
 
-def _extract_control_block(raw: str) -> ControlBlock | None:
+def _extract_control_block(raw: str) -> ControlData | None:
     block = _extract_between(raw, "control")
     if not block:
         return None
@@ -74,11 +79,10 @@ def _extract_control_block(raw: str) -> ControlBlock | None:
         # Accept next_phase as string; coerce unknowns to current later.
         if isinstance(data.get("next_phase"), str):
             s = data["next_phase"].lower().strip()
-            if s not in {p.value for p in PHASE_ORDER}:
+            if s not in _PHASE_VALUES:
                 # Unknown phase label; let orchestrator ignore it.
                 data["next_phase"] = None
-        result = model_validate(ControlBlock, data)
-        return result if isinstance(result, ControlBlock) else None
+        return ControlData.from_dict(data)
     except Exception:
         return None
 
@@ -169,11 +173,12 @@ def _session_closed_message(language: str = "en") -> str:
 
 
 def _emit(
-    state: SessionState,
+    state: AnyState,
     ui_text: str,
     *,
     banner: str | None = None,
     control: dict[str, Any] | None = None,
+    full_state: bool = False,
 ) -> dict[str, Any]:
     payload = {
         "phase": state.phase.value,
@@ -182,7 +187,7 @@ def _emit(
         "banner": banner,
         "ui_text": ui_text,
         "control": control or {},
-        "state": model_dump(state),
+        **encode_state(state, full=full_state),
         "end_of_session": state.phase in (Phase.CLOSED,),
     }
     # If we are in FOLLOWUP, decrement the allowance now.
@@ -192,9 +197,10 @@ def _emit(
 
 
 def handle_turn(
-    state: SessionState,
+    state: AnyState,
     user_text: str,
     adk_llm_call: Callable[..., str],
+    full_state: bool = False,
 ) -> dict[str, Any]:
     """
     Orchestrates one turn of the session.
@@ -202,13 +208,17 @@ def handle_turn(
     - builds compact system prompt and tiny micro-knowledge
     - enforces output contract <ui> + <control>{...}</control>
     - deterministic phase transitions + turn caps + banners
+    - payload carries a versioned state delta; pass full_state=True to also
+      get the complete state (e.g. after the client lost track of versions)
     """
     # 1) Crisis pre-check
     if crisis_scan(user_text):
         state.crisis_flag = True
         state.phase = Phase.SUMMARY  # pivot to a safe summary end
         ui = safety_message(state.user_language)
-        return _emit(state, ui, banner=_phase_banner(state.phase))
+        return _emit(
+            state, ui, banner=_phase_banner(state.phase), full_state=full_state
+        )
 
     # 2) Prepare prompt materials
     sys_prompt = compose_system_prompt(state)
@@ -219,7 +229,7 @@ def handle_turn(
     raw_reply = adk_llm_call(
         system=sys_prompt,
         kb=kb_snippets,
-        state=model_dump(state),
+        state=state_snapshot(state),
         user=user_text,
     )
 
@@ -276,10 +286,15 @@ def handle_turn(
             state,
             _session_closed_message(state.user_language),
             banner=_phase_banner(state.phase),
+            full_state=full_state,
         )
 
     # 7) Extract UI text and emit
     ui = _extract_ui(raw_reply)
     return _emit(
-        state, ui, banner=banner, control=(model_dump(control) if control else {})
+        state,
+        ui,
+        banner=banner,
+        control=(control.as_dict() if control else {}),
+        full_state=full_state,
     )
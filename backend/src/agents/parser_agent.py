@@ -5,10 +5,17 @@ This module implements a parser agent that analyzes user thoughts
 to identify cognitive distortions without direct user interaction.
 """
 
+import json
+import re
+from functools import lru_cache
+from typing import Any
+
 from google.adk.agents import LlmAgent
 
 from src.knowledge.cbt_context import BASE_CBT_CONTEXT, COGNITIVE_DISTORTIONS
 
+_JSON_FENCE_RE = re.compile(r"```(?:json)?\s*(.*?)\s*```", re.S)
+
 
 def analyze_thought_for_distortions(
     thought: str,
@@ -34,15 +41,14 @@ def analyze_thought_for_distortions(
     }
 
 
-def create_parser_agent(model: str = "gemini-2.0-flash") -> LlmAgent:
+@lru_cache(maxsize=1)
+def build_parser_instruction() -> str:
     """
-    Create a parser agent for analyzing thoughts and identifying distortions.
-
-    Args:
-        model: The Gemini model to use
+    Build the parser agent instruction (shared by the ADK agent and the
+    speculative pipeline, which calls the model directly).
 
     Returns:
-        An LlmAgent configured for parsing and analysis
+        The full parser instruction
     """
     # Build distortion reference for the agent
     distortion_reference = "\n\n## Cognitive Distortions Reference:\n"
@@ -91,10 +97,45 @@ def create_parser_agent(model: str = "gemini-2.0-flash") -> LlmAgent:
         + "- Never address the user directly\n"
         + "- Focus on accurate distortion identification"
     )
+    return parser_instruction
+
 
+def create_parser_agent(model: str = "gemini-2.0-flash") -> LlmAgent:
+    """
+    Create a parser agent for analyzing thoughts and identifying distortions.
+
+    Args:
+        model: The Gemini model to use
+
+    Returns:
+        An LlmAgent configured for parsing and analysis
+    """
     return LlmAgent(
         model=model,
         name="ParserAgent",
-        instruction=parser_instruction,
+        instruction=build_parser_instruction(),
         tools=[analyze_thought_for_distortions],
     )
+
+
+def parse_parser_output(raw: str) -> dict[str, Any] | None:
+    """
+    Extract the JSON analysis from a parser reply.
+
+    Args:
+        raw: Model output, possibly wrapped in a ```json fence
+
+    Returns:
+        The analysis dict, or None if the reply holds no valid analysis
+    """
+    match = _JSON_FENCE_RE.search(raw or "")
+    text = match.group(1) if match else (raw or "").strip()
+    try:
+        data = json.loads(text)
+    except (TypeError, ValueError):
+        return None
+    if not isinstance(data, dict) or not isinstance(
+        data.get("identified_distortions"), list
+    ):
+        return None
+    return data
@@ -0,0 +1,104 @@
+# SPDX-License-Identifier: MIT
+"""
+Speculative distortion analysis.
+
+While the main reply for a CLARIFY/REFRAME turn is generated, the parser
+agent analyzes the same user message on a worker thread. The result is
+collected at the start of the next turn and stored on the session state,
+so the REFRAME prompt can use precomputed distortions and the analysis
+latency is hidden behind the user's think time.
+"""
+
+import logging
+import os
+from collections.abc import Callable
+from concurrent.futures import Executor, ThreadPoolExecutor
+from typing import Any
+
+from .state import CoreState, Phase
+
+logger = logging.getLogger(__name__)
+
+SPECULATIVE_PARSER_ENABLED = os.getenv("SPECULATIVE_PARSER_ENABLED", "0") in (
+    "1",
+    "true",
+    "True",
+    "TRUE",
+)
+SPECULATIVE_PARSER_WORKERS = int(os.getenv("SPECULATIVE_PARSER_WORKERS", "4"))
+
+SPECULATIVE_PHASES = frozenset({Phase.CLARIFY, Phase.REFRAME})
+
+Analyzer = Callable[[str], dict[str, Any] | None]
+
+
+class SpeculativeParser:
+    """Runs the parser agent next to the main reply and caches its result."""
+
+    def __init__(
+        self,
+        analyze: Analyzer,
+        executor: Executor | None = None,
+        max_workers: int = SPECULATIVE_PARSER_WORKERS,
+    ):
+        """
+        Initialize the pipeline.
+
+        Args:
+            analyze: Blocking call returning the parser JSON for a thought
+            executor: Executor to run analyses on (a thread pool by default)
+            max_workers: Size of the default thread pool
+        """
+        self._analyze = analyze
+        self._owns_executor = executor is None
+        self._executor = executor or ThreadPoolExecutor(
+            max_workers=max_workers, thread_name_prefix="speculative-parser"
+        )
+
+    def _run(self, user_text: str) -> dict[str, Any] | None:
+        try:
+            return self._analyze(user_text)
+        except Exception:
+            logger.exception("Speculative distortion analysis failed")
+            return None
+
+    def launch(self, state: CoreState, user_text: str) -> bool:
+        """
+        Start analyzing the user message if the session is in a parser phase.
+
+        An analysis still pending from an earlier turn is superseded.
+
+        Returns:
+            True if an analysis was started
+        """
+        if state.phase not in SPECULATIVE_PHASES or not user_text.strip():
+            return False
+        previous = state._pending_analysis
+        if previous is not None:
+            previous.cancel()
+        state._pending_analysis = self._executor.submit(self._run, user_text)
+        return True
+
+    def harvest(self, state: CoreState) -> bool:
+        """
+        Store a finished analysis on the state without waiting for one.
+
+        Returns:
+            True if a new analysis was stored
+        """
+        pending = state._pending_analysis
+        if pending is None or not pending.done():
+            return False
+        state._pending_analysis = None
+        if pending.cancelled():
+            return False
+        result = pending.result()
+        if not result:
+            return False
+        state.distortion_analysis = result
+        return True
+
+    def shutdown(self) -> None:
+        """Stop the default thread pool (no-op for injected executors)."""
+        if self._owns_executor:
+            self._executor.shutdown(wait=False, cancel_futures=True)
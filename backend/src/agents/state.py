@@ -1,8 +1,10 @@
 # SPDX-License-Identifier: MIT
+from concurrent.futures import Future
+from dataclasses import dataclass, field
 from enum import Enum
 from typing import Any
 
-from pydantic import BaseModel, Field
+from pydantic import BaseModel, Field, PrivateAttr, ValidationError
 
 
 class Phase(str, Enum):
@@ -44,6 +46,14 @@ class SessionState(BaseModel):
     confidence_pre: int | None = None
     confidence_post: int | None = None
     crisis_flag: bool = False
+    # Parser agent output precomputed during CLARIFY/REFRAME (see speculative).
+    # Server-side only: excluded from dumps, so it is never part of the state
+    # snapshots and deltas sent to the client or the model.
+    distortion_analysis: dict[str, Any] | None = Field(default=None, exclude=True)
+
+    # Version and snapshot of the state last sent to the client; see state_delta
+    _state_version: int = PrivateAttr(default=0)
+    _sent_state: dict[str, Any] = PrivateAttr(default_factory=dict)
 
 
 class ControlBlock(BaseModel):
@@ -55,6 +65,121 @@ class ControlBlock(BaseModel):
     confidence_shift: dict[str, int] | None = None  # {"from":70,"to":45}
 
 
+def _default_progress() -> dict[str, bool]:
+    return {"situation": False, "thought": False, "emotion": False, "intensity": False}
+
+
+@dataclass(slots=True)
+class CoreState:
+    """Slotted mirror of SessionState used on the orchestrator hot path.
+
+    handle_turn accepts either representation; stores that run many turns
+    keep this one.
+    """
+
+    phase: Phase = Phase.WARMUP
+    turn: int = 0
+    max_turns: int = 14
+    followups_left: int = 3
+    user_language: str = "en"
+    progress: dict[str, bool] = field(default_factory=_default_progress)
+    suds_pre: int | None = None
+    suds_post: int | None = None
+    confidence_pre: int | None = None
+    confidence_post: int | None = None
+    crisis_flag: bool = False
+    # Server-side only, like on SessionState (not in STATE_FIELDS)
+    distortion_analysis: dict[str, Any] | None = None
+
+    # Analysis launched for the last turn but not yet collected
+    _pending_analysis: Future[dict[str, Any] | None] | None = field(
+        default=None, init=False, repr=False
+    )
+    # Same role as the SessionState private attributes; see state_delta
+    _state_version: int = field(default=0, init=False, repr=False)
+    _sent_state: dict[str, Any] = field(default_factory=dict, init=False, repr=False)
+
+
+@dataclass(slots=True)
+class ControlData:
+    """Slotted, validated form of a model's <control> block."""
+
+    next_phase: Phase
+    missing_fields: list[str] = field(default_factory=list)
+    suggest_questions: list[str] = field(default_factory=list)
+    crisis_detected: bool = False
+    confidence_shift: dict[str, int] | None = None
+
+    @classmethod
+    def from_dict(cls, data: Any) -> "ControlData | None":
+        """
+        Validate parsed control JSON with the ControlBlock rules.
+
+        Well-typed blocks are checked directly. Anything else goes through
+        ControlBlock itself, so values Pydantic coerces in lax mode (numeric
+        strings, 0/1 for booleans) are accepted exactly as before.
+
+        Returns:
+            The control data, or None when the block does not satisfy the
+            contract (unknown phase, wrong field types)
+        """
+        if not isinstance(data, dict):
+            return None
+        try:
+            next_phase = Phase(data.get("next_phase"))
+        except ValueError:
+            return None
+        missing = data.get("missing_fields", [])
+        questions = data.get("suggest_questions", [])
+        crisis = data.get("crisis_detected", False)
+        shift = data.get("confidence_shift")
+        if (
+            _is_str_list(missing)
+            and _is_str_list(questions)
+            and isinstance(crisis, bool)
+            and (shift is None or _is_int_dict(shift))
+        ):
+            return cls(next_phase, list(missing), list(questions), crisis, shift)
+        try:
+            block = model_validate(ControlBlock, data)
+        except ValidationError:
+            return None
+        return cls(
+            block.next_phase,
+            block.missing_fields,
+            block.suggest_questions,
+            block.crisis_detected,
+            block.confidence_shift,
+        )
+
+    def as_dict(self) -> dict[str, Any]:
+        """JSON-ready dict, same keys as a ControlBlock dump."""
+        return {
+            "next_phase": self.next_phase.value,
+            "missing_fields": list(self.missing_fields),
+            "suggest_questions": list(self.suggest_questions),
+            "crisis_detected": self.crisis_detected,
+            "confidence_shift": (
+                dict(self.confidence_shift) if self.confidence_shift else None
+            ),
+        }
+
+
+def _is_str_list(value: Any) -> bool:
+    return isinstance(value, list) and all(isinstance(v, str) for v in value)
+
+
+def _is_int_dict(value: Any) -> bool:
+    return isinstance(value, dict) and all(
+        isinstance(k, str) and isinstance(v, int) and not isinstance(v, bool)
+        for k, v in value.items()
+    )
+
+
+# Either state representation; the orchestrator only uses attribute access
+AnyState = SessionState | CoreState
+
+
 # --- Pydantic v1/v2 compatibility helpers ---
 def model_validate(cls, data: Any):
     """Validate data against a Pydantic model for v1/v2."""
@@ -70,3 +195,7 @@ def model_dump(instance: BaseModel) -> dict[str, Any]:
         return instance.model_dump()  # Pydantic v2
     except AttributeError:
         return instance.dict()  # Pydantic v1
+
+
+# Field names shared with the client, resolved once through the dump shim
+STATE_FIELDS: tuple[str, ...] = tuple(model_dump(SessionState()))
@@ -0,0 +1,58 @@
+# SPDX-License-Identifier: MIT
+"""
+Versioned state diffs for turn payloads.
+
+Instead of a full state dump per turn, payloads carry the fields that
+changed since the previous payload together with a version number. A
+client that missed a version (base version mismatch) asks for a full
+snapshot on its next turn.
+"""
+
+from typing import Any
+
+from .state import STATE_FIELDS, AnyState
+
+
+def state_snapshot(state: AnyState) -> dict[str, Any]:
+    """
+    JSON-ready copy of the state fields, without a Pydantic dump.
+
+    The phase enum becomes its value; progress is copied so later in-place
+    updates do not leak into the snapshot.
+    """
+    snapshot = {name: getattr(state, name) for name in STATE_FIELDS}
+    snapshot["phase"] = state.phase.value
+    snapshot["progress"] = dict(state.progress)
+    return snapshot
+
+
+def encode_state(state: AnyState, *, full: bool = False) -> dict[str, Any]:
+    """
+    Encode the state changes since the last encoded version.
+
+    Args:
+        state: Current session state
+        full: Also include the complete snapshot (always done for the first
+            version, so a client never has to diff against nothing)
+
+    Returns:
+        Payload fields: state_version, state_base_version, state_delta and,
+        for full snapshots, state
+    """
+    snapshot = state_snapshot(state)
+    sent = state._sent_state
+    delta = {k: v for k, v in snapshot.items() if sent.get(k, ...) != v}
+
+    base_version = state._state_version
+    if delta or not base_version:
+        state._state_version = base_version + 1
+        state._sent_state = snapshot
+
+    payload: dict[str, Any] = {
+        "state_version": state._state_version,
+        "state_base_version": base_version,
+        "state_delta": delta,
+    }
+    if full or not base_version:
+        payload["state"] = snapshot
+    return payload
@@ -0,0 +1,182 @@
+# SPDX-License-Identifier: MIT
+"""
+Bounded in-memory store for orchestrator session states.
+
+Sessions are spread over lock stripes by session ID, so threads working on
+different sessions rarely contend for the same lock. Each stripe keeps its
+entries in LRU order and evicts idle or least recently used sessions, which
+keeps memory flat under session churn. Sessions with a turn in progress are
+never evicted.
+"""
+
+import logging
+import os
+import time
+from collections import OrderedDict
+from collections.abc import Iterator
+from contextlib import contextmanager
+from dataclasses import dataclass, field
+from itertools import islice
+from threading import Lock
+
+from .state import CoreState
+
+logger = logging.getLogger(__name__)
+
+STATE_STORE_MAX_SESSIONS = int(os.getenv("STATE_STORE_MAX_SESSIONS", "10000"))
+STATE_STORE_IDLE_TTL_SECONDS = float(os.getenv("STATE_STORE_IDLE_TTL_SECONDS", "3600"))
+STATE_STORE_STRIPES = int(os.getenv("STATE_STORE_STRIPES", "16"))
+
+
+@dataclass(eq=False)
+class _Entry:
+    state: CoreState
+    last_access: float
+    # Serializes turns of one session without blocking the rest of the stripe
+    turn_lock: Lock = field(default_factory=Lock)
+    # Turns holding or waiting for turn_lock; pruning skips pinned entries
+    in_use: int = 0
+
+
+class _Stripe:
+    def __init__(self, capacity: int):
+        self.capacity = capacity
+        self.lock = Lock()
+        self.entries: OrderedDict[str, _Entry] = OrderedDict()
+
+
+class SessionStateStore:
+    """Thread-safe, size- and idle-bounded mapping of session ID to state."""
+
+    def __init__(
+        self,
+        max_sessions: int = STATE_STORE_MAX_SESSIONS,
+        idle_ttl_seconds: float = STATE_STORE_IDLE_TTL_SECONDS,
+        stripes: int = STATE_STORE_STRIPES,
+    ):
+        """
+        Initialize the store.
+
+        Args:
+            max_sessions: Upper bound on stored sessions (split across stripes)
+            idle_ttl_seconds: Sessions idle for longer than this are dropped
+            stripes: Number of independently locked partitions
+        """
+        stripes = max(1, min(stripes, max_sessions))
+        capacity = -(-max_sessions // stripes)  # ceil
+        self.max_sessions = max_sessions
+        self.idle_ttl_seconds = idle_ttl_seconds
+        self._stripes = [_Stripe(capacity) for _ in range(stripes)]
+        self.evictions = 0
+        self.expirations = 0
+
+    def _stripe(self, session_id: str) -> _Stripe:
+        return self._stripes[hash(session_id) % len(self._stripes)]
+
+    def _prune(self, stripe: _Stripe, now: float) -> None:
+        """Drop expired entries (oldest first) and enforce capacity.
+
+        Entries in use by a turn are skipped, so a stripe may briefly hold
+        more than its capacity. Must be called with the stripe lock held.
+        """
+        entries = stripe.entries
+        deadline = now - self.idle_ttl_seconds
+        expired = []
+        for session_id, entry in entries.items():
+            if entry.last_access > deadline:
+                break
+            if not entry.in_use:
+                expired.append(session_id)
+        for session_id in expired:
+            del entries[session_id]
+            self.expirations += 1
+
+        excess = len(entries) - stripe.capacity
+        if excess > 0:
+            idle = (sid for sid, entry in entries.items() if not entry.in_use)
+            for session_id in list(islice(idle, excess)):
+                del entries[session_id]
+                self.evictions += 1
+                logger.debug(f"Evicted session state {session_id}")
+
+    def _entry(self, session_id: str, create: bool, pin: bool = False) -> _Entry | None:
+        stripe = self._stripe(session_id)
+        now = time.monotonic()
+        with stripe.lock:
+            self._prune(stripe, now)
+            entry = stripe.entries.get(session_id)
+            if entry is not None:
+                entry.last_access = now
+                entry.in_use += int(pin)
+                stripe.entries.move_to_end(session_id)
+            elif create:
+                entry = _Entry(state=CoreState(), last_access=now, in_use=int(pin))
+                stripe.entries[session_id] = entry
+                self._prune(stripe, now)
+            return entry
+
+    def _unpin(self, session_id: str, entry: _Entry) -> None:
+        stripe = self._stripe(session_id)
+        with stripe.lock:
+            entry.in_use -= 1
+            # The turn counts as activity; a popped entry stays removed
+            entry.last_access = time.monotonic()
+            if stripe.entries.get(session_id) is entry:
+                stripe.entries.move_to_end(session_id)
+
+    def get(self, session_id: str) -> CoreState | None:
+        """Get a session state, refreshing its idle timer."""
+        entry = self._entry(session_id, create=False)
+        return entry.state if entry is not None else None
+
+    def get_or_create(self, session_id: str) -> CoreState:
+        """Get a session state, creating a fresh one if needed."""
+        entry = self._entry(session_id, create=True)
+        assert entry is not None
+        return entry.state
+
+    @contextmanager
+    def session(self, session_id: str) -> Iterator[CoreState]:
+        """
+        Hold a session's turn lock and yield its state for in-place updates.
+
+        Only turns of the same session wait for each other. The session is
+        pinned until the turn ends, so eviction cannot drop its updates or
+        hand a concurrent turn a fresh state with a different lock.
+        """
+        entry = self._entry(session_id, create=True, pin=True)
+        assert entry is not None
+        try:
+            with entry.turn_lock:
+                yield entry.state
+        finally:
+            self._unpin(session_id, entry)
+
+    def pop(self, session_id: str) -> CoreState | None:
+        """Remove a session state and return it, if present."""
+        stripe = self._stripe(session_id)
+        with stripe.lock:
+            entry = stripe.entries.pop(session_id, None)
+        return entry.state if entry is not None else None
+
+    def __delitem__(self, session_id: str) -> None:
+        if self.pop(session_id) is None:
+            raise KeyError(session_id)
+
+    def __contains__(self, session_id: object) -> bool:
+        if not isinstance(session_id, str):
+            return False
+        stripe = self._stripe(session_id)
+        with stripe.lock:
+            self._prune(stripe, time.monotonic())
+            return session_id in stripe.entries
+
+    def __len__(self) -> int:
+        return sum(len(stripe.entries) for stripe in self._stripes)
+
+    def prune(self) -> None:
+        """Drop expired sessions from every stripe."""
+        now = time.monotonic()
+        for stripe in self._stripes:
+            with stripe.lock:
+                self._prune(stripe, now)
@@ -0,0 +1,98 @@
+# SPDX-License-Identifier: MIT
+"""
+Early stop for streamed model replies.
+
+Replies must be ``<ui>...</ui>`` followed by ``<control>{...}</control>``;
+anything after the control block is discarded by the orchestrator. The
+guard watches the stream and tells the caller to stop reading as soon as a
+valid control block has closed, or when the per-phase budget is spent.
+"""
+
+import json
+import re
+
+# Output budgets per phase, in tokens. SUMMARY replies are the longest
+# (~160 words plus the control block).
+PHASE_TOKEN_CAPS: dict[str, int] = {
+    "warmup": 220,
+    "clarify": 200,
+    "reframe": 300,
+    "summary": 350,
+    "followup": 220,
+    "closed": 120,
+}
+DEFAULT_TOKEN_CAP = 350
+
+# Rough English/Gemini average, good enough for a budget check
+CHARS_PER_TOKEN = 4
+
+_CONTROL_CLOSE = "</control>"
+_CONTROL_CLOSE_RE = re.compile(re.escape(_CONTROL_CLOSE), re.I)
+_CONTROL_BLOCK_RE = re.compile(r"<control>\s*(.*?)\s*</control>", re.S | re.I)
+
+
+def phase_token_cap(phase: str | None) -> int:
+    """Token budget for a reply in the given phase."""
+    return PHASE_TOKEN_CAPS.get(str(phase or "").lower(), DEFAULT_TOKEN_CAP)
+
+
+class ControlStreamGuard:
+    """Accumulates streamed text and decides when to stop generation."""
+
+    def __init__(self, max_tokens: int = DEFAULT_TOKEN_CAP):
+        """
+        Initialize the guard.
+
+        Args:
+            max_tokens: Approximate output budget before the stream is cut
+        """
+        self.max_chars = max_tokens * CHARS_PER_TOKEN
+        self.stop_reason: str | None = None
+        self._text = ""
+        self._scan_from = 0
+
+    @property
+    def text(self) -> str:
+        """Text received so far, cut right after a completed control block."""
+        return self._text
+
+    def feed(self, chunk: str) -> bool:
+        """
+        Add a streamed chunk.
+
+        Args:
+            chunk: Newly received text
+
+        Returns:
+            True once the caller should stop reading the stream
+        """
+        if self.stop_reason is not None:
+            return True
+        self._text += chunk
+
+        # Only look at the new chunk plus enough earlier text to catch a
+        # closing tag split across chunks, so each feed costs O(len(chunk))
+        close = _CONTROL_CLOSE_RE.search(self._text, self._scan_from)
+        while close is not None:
+            end = close.end()
+            if self._valid_control(self._text[:end]):
+                self._text = self._text[:end]
+                self.stop_reason = "control_closed"
+                return True
+            close = _CONTROL_CLOSE_RE.search(self._text, end)
+        self._scan_from = max(0, len(self._text) - len(_CONTROL_CLOSE) + 1)
+
+        if len(self._text) >= self.max_chars:
+            self.stop_reason = "token_cap"
+            return True
+        return False
+
+    @staticmethod
+    def _valid_control(text: str) -> bool:
+        blocks = _CONTROL_BLOCK_RE.findall(text)
+        if not blocks:
+            return False
+        try:
+            return isinstance(json.loads(blocks[-1]), dict)
+        except ValueError:
+            return False
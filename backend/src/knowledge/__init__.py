@@ -14,6 +14,7 @@ from .cbt_context import (
     detect_distortions,
     initialize_session_with_cbt_context,
 )
+from .distortion_matcher import DistortionMatcher, get_distortion_matcher
 
 __all__ = [
     "BALANCED_THOUGHT_CRITERIA",
@@ -25,7 +26,9 @@ __all__ = [
     "EVIDENCE_GATHERING",
     "MICRO_ACTION_PRINCIPLES",
     "THERAPEUTIC_PRINCIPLES",
+    "DistortionMatcher",
     "create_agent_with_context",
     "detect_distortions",
+    "get_distortion_matcher",
     "initialize_session_with_cbt_context",
 ]
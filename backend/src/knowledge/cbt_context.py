@@ -5,7 +5,7 @@ This module contains core CBT knowledge, principles, and guidelines
 that are shared across all agents in the system.
 """
 
-from typing import TYPE_CHECKING
+from typing import TYPE_CHECKING, Any
 
 if TYPE_CHECKING:
     pass
@@ -46,7 +46,11 @@ THERAPEUTIC_PRINCIPLES = {
 }
 
 # Complete cognitive distortions taxonomy
-COGNITIVE_DISTORTIONS = {
+#
+# "indicators" drive keyword detection (see distortion_matcher): a thought
+# matches when every group has at least one term in it. Terms match whole
+# words; a trailing "*" also matches longer words ("fail*" -> "failure").
+COGNITIVE_DISTORTIONS: dict[str, dict[str, Any]] = {
     "mind_reading": {
         "code": "MW",
         "name": "Mind Reading",
@@ -61,6 +65,18 @@ COGNITIVE_DISTORTIONS = {
             "Ask one person directly about their thoughts",
             "Notice when predictions about others' thoughts were wrong",
         ],
+        "indicators": [
+            [
+                "they think",
+                "they must think",
+                "he thinks",
+                "she thinks",
+                "everyone thinks",
+                "everyone can see",
+                "they can tell",
+                "they know i'm",
+            ]
+        ],
     },
     "fortune_telling": {
         "code": "FT",
@@ -79,6 +95,10 @@ COGNITIVE_DISTORTIONS = {
             "Write down 3 alternative outcomes",
             "Track prediction accuracy for one week",
         ],
+        "indicators": [
+            ["will", "going to", "definitely", "won't", "can't"],
+            ["fail*", "disaster*", "embarrass*", "handle"],
+        ],
     },
     "catastrophizing": {
         "code": "CT",
@@ -97,6 +117,17 @@ COGNITIVE_DISTORTIONS = {
             "List past situations you successfully coped with",
             "Rate actual vs predicted severity of one worry",
         ],
+        "indicators": [
+            [
+                "ruin*",
+                "worst",
+                "catastroph*",
+                "unbearable",
+                "lose control",
+                "end of the world",
+                "completely destroy*",
+            ]
+        ],
     },
     "all_or_nothing": {
         "code": "AO",
@@ -115,6 +146,16 @@ COGNITIVE_DISTORTIONS = {
             "Rate one achievement on a 0-100 scale",
             "Find 3 partial successes in your day",
         ],
+        "indicators": [
+            [
+                "always",
+                "never",
+                "everyone",
+                "everything",
+                "none",
+                "nothing",
+            ]
+        ],
     },
     "mental_filter": {
         "code": "MF",
@@ -133,6 +174,16 @@ COGNITIVE_DISTORTIONS = {
             "Write 3 good things that happened today",
             "Ask someone else what went well",
         ],
+        "indicators": [
+            [
+                "whole day was",
+                "whole thing was",
+                "day was ruined",
+                "nothing went right",
+                "only thing i",
+                "all i can think about",
+            ]
+        ],
     },
     "personalization": {
         "code": "PR",
@@ -151,6 +202,15 @@ COGNITIVE_DISTORTIONS = {
             "Create a responsibility pie chart",
             "List factors outside your control",
         ],
+        "indicators": [
+            [
+                "my fault",
+                "because of me",
+                "blame myself",
+                "i caused",
+                "i'm responsible for",
+            ]
+        ],
     },
     "labeling": {
         "code": "LB",
@@ -166,6 +226,10 @@ COGNITIVE_DISTORTIONS = {
             "Replace one label with specific behavior description",
             "List 3 qualities that contradict the label",
         ],
+        "indicators": [
+            ["i am", "i'm"],
+            ["stupid", "loser", "failure", "worthless", "idiot", "incompetent"],
+        ],
     },
     "should_statements": {
         "code": "SH",
@@ -184,6 +248,7 @@ COGNITIVE_DISTORTIONS = {
             "Replace 'should' with 'would like to'",
             "Question one 'should' rule's origin",
         ],
+        "indicators": [["should", "must", "have to", "ought"]],
     },
     "emotional_reasoning": {
         "code": "ER",
@@ -202,6 +267,10 @@ COGNITIVE_DISTORTIONS = {
             "List facts vs feelings about one situation",
             "Notice when feelings didn't match reality",
         ],
+        "indicators": [
+            ["i feel", "i'm feeling", "feels like"],
+            ["so i must", "so i am", "so i'm", "so it must", "so there must"],
+        ],
     },
     "discounting_positives": {
         "code": "DP",
@@ -220,6 +289,17 @@ COGNITIVE_DISTORTIONS = {
             "Accept one compliment at face value",
             "Write down your role in one success",
         ],
+        "indicators": [
+            [
+                "only because",
+                "just luck",
+                "doesn't count",
+                "don't count",
+                "anyone could",
+                "to be nice",
+                "because it was easy",
+            ]
+        ],
     },
 }
 
@@ -331,37 +411,25 @@ def create_agent_with_context(name, specific_instruction, **kwargs):
 
 
 # Distortion detection helper
+# Order in which detect_distortions reports the original keyword rules
+_DETECTION_ORDER = ("AO", "FT", "SH", "LB")
+
+
 def detect_distortions(thought_text):
     """
     Analyze text for potential cognitive distortions.
     Returns list of likely distortion codes.
     """
-    thought_lower = thought_text.lower()
-    detected = []
-
-    # Simple keyword-based detection (can be enhanced with NLP)
-    # Check for absolute words
-    if any(
-        word in thought_lower
-        for word in ["always", "never", "everyone", "everything", "none", "nothing"]
-    ):
-        detected.append("AO")
+    # Imported here: the matcher is compiled from COGNITIVE_DISTORTIONS above
+    from .distortion_matcher import get_distortion_matcher
 
-    # Fortune telling - look for future predictions with negative outcomes
-    future_words = ["will", "going to", "definitely", "won't", "can't"]
-    negative_outcomes = ["fail", "disaster", "embarrass", "handle"]
-    if any(word in thought_lower for word in future_words) and any(
-        neg in thought_lower for neg in negative_outcomes
-    ):
-        detected.append("FT")
-
-    if any(word in thought_lower for word in ["should", "must", "have to", "ought"]):
-        detected.append("SH")
-
-    # Labeling - check for "I am/I'm" followed by negative labels
-    if "i am" in thought_lower or "i'm" in thought_lower:
-        labels = ["stupid", "loser", "failure", "worthless", "idiot", "incompetent"]
-        if any(label in thought_lower for label in labels):
-            detected.append("LB")
-
-    return detected
+    detected = get_distortion_matcher().detect(thought_text)
+    # The original keyword rules keep their order; other codes follow
+    return sorted(
+        detected,
+        key=lambda code: (
+            _DETECTION_ORDER.index(code)
+            if code in _DETECTION_ORDER
+            else len(_DETECTION_ORDER)
+        ),
+    )
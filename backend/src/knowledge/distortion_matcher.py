@@ -0,0 +1,127 @@
+"""
+Compiled cognitive distortion matcher
+
+Keyword rules are generated from the "indicators" of each
+COGNITIVE_DISTORTIONS entry and compiled into a single Aho-Corasick
+automaton, so a thought (or a whole batch of thoughts) is scanned once
+regardless of how many distortions and terms are configured.
+"""
+
+from collections.abc import Iterable, Mapping, Sequence
+from functools import lru_cache
+from typing import Any
+
+from src.utils.aho_corasick import AhoCorasick, normalize_text
+
+from .cbt_context import COGNITIVE_DISTORTIONS
+
+# Joins batched thoughts; no indicator term contains it, so no match can
+# span two thoughts
+_BATCH_SEPARATOR = "\n"
+
+
+def _is_word_char(ch: str) -> bool:
+    return ch.isalnum() or ch == "_"
+
+
+class DistortionMatcher:
+    """Scores thoughts against data-driven distortion indicator rules."""
+
+    def __init__(self, distortions: Mapping[str, Mapping[str, Any]]):
+        """
+        Compile the indicator rules.
+
+        Args:
+            distortions: Taxonomy shaped like COGNITIVE_DISTORTIONS; entries
+                without "indicators" are skipped
+        """
+        self.codes: list[str] = []
+        self._group_counts: list[int] = []
+        # Per automaton pattern: (code position, group position, prefix term)
+        self._targets: list[tuple[int, int, bool]] = []
+        terms: list[str] = []
+
+        for distortion in distortions.values():
+            groups: Sequence[Sequence[str]] = distortion.get("indicators") or []
+            if not groups:
+                continue
+            code_pos = len(self.codes)
+            self.codes.append(distortion["code"])
+            self._group_counts.append(len(groups))
+            for group_pos, group in enumerate(groups):
+                for term in group:
+                    stem = term.rstrip("*").strip()
+                    if stem:
+                        terms.append(stem)
+                        self._targets.append((code_pos, group_pos, stem != term))
+
+        self._automaton = AhoCorasick(terms)
+
+    def _to_scores(self, hits: list[list[int]]) -> dict[str, int]:
+        return {
+            code: sum(groups)
+            for code, groups in zip(self.codes, hits, strict=True)
+            if all(groups)
+        }
+
+    def score(self, thought: str) -> dict[str, int]:
+        """
+        Score a single thought.
+
+        Args:
+            thought: The thought text
+
+        Returns:
+            Mapping of detected distortion codes to their indicator hit count
+        """
+        return self.score_batch([thought])[0]
+
+    def score_batch(self, thoughts: Iterable[str]) -> list[dict[str, int]]:
+        """
+        Score many thoughts in a single automaton pass.
+
+        Args:
+            thoughts: Thought texts
+
+        Returns:
+            One score mapping per thought, in input order
+        """
+        normalized = [
+            normalize_text(thought).replace(_BATCH_SEPARATOR, " ")
+            for thought in thoughts
+        ]
+        if not normalized:
+            return []
+
+        text = _BATCH_SEPARATOR.join(normalized)
+        hits = [[[0] * n for n in self._group_counts] for _ in normalized]
+        thought_pos = 0
+        thought_end = len(normalized[0])
+        for match in self._automaton.iter_matches(text, normalized=True):
+            # Matches arrive in end-offset order, so the owning thought only
+            # ever moves forward
+            while match.end > thought_end:
+                thought_pos += 1
+                thought_end += len(normalized[thought_pos]) + 1
+            code_pos, group_pos, prefix = self._targets[match.pattern_index]
+            if match.start > 0 and _is_word_char(text[match.start - 1]):
+                continue
+            if not prefix and match.end < len(text) and _is_word_char(text[match.end]):
+                continue
+            hits[thought_pos][code_pos][group_pos] += 1
+
+        return [self._to_scores(thought_hits) for thought_hits in hits]
+
+    def detect(self, thought: str) -> list[str]:
+        """Return the distortion codes detected in a thought."""
+        return list(self.score(thought))
+
+    def detect_batch(self, thoughts: Iterable[str]) -> list[list[str]]:
+        """Return the detected distortion codes for each thought."""
+        return [list(scores) for scores in self.score_batch(thoughts)]
+
+
+@lru_cache(maxsize=1)
+def get_distortion_matcher() -> DistortionMatcher:
+    """Get the matcher compiled from COGNITIVE_DISTORTIONS (built once)."""
+    return DistortionMatcher(COGNITIVE_DISTORTIONS)
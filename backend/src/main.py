@@ -18,9 +18,13 @@ from fastapi.responses import FileResponse
 from fastapi.staticfiles import StaticFiles
 
 from src.routes.feedback import router as feedback_router
+from src.text.acknowledgements import prerender_ack_frames
 from src.text.router import router as text_router
+from src.utils.admission import get_admission_controller
+from src.utils.audio_executor import shutdown_audio_executor
 from src.utils.feature_flags.service import create_feature_flag_service
 from src.utils.logging import get_logger, setup_logging
+from src.utils.loop_lag import get_loop_lag_monitor
 from src.utils.metrics_router import router as metrics_router
 from src.utils.performance_monitor import get_performance_monitor
 from src.utils.session_manager import session_manager
@@ -52,17 +56,34 @@ async def lifespan(app: FastAPI):
     await voice_session_manager.start()
     logger.info("voice_session_manager_started")
 
+    # Admission control counts the sessions of both modalities
+    admission_controller = get_admission_controller()
+    admission_controller.add_session_counter(
+        "text", session_manager.get_live_session_count
+    )
+    admission_controller.add_session_counter(
+        "voice", voice_session_manager.get_active_session_count
+    )
+
     # Initialize feature flags service
     logger.info("initializing_feature_flags_service")
     app.state.feature_flags_service = create_feature_flag_service()
     logger.info("feature_flags_service_initialized")
 
+    # Serialize first-turn acknowledgements once
+    prerender_ack_frames()
+    logger.info("ack_frames_prerendered")
+
     # Start performance monitoring task
     performance_monitor = get_performance_monitor()
     monitor_task = asyncio.create_task(performance_monitor.log_periodic_summary())
     app.state.monitor_task = monitor_task
     logger.info("performance_monitoring_started")
 
+    # Measure event loop responsiveness
+    get_loop_lag_monitor().start()
+    logger.info("loop_lag_monitor_started")
+
     try:
         yield
     finally:
@@ -81,12 +102,17 @@ async def lifespan(app: FastAPI):
         except asyncio.CancelledError:
             logger.info("performance_monitor_cancelled")
 
+    await get_loop_lag_monitor().stop()
+
     logger.info("stopping_session_manager")
     await session_manager.stop()
 
     logger.info("stopping_voice_session_manager")
     await voice_session_manager.stop()
 
+    logger.info("stopping_audio_executor")
+    shutdown_audio_executor()
+
     logger.info("application_shutdown")
 
 
@@ -37,12 +37,18 @@ class MessageRequest(BaseModel):
 
     mime_type: str = Field(..., description="MIME type of the message data")
     data: str = Field(..., description="Base64 encoded message data")
+    idempotency_key: str | None = Field(
+        None,
+        max_length=128,
+        description="Client-generated key; retries with the same key are deduplicated",
+    )
 
     model_config = ConfigDict(
         json_schema_extra={
             "example": {
                 "mime_type": "text/plain",
                 "data": "SGVsbG8gd29ybGQ=",  # "Hello world" in base64
+                "idempotency_key": "6f1c2a9e-msg-1",
             }
         }
     )
@@ -0,0 +1,74 @@
+"""Pre-rendered first-turn acknowledgement frames.
+
+The first user message of a session waits for a full model round-trip
+before anything is shown. To cut perceived latency, a short localized
+acknowledgement is sent as soon as that message arrives. Frames are
+serialized once at startup, so emitting one costs a queue put.
+"""
+
+import json
+from dataclasses import dataclass
+
+from src.utils.language_utils import (
+    SUPPORTED_LANGUAGES,
+    get_default_language,
+    normalize_language_code,
+)
+
+# Kept neutral: the model reply that follows may greet, ask or reflect
+ACK_TEMPLATES: dict[str, str] = {
+    "en-US": "Thanks for sharing that with me. Let me take a moment to think it through.",
+    "es-ES": "Gracias por compartirlo conmigo. Dame un momento para pensarlo.",
+    "pt-BR": "Obrigado por compartilhar isso comigo. Me dê um momento para pensar.",
+    "de-DE": "Danke, dass du das mit mir teilst. Ich denke kurz darüber nach.",
+    "fr-FR": "Merci de me confier cela. Laisse-moi un instant pour y réfléchir.",
+    "it-IT": "Grazie per averlo condiviso con me. Dammi un momento per pensarci.",
+    "nl-NL": "Bedankt dat je dit met me deelt. Ik denk er even over na.",
+    "pl-PL": "Dziękuję, że się tym ze mną dzielisz. Daj mi chwilę do namysłu.",
+    "hi-IN": "यह साझा करने के लिए धन्यवाद। मुझे इस पर सोचने के लिए एक पल दीजिए।",
+    "ja-JP": "話してくれてありがとうございます。少し考えさせてください。",
+    "ko-KR": "이야기해 주셔서 감사합니다. 잠시 생각해 볼게요.",
+    "zh-CN": "谢谢你和我分享这些。让我想一想。",
+    "zh-TW": "謝謝你和我分享這些。讓我想一想。",
+}
+
+
+@dataclass(frozen=True)
+class PrerenderedFrame:
+    """An SSE frame queued for delivery as-is (no per-event serialization)."""
+
+    data: str
+
+
+_frames: dict[str, PrerenderedFrame] = {}
+
+
+def _render(text: str) -> PrerenderedFrame:
+    message = {
+        "type": "content",
+        "content_type": "text/plain",
+        "mime_type": "text/plain",
+        # Separates the acknowledgement from the reply that follows
+        "data": f"{text}\n\n",
+        "ack": True,
+    }
+    return PrerenderedFrame(f"data: {json.dumps(message, ensure_ascii=False)}\n\n")
+
+
+def prerender_ack_frames() -> dict[str, PrerenderedFrame]:
+    """Render the acknowledgement frame of every supported language.
+
+    Called at startup; safe to call again.
+    """
+    default = ACK_TEMPLATES[get_default_language()]
+    for code in SUPPORTED_LANGUAGES:
+        _frames[code] = _render(ACK_TEMPLATES.get(code, default))
+    return _frames
+
+
+def get_ack_frame(language_code: str | None) -> PrerenderedFrame:
+    """Get the acknowledgement frame for a language (default if unsupported)."""
+    if not _frames:
+        prerender_ack_frames()
+    code = normalize_language_code(language_code or get_default_language())
+    return _frames.get(code) or _frames[get_default_language()]
@@ -3,10 +3,11 @@
 import asyncio
 import json
 import os
+from contextlib import aclosing, nullcontext
 from datetime import UTC, datetime
 from typing import Any
 
-from fastapi import APIRouter, HTTPException, Query, Request, Response
+from fastapi import APIRouter, Header, HTTPException, Query, Request, Response
 from fastapi.responses import StreamingResponse
 from google.adk.agents.run_config import RunConfig
 from google.adk.runners import InMemoryRunner
@@ -22,6 +23,15 @@ from src.models.api import (
     SessionInfo,
     SessionListResponse,
 )
+from src.text.acknowledgements import PrerenderedFrame, get_ack_frame
+from src.text.turn_queue import TurnQueue
+from src.utils.admission import get_admission_controller, require_admission
+from src.utils.cancellation import (
+    CancellationToken,
+    TurnCancelledError,
+    turn_registry,
+)
+from src.utils.idempotency import IdempotencyCache
 from src.utils.language_utils import (
     get_default_language,
     normalize_language_code,
@@ -41,6 +51,10 @@ language_limiter = RateLimiter(max_requests=100, window_seconds=60)
 
 APP_NAME = "CBT Reframing Assistant"
 
+# Recent idempotency keys remembered per session for /send deduplication
+IDEMPOTENCY_TTL_SECONDS = int(os.getenv("IDEMPOTENCY_TTL_SECONDS", "300"))
+IDEMPOTENCY_MAX_KEYS = int(os.getenv("IDEMPOTENCY_MAX_KEYS", "128"))
+
 
 # Language detection function removed - using URL parameter only
 
@@ -87,18 +101,32 @@ async def start_agent_session(user_id, language_code="en-US"):
     return runner, session, run_config
 
 
-async def process_message(runner, session, message_content, run_config):
+async def process_message(
+    runner,
+    session,
+    message_content,
+    run_config,
+    cancel_token: CancellationToken | None = None,
+):
     """Process a single message using run_async"""
     logger.info("processing_message", session=str(session))
     # Use run_async for request-response pattern
     events = []
-    async for event in runner.run_async(
-        user_id=session.user_id,
-        session_id=session.id,
-        new_message=message_content,
-        run_config=run_config,
-    ):
-        events.append(event)
+    # aclosing() makes sure the upstream generation is torn down as soon as the
+    # turn is cancelled instead of when the generator is garbage collected
+    with get_admission_controller().track_model_call():
+        async with aclosing(
+            runner.run_async(
+                user_id=session.user_id,
+                session_id=session.id,
+                new_message=message_content,
+                run_config=run_config,
+            )
+        ) as event_stream:
+            async for event in event_stream:
+                if cancel_token is not None:
+                    cancel_token.raise_if_cancelled()
+                events.append(event)
     logger.info("message_processed", session=str(session), event_count=len(events))
     return events
 
@@ -146,9 +174,11 @@ async def sse_endpoint(
 
     # Check if session already exists (reconnection)
     existing_session = session_manager.get_session_readonly(session_id)
+    idempotency_cache = None
     if existing_session:
         # Reconnecting to existing session
         greeting_sent = existing_session.metadata.get("greeting_sent", False)
+        idempotency_cache = existing_session.metadata.get("idempotency_cache")
         logger.info(
             "reconnecting_to_existing_session",
             session_id=session_id,
@@ -158,26 +188,32 @@ async def sse_endpoint(
     else:
         greeting_sent = False
 
-    # Start agent session for GET requests
-    # Use session_id as user_id for ADK
-    runner, adk_session, run_config = await start_agent_session(
-        session_id, normalized_language
-    )
+    # New conversations wait for capacity or are refused with 503, and hold
+    # their slot until the session is stored; reconnections are always let in
+    admission = nullcontext() if existing_session else require_admission("text")
+    async with admission:
+        # Start agent session for GET requests
+        # Use session_id as user_id for ADK
+        runner, adk_session, run_config = await start_agent_session(
+            session_id, normalized_language
+        )
 
-    # Store the session with session manager
-    session_info = session_manager.create_session(
-        session_id=session_id,
-        user_id=session_id,  # Using session_id as user_id for POC
-        request_queue=None,  # No longer using LiveRequestQueue
-    )
+        # Store the session with session manager
+        session_info = session_manager.create_session(
+            session_id=session_id,
+            user_id=session_id,  # Using session_id as user_id for POC
+            request_queue=None,  # No longer using LiveRequestQueue
+        )
     session_info.metadata["language"] = normalized_language
     session_info.metadata["runner"] = runner
     session_info.metadata["adk_session"] = adk_session
     session_info.metadata["run_config"] = run_config
     session_info.metadata["message_queue"] = asyncio.Queue()
 
-    # Preserve greeting state on reconnection
+    # Preserve greeting state and recent message keys on reconnection
     session_info.metadata["greeting_sent"] = greeting_sent
+    if idempotency_cache is not None:
+        session_info.metadata["idempotency_cache"] = idempotency_cache
 
     log_session_event(logger, session_id, "connected", language=normalized_language)
 
@@ -219,6 +255,8 @@ async def sse_endpoint(
         heartbeat_task = asyncio.create_task(send_heartbeats())
 
         try:
+            # Counted as live by admission control until the finally below
+            session_info.stream_open = True
 
             async def get_next_event():
                 try:
@@ -311,6 +349,11 @@ async def sse_endpoint(
                                 has_turn_complete=hasattr(event, "turn_complete"),
                             )
 
+                            # Pre-serialized frames go out as-is
+                            if isinstance(event, PrerenderedFrame):
+                                yield event.data
+                                continue
+
                             # Handle string messages
                             if isinstance(event, str):
                                 if event == "STREAM_END":
@@ -403,6 +446,14 @@ async def sse_endpoint(
                 await heartbeat_task
             except asyncio.CancelledError:
                 pass
+            # Nobody is reading this stream anymore: abort in-flight generation
+            if session_info.metadata.get("sse_shutdown", False):
+                cancel_reason = "sse_shutdown"
+            else:
+                cancel_reason = "client_disconnected"
+            turn_registry.cancel_session(session_id, cancel_reason, owner=session_info)
+            session_info.stream_open = False
+            session_info.update_activity()
             logger.info("sse_stream_ended", session_id=session_id)
 
     return StreamingResponse(
@@ -417,6 +468,118 @@ async def sse_endpoint(
     )
 
 
+async def _run_turn(session_id: str, session, text: str) -> MessageResponse:
+    """Run one model turn for a session and queue its events for SSE delivery."""
+    performance_monitor = get_performance_monitor()
+    runner = session.metadata.get("runner")
+    adk_session = session.metadata.get("adk_session")
+    run_config = session.metadata.get("run_config")
+    message_queue = session.metadata.get("message_queue")
+
+    # Check if this is the first user message (reactive greeting)
+    greeting_sent = session.metadata.get("greeting_sent", False)
+    if not greeting_sent:
+        # Mark greeting as sent - the agent will send greeting on first message
+        session.metadata["greeting_sent"] = True
+        logger.info(
+            "first_user_message_received",
+            session_id=session_id,
+            language=session.metadata.get("language"),
+        )
+        # Acknowledge right away; the model reply follows in the same turn
+        if message_queue:
+            await message_queue.put(get_ack_frame(session.metadata.get("language")))
+
+    content = Content(role="user", parts=[Part.from_text(text=text)])
+
+    log_agent_event(
+        logger,
+        "message_received",
+        session_id=session_id,
+        mime_type="text/plain",
+        text=text,
+    )
+
+    # Process message and get events. The turn is bound to a cancellation
+    # token so a disconnect or session expiry aborts the model call.
+    cancel_token = turn_registry.open(session_id, owner=session)
+    try:
+        events = await cancel_token.run(
+            process_message(
+                runner, adk_session, content, run_config, cancel_token=cancel_token
+            )
+        )
+
+        # Queue events for SSE delivery
+        event_count = 0
+        for event in events:
+            if message_queue:
+                await message_queue.put(event)
+            event_count += 1
+
+        # Send a final turn_complete event after all content
+        # Create a simple object with the required attributes
+        class TurnCompleteEvent:
+            turn_complete = True
+            interrupted = False
+
+        turn_complete_event = TurnCompleteEvent()
+        logger.info(
+            "creating_turn_complete_event",
+            session_id=session_id,
+            has_queue=message_queue is not None,
+        )
+        if message_queue:
+            await message_queue.put(turn_complete_event)
+            logger.info("turn_complete_queued", session_id=session_id)
+
+        log_agent_event(
+            logger,
+            "message_processed",
+            session_id=session_id,
+            event_count=event_count,
+        )
+    except TurnCancelledError as e:
+        performance_monitor.record_turn_cancelled(session_id, e.reason)
+        return MessageResponse(status="cancelled", error=e.reason)
+    except Exception as e:
+        logger.error("message_processing_error", session_id=session_id, error=str(e))
+        raise HTTPException(
+            status_code=500, detail=f"Error processing message: {e!s}"
+        ) from e
+    finally:
+        turn_registry.close(cancel_token)
+
+    return MessageResponse(status="sent", error=None)
+
+
+def _get_idempotency_cache(session) -> IdempotencyCache[MessageResponse]:
+    """Get (or lazily create) the per-session cache of recent message keys."""
+    cache: IdempotencyCache[MessageResponse] | None = session.metadata.get(
+        "idempotency_cache"
+    )
+    if cache is None:
+        cache = IdempotencyCache(
+            max_entries=IDEMPOTENCY_MAX_KEYS,
+            ttl_seconds=IDEMPOTENCY_TTL_SECONDS,
+            # A cancelled turn never reached the model; let a retry run it
+            retain=lambda response: response.status != "cancelled",
+        )
+        session.metadata["idempotency_cache"] = cache
+    return cache
+
+
+def _get_turn_queue(session_id: str, session) -> TurnQueue[MessageResponse]:
+    """Get (or lazily create) the queue that serializes a session's turns."""
+    queue: TurnQueue[MessageResponse] | None = session.metadata.get("turn_queue")
+    if queue is None:
+        queue = TurnQueue(
+            lambda text: _run_turn(session_id, session, text), session_id=session_id
+        )
+        session.metadata["turn_queue"] = queue
+    return queue
+
+
 @router.post(
     "/send/{session_id}",
     response_model=MessageResponse,
@@ -424,9 +587,15 @@ async def sse_endpoint(
     operation_id="sendMessage",
 )
 async def send_message_endpoint(
-    session_id: str, message: MessageRequest
+    session_id: str,
+    message: MessageRequest,
+    idempotency_key: str | None = Header(default=None),
 ) -> MessageResponse:
-    """HTTP endpoint for text message communication only."""
+    """HTTP endpoint for text message communication only.
+
+    Clients may send an ``Idempotency-Key`` header (or ``idempotency_key`` in
+    the body) so that network retries do not trigger a second model turn.
+    """
     performance_monitor = get_performance_monitor()
     async with performance_monitor.track_request("text"):
         # Get the session from session manager
@@ -435,12 +604,10 @@ async def send_message_endpoint(
             raise HTTPException(status_code=404, detail="Session not found")
 
         # Get session components
-        runner = session.metadata.get("runner")
-        adk_session = session.metadata.get("adk_session")
-        run_config = session.metadata.get("run_config")
-        message_queue = session.metadata.get("message_queue")
-
-        if not all([runner, adk_session, run_config, message_queue]):
+        if not all(
+            session.metadata.get(name)
+            for name in ("runner", "adk_session", "run_config", "message_queue")
+        ):
             raise HTTPException(
                 status_code=500, detail="Session not properly initialized"
             )
@@ -457,69 +624,17 @@ async def send_message_endpoint(
             logger.info("empty_message_received", session_id=session_id)
             return MessageResponse(status="sent", error=None)
 
-        # Check if this is the first user message (reactive greeting)
-        greeting_sent = session.metadata.get("greeting_sent", False)
-        if not greeting_sent:
-            # Mark greeting as sent - the agent will send greeting on first message
-            session.metadata["greeting_sent"] = True
-            logger.info(
-                "first_user_message_received",
-                session_id=session_id,
-                language=session.metadata.get("language"),
-            )
-
-        content = Content(role="user", parts=[Part.from_text(text=message.data)])
-
-        log_agent_event(
-            logger,
-            "message_received",
-            session_id=session_id,
-            mime_type=message.mime_type,
-            text=message.data,
-        )
-
-        # Process message and get events
-        try:
-            events = await process_message(runner, adk_session, content, run_config)
-
-            # Queue events for SSE delivery
-            event_count = 0
-            for event in events:
-                if message_queue:
-                    await message_queue.put(event)
-                event_count += 1
-
-            # Send a final turn_complete event after all content
-            # Create a simple object with the required attributes
-            class TurnCompleteEvent:
-                turn_complete = True
-                interrupted = False
-
-            turn_complete_event = TurnCompleteEvent()
-            logger.info(
-                "creating_turn_complete_event",
-                session_id=session_id,
-                has_queue=message_queue is not None,
-            )
-            if message_queue:
-                await message_queue.put(turn_complete_event)
-                logger.info("turn_complete_queued", session_id=session_id)
+        # Turns run one at a time per session; messages sent while a turn is
+        # running are merged into the next one
+        turn_queue = _get_turn_queue(session_id, session)
 
-            log_agent_event(
-                logger,
-                "message_processed",
-                session_id=session_id,
-                event_count=event_count,
-            )
-        except Exception as e:
-            logger.error(
-                "message_processing_error", session_id=session_id, error=str(e)
-            )
-            raise HTTPException(
-                status_code=500, detail=f"Error processing message: {e!s}"
-            ) from e
+        # Retries carrying the same idempotency key reuse the original turn
+        key = idempotency_key or message.idempotency_key
+        if key:
+            cache = _get_idempotency_cache(session)
+            return await cache.run(key, lambda: turn_queue.submit(message.data))
 
-        return MessageResponse(status="sent", error=None)
+        return await turn_queue.submit(message.data)
 
 
 @router.get(
@@ -656,8 +771,9 @@ async def close_sse_connection(session_id: str):
     if not session:
         raise HTTPException(status_code=404, detail="Session not found")
 
-    # Set shutdown flag
+    # Set shutdown flag and abort any generation still in progress
     session.metadata["sse_shutdown"] = True
+    turn_registry.cancel_session(session_id, "sse_shutdown")
 
     # Also put STREAM_END in the queue if it exists
     message_queue = session.metadata.get("message_queue")
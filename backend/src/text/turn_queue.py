@@ -0,0 +1,103 @@
+"""Per-session turn serialization with message coalescing."""
+
+import asyncio
+from collections.abc import Awaitable, Callable
+
+from src.utils.logging import get_logger
+
+logger = get_logger(__name__)
+
+
+def _mark_retrieved(future: asyncio.Future) -> None:
+    """Avoid 'exception was never retrieved' warnings for abandoned batches."""
+    if not future.cancelled():
+        future.exception()
+
+
+class TurnQueue[T]:
+    """Runs at most one turn at a time for a session.
+
+    Messages submitted while a turn is running are not started right away:
+    they are merged into a single next turn, so rapid typing costs one model
+    call instead of one per message. Every message of a merged batch receives
+    the result of the turn that handled it.
+    """
+
+    def __init__(
+        self,
+        run_turn: Callable[[str], Awaitable[T]],
+        session_id: str = "",
+        separator: str = "\n",
+    ):
+        """
+        Initialize the queue.
+
+        Args:
+            run_turn: Coroutine function running one model turn for a text
+            session_id: Session the queue belongs to (for logging)
+            separator: String used to join coalesced messages
+        """
+        self._run_turn = run_turn
+        self.session_id = session_id
+        self.separator = separator
+        self._pending: list[str] = []
+        self._pending_result: asyncio.Future[T] | None = None
+        self._worker: asyncio.Task[None] | None = None
+
+    @property
+    def busy(self) -> bool:
+        """Whether a turn is currently running."""
+        return self._worker is not None and not self._worker.done()
+
+    @property
+    def pending_count(self) -> int:
+        """Number of messages waiting for the next turn."""
+        return len(self._pending)
+
+    async def submit(self, text: str) -> T:
+        """Queue a message and wait for the turn that handles it.
+
+        Args:
+            text: The user message
+
+        Returns:
+            The result of the (possibly merged) turn that included the message
+        """
+        if self._pending_result is None:
+            self._pending_result = asyncio.get_running_loop().create_future()
+            self._pending_result.add_done_callback(_mark_retrieved)
+        self._pending.append(text)
+        result = self._pending_result
+
+        if not self.busy:
+            self._worker = asyncio.create_task(self._drain())
+
+        # Shield so one caller giving up does not cancel a batch shared with others
+        return await asyncio.shield(result)
+
+    async def _drain(self) -> None:
+        """Run queued batches one after another until the queue is empty."""
+        while self._pending:
+            texts, result = self._pending, self._pending_result
+            self._pending, self._pending_result = [], None
+            assert result is not None
+
+            if len(texts) > 1:
+                logger.info(
+                    "turn_messages_coalesced",
+                    session_id=self.session_id,
+                    message_count=len(texts),
+                )
+
+            try:
+                value = await self._run_turn(self.separator.join(texts))
+            except asyncio.CancelledError:
+                result.cancel()
+                if self._pending_result is not None:
+                    self._pending_result.cancel()
+                self._pending, self._pending_result = [], None
+                raise
+            except Exception as e:
+                result.set_exception(e)
+            else:
+                result.set_result(value)
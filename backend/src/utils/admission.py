@@ -0,0 +1,235 @@
+"""Admission control for new conversations.
+
+A new text (SSE) or voice session is admitted only while the process has
+headroom, judged from live signals:
+
+* active sessions (text and voice)
+* in-flight model calls
+* event loop lag (median of the last second of samples)
+* resident memory
+
+When any signal is over its limit, the request waits up to
+``ADMISSION_QUEUE_TIMEOUT_MS`` for capacity, then is refused with 503 and a
+``Retry-After`` header. Reconnections to existing sessions are not checked,
+so conversations in progress keep their latency under overload. A limit
+of 0 disables that signal.
+
+An admitted session holds a reserved slot until it has been created and
+shows up in its session counter, so a burst of requests cannot all pass
+the check before any of them is counted.
+"""
+
+import asyncio
+import os
+import time
+from collections.abc import AsyncIterator, Callable, Iterator
+from contextlib import asynccontextmanager, contextmanager
+from pathlib import Path
+from typing import Any, NoReturn
+
+from fastapi import HTTPException
+
+from src.utils.logging import get_logger
+from src.utils.loop_lag import get_loop_lag_monitor
+
+logger = get_logger(__name__)
+
+ADMISSION_MAX_SESSIONS = int(os.getenv("ADMISSION_MAX_SESSIONS", "200"))
+ADMISSION_MAX_MODEL_CALLS = int(os.getenv("ADMISSION_MAX_MODEL_CALLS", "50"))
+ADMISSION_MAX_LOOP_LAG_MS = int(os.getenv("ADMISSION_MAX_LOOP_LAG_MS", "250"))
+ADMISSION_MAX_RSS_MB = int(os.getenv("ADMISSION_MAX_RSS_MB", "0"))
+# How long a new session may wait for capacity, and how many may wait
+ADMISSION_QUEUE_TIMEOUT_MS = int(os.getenv("ADMISSION_QUEUE_TIMEOUT_MS", "2000"))
+ADMISSION_MAX_WAITING = int(os.getenv("ADMISSION_MAX_WAITING", "20"))
+ADMISSION_RETRY_AFTER_SECONDS = int(os.getenv("ADMISSION_RETRY_AFTER_SECONDS", "5"))
+
+# How often waiting requests re-check the signals
+_POLL_INTERVAL = 0.05
+# Loop lag samples considered (one second at the default interval)
+_LAG_SAMPLES = 20
+
+
+def _rss_mb() -> float | None:
+    """Resident memory of this process in MB, or None if unavailable."""
+    try:
+        pages = int(Path("/proc/self/statm").read_text().split()[1])
+    except (OSError, IndexError, ValueError):
+        return None
+    return pages * os.sysconf("SC_PAGE_SIZE") / (1024 * 1024)
+
+
+class AdmissionRejectedError(Exception):
+    """A new session was refused because the server is overloaded."""
+
+    def __init__(self, reason: str, retry_after: int):
+        super().__init__(f"Server overloaded ({reason})")
+        self.reason = reason
+        self.retry_after = retry_after
+
+
+class AdmissionController:
+    """Decides whether a new session may start now."""
+
+    def __init__(
+        self,
+        max_sessions: int = ADMISSION_MAX_SESSIONS,
+        max_model_calls: int = ADMISSION_MAX_MODEL_CALLS,
+        max_loop_lag_ms: int = ADMISSION_MAX_LOOP_LAG_MS,
+        max_rss_mb: int = ADMISSION_MAX_RSS_MB,
+        queue_timeout_ms: int = ADMISSION_QUEUE_TIMEOUT_MS,
+        max_waiting: int = ADMISSION_MAX_WAITING,
+        retry_after: int = ADMISSION_RETRY_AFTER_SECONDS,
+    ):
+        """
+        Initialize the controller.
+
+        Args:
+            max_sessions: Active text and voice sessions allowed
+            max_model_calls: Model calls allowed in flight
+            max_loop_lag_ms: Recent event loop lag allowed
+            max_rss_mb: Resident memory allowed
+            queue_timeout_ms: Longest wait for capacity before refusing
+            max_waiting: Requests allowed to wait at once
+            retry_after: Seconds suggested to refused clients
+        """
+        self.max_sessions = max_sessions
+        self.max_model_calls = max_model_calls
+        self.max_loop_lag_ms = max_loop_lag_ms
+        self.max_rss_mb = max_rss_mb
+        self.queue_timeout = queue_timeout_ms / 1000
+        self.max_waiting = max_waiting
+        self.retry_after = retry_after
+
+        self._session_counters: dict[str, Callable[[], int]] = {}
+        self.model_calls = 0
+        # Admitted sessions not yet visible to their session counter
+        self.reserved = 0
+        self.waiting = 0
+        self.admitted = 0
+        self.queued = 0
+        self.rejected: dict[str, int] = {}
+
+    def add_session_counter(self, name: str, counter: Callable[[], int]) -> None:
+        """Register a source of active sessions (e.g. text or voice)."""
+        self._session_counters[name] = counter
+
+    def active_sessions(self) -> int:
+        """Active sessions over all registered sources."""
+        return sum(counter() for counter in self._session_counters.values())
+
+    @contextmanager
+    def track_model_call(self) -> Iterator[None]:
+        """Count a model call as in flight while the block runs."""
+        self.model_calls += 1
+        try:
+            yield
+        finally:
+            self.model_calls -= 1
+
+    def overload_reason(self) -> str | None:
+        """The first signal over its limit, or None if there is headroom."""
+        sessions = self.active_sessions() + self.reserved
+        if self.max_sessions and sessions >= self.max_sessions:
+            return "sessions"
+        if self.max_model_calls and self.model_calls >= self.max_model_calls:
+            return "model_calls"
+        if self.max_loop_lag_ms:
+            lag = get_loop_lag_monitor().recent_lag(_LAG_SAMPLES)
+            if lag * 1000 > self.max_loop_lag_ms:
+                return "loop_lag"
+        if self.max_rss_mb:
+            rss = _rss_mb()
+            if rss is not None and rss > self.max_rss_mb:
+                return "memory"
+        return None
+
+    async def admit(self, kind: str) -> None:
+        """Return once a new session of ``kind`` may start.
+
+        The session's slot is reserved before returning; call ``release``
+        once the session is created (or failed to start).
+
+        Raises:
+            AdmissionRejectedError: The server stayed overloaded
+        """
+        reason = self.overload_reason()
+        if reason is not None:
+            if self.waiting >= self.max_waiting or self.queue_timeout <= 0:
+                self._reject(kind, reason)
+            self.waiting += 1
+            self.queued += 1
+            deadline = time.monotonic() + self.queue_timeout
+            try:
+                while reason is not None:
+                    if time.monotonic() >= deadline:
+                        self._reject(kind, reason)
+                    await asyncio.sleep(_POLL_INTERVAL)
+                    reason = self.overload_reason()
+            finally:
+                self.waiting -= 1
+        # No await since the last check, so no other request took the slot
+        self.reserved += 1
+        self.admitted += 1
+
+    def release(self) -> None:
+        """Give back the slot reserved by ``admit``."""
+        self.reserved -= 1
+
+    def _reject(self, kind: str, reason: str) -> NoReturn:
+        self.rejected[reason] = self.rejected.get(reason, 0) + 1
+        logger.warning(
+            "admission_rejected",
+            kind=kind,
+            reason=reason,
+            active_sessions=self.active_sessions(),
+            model_calls=self.model_calls,
+            waiting=self.waiting,
+        )
+        raise AdmissionRejectedError(reason, self.retry_after)
+
+    def get_summary(self) -> dict[str, Any]:
+        """Current signals and admission counts."""
+        rss = _rss_mb()
+        return {
+            "active_sessions": self.active_sessions(),
+            "reserved": self.reserved,
+            "model_calls": self.model_calls,
+            "loop_lag_ms": round(
+                get_loop_lag_monitor().recent_lag(_LAG_SAMPLES) * 1000, 2
+            ),
+            "rss_mb": round(rss, 1) if rss is not None else None,
+            "waiting": self.waiting,
+            "admitted": self.admitted,
+            "queued": self.queued,
+            "rejected": dict(self.rejected),
+        }
+
+
+@asynccontextmanager
+async def require_admission(kind: str) -> AsyncIterator[None]:
+    """Admit a new session or refuse it with 503 and ``Retry-After``.
+
+    The slot stays reserved while the block runs; create the session in it.
+    """
+    controller = get_admission_controller()
+    try:
+        await controller.admit(kind)
+    except AdmissionRejectedError as e:
+        raise HTTPException(
+            status_code=503,
+            detail="Server is busy. Please try again shortly.",
+            headers={"Retry-After": str(e.retry_after)},
+        ) from e
+    try:
+        yield
+    finally:
+        controller.release()
+
+
+# Global admission controller instance
+admission_controller = AdmissionController()
+
+
+def get_admission_controller() -> AdmissionController:
+    """Get the global admission controller instance."""
+    return admission_controller
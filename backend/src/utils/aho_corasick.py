@@ -0,0 +1,174 @@
+"""Aho-Corasick multi-pattern matching over normalized text.
+
+The automaton scans a text once, in time linear in the text length plus the
+number of matches, no matter how many patterns it was built from.
+"""
+
+import unicodedata
+from collections import deque
+from collections.abc import Iterable, Iterator
+from typing import NamedTuple
+
+# Combining marks are only stripped after Latin letters ("é" -> "e"). In other
+# scripts (Devanagari vowel signs, Japanese dakuten, ...) they change meaning.
+_LATIN_LIMIT = 0x0250
+
+
+def normalize_text(text: str) -> str:
+    """Normalize text for accent- and case-insensitive matching.
+
+    Applies compatibility decomposition, drops accents on Latin letters,
+    recomposes, case-folds and straightens typographic apostrophes. Patterns
+    and scanned text must go through the same normalization.
+
+    Args:
+        text: Text to normalize
+
+    Returns:
+        Normalized text
+    """
+    if text.isascii():
+        return text.lower()
+
+    # Typographic apostrophes (U+2019) match patterns written with "'"
+    decomposed = unicodedata.normalize("NFKD", text.replace("\u2019", "'"))
+    kept: list[str] = []
+    base = ""
+    for ch in decomposed:
+        if unicodedata.combining(ch):
+            if base and ord(base) < _LATIN_LIMIT:
+                continue
+        else:
+            base = ch
+        kept.append(ch)
+    return unicodedata.normalize("NFC", "".join(kept)).casefold()
+
+
+def _is_word_char(ch: str) -> bool:
+    return ch.isalnum() or ch == "_"
+
+
+class Match(NamedTuple):
+    """A pattern occurrence in normalized text."""
+
+    start: int
+    end: int
+    pattern: str
+    pattern_index: int  # Position in the pattern list the automaton was built from
+
+
+class AhoCorasick:
+    """Compiled multi-pattern matcher.
+
+    Patterns are normalized with :func:`normalize_text` when the automaton is
+    built; texts are normalized when scanned. Match offsets refer to the
+    normalized text.
+    """
+
+    def __init__(self, patterns: Iterable[str]):
+        """
+        Build the automaton.
+
+        Args:
+            patterns: Patterns to search for (empty patterns are ignored)
+        """
+        self.patterns: list[str] = []
+        self._goto: list[dict[str, int]] = [{}]
+        self._fail: list[int] = [0]
+        # Pattern indexes ending at each state, including those reached
+        # through failure links, so the scan never walks output chains
+        self._out: list[tuple[int, ...]] = [()]
+
+        for pattern in patterns:
+            normalized = normalize_text(pattern).strip()
+            if normalized:
+                self._add(normalized, len(self.patterns))
+                self.patterns.append(normalized)
+        self._build_failure_links()
+
+    def __len__(self) -> int:
+        return len(self.patterns)
+
+    @property
+    def state_count(self) -> int:
+        """Number of automaton states (trie nodes)."""
+        return len(self._goto)
+
+    def _add(self, pattern: str, index: int) -> None:
+        state = 0
+        for ch in pattern:
+            nxt = self._goto[state].get(ch)
+            if nxt is None:
+                nxt = len(self._goto)
+                self._goto[state][ch] = nxt
+                self._goto.append({})
+                self._fail.append(0)
+                self._out.append(())
+            state = nxt
+        self._out[state] += (index,)
+
+    def _build_failure_links(self) -> None:
+        queue: deque[int] = deque(self._goto[0].values())
+        while queue:
+            state = queue.popleft()
+            for ch, nxt in self._goto[state].items():
+                queue.append(nxt)
+                fallback = self._fail[state]
+                while fallback and ch not in self._goto[fallback]:
+                    fallback = self._fail[fallback]
+                target = self._goto[fallback].get(ch, 0)
+                self._fail[nxt] = target if target != nxt else 0
+                self._out[nxt] += self._out[self._fail[nxt]]
+
+    def _scan(self, text: str) -> Iterator[tuple[int, tuple[int, ...]]]:
+        """Yield (end offset, pattern indexes) for every state with output."""
+        goto, fail, out = self._goto, self._fail, self._out
+        root = goto[0]
+        state = 0
+        for pos, ch in enumerate(text):
+            while state:
+                nxt = goto[state].get(ch)
+                if nxt is not None:
+                    state = nxt
+                    break
+                state = fail[state]
+            else:
+                state = root.get(ch, 0)
+            if out[state]:
+                yield pos + 1, out[state]
+
+    def iter_matches(
+        self, text: str, *, word_boundaries: bool = False, normalized: bool = False
+    ) -> Iterator[Match]:
+        """Yield every (possibly overlapping) pattern occurrence.
+
+        Args:
+            text: Text to scan
+            word_boundaries: Only report matches not surrounded by word characters
+            normalized: Set when ``text`` was already passed through normalize_text
+
+        Yields:
+            Match tuples in order of their end offset
+        """
+        if not normalized:
+            text = normalize_text(text)
+        patterns = self.patterns
+        for end, indexes in self._scan(text):
+            for index in indexes:
+                start = end - len(patterns[index])
+                if word_boundaries and (
+                    (start > 0 and _is_word_char(text[start - 1]))
+                    or (end < len(text) and _is_word_char(text[end]))
+                ):
+                    continue
+                yield Match(start, end, patterns[index], index)
+
+    def find_all(self, text: str, *, word_boundaries: bool = False) -> list[Match]:
+        """Return all pattern occurrences in the text."""
+        return list(self.iter_matches(text, word_boundaries=word_boundaries))
+
+    def search(self, text: str) -> bool:
+        """Return True as soon as any pattern occurs in the text."""
+        for _ in self._scan(normalize_text(text)):
+            return True
+        return False
@@ -1,17 +1,29 @@
 """Audio format conversion utilities for handling browser audio inputs."""
 
-import io
 import logging
 import struct
 import time
-import wave
+from collections.abc import Iterable, Iterator
 from typing import ClassVar
 
 import numpy as np
-from scipy import signal
+
+from src.utils.audio_codecs import L16, PCMA, PCMU, SAMPLE_WIDTHS, decode_audio
+from src.utils.audio_executor import run_audio
+from src.utils.resampler import StreamingResampler, resample
 
 logger = logging.getLogger(__name__)
 
+# Frames decoded per block; bounds the working memory of WAV conversion
+WAV_BLOCK_FRAMES = 8192
+# Input bytes handed to the decoder at a time when converting whole files
+WAV_FEED_BYTES = 65536
+
+_WAVE_FORMAT_PCM = 0x0001
+_WAVE_FORMAT_EXTENSIBLE = 0xFFFE
+# Data chunk sizes written by recorders that stream without seeking back
+_UNKNOWN_CHUNK_SIZES = (0, 0xFFFFFFFF)
+
 
 class AudioConverter:
     """Handles audio format conversion for different browser inputs."""
@@ -22,7 +34,13 @@ class AudioConverter:
         "audio/mp4": "mp4",
         "audio/mpeg": "mp3",
         "audio/ogg": "ogg",
+        "audio/pcmu": PCMU,
+        "audio/basic": PCMU,
+        "audio/pcma": PCMA,
+        "audio/l16": L16,
     }
+    # Rate assumed when the MIME type has no ``rate`` parameter (RFC 3551)
+    DEFAULT_CODEC_RATES: ClassVar[dict[str, int]] = {PCMU: 8000, PCMA: 8000, L16: 16000}
 
     TARGET_SAMPLE_RATE = 16000  # 16kHz for ADK
     TARGET_CHANNELS = 1  # Mono
@@ -34,7 +52,9 @@ class AudioConverter:
 
         Args:
             audio_data: Raw audio bytes
-            mime_type: MIME type of the input audio
+            mime_type: MIME type of the input audio; G.711 and L16 take
+                optional ``rate`` and ``channels`` parameters
+                (e.g. ``audio/L16;rate=48000;channels=2``)
 
         Returns:
             Tuple of (converted PCM bytes, metrics dict)
@@ -51,9 +71,13 @@ class AudioConverter:
         }
 
         try:
+            base_type, params = cls.parse_mime_type(mime_type)
+            encoding = cls.SUPPORTED_INPUT_FORMATS.get(base_type)
             # Handle WAV format (most common from browsers)
-            if mime_type == "audio/wav":
+            if base_type == "audio/wav":
                 pcm_data = cls._convert_wav_to_pcm(audio_data)
+            elif encoding in cls.DEFAULT_CODEC_RATES:
+                pcm_data = cls._convert_encoded_to_pcm(audio_data, encoding, params)
             else:
                 # For now, only support WAV. Other formats would require
                 # additional libraries like ffmpeg-python
@@ -79,95 +103,110 @@ class AudioConverter:
             return b"", metrics
 
     @classmethod
-    def _convert_wav_to_pcm(cls, wav_data: bytes) -> bytes:
-        """Convert WAV audio to 16kHz mono PCM.
+    async def convert_to_pcm_async(
+        cls, audio_data: bytes, mime_type: str
+    ) -> tuple[bytes, dict]:
+        """``convert_to_pcm`` on the audio executor, for async handlers."""
+        return await run_audio(cls.convert_to_pcm, audio_data, mime_type)
+
+    @classmethod
+    def iter_wav_to_pcm(cls, chunks: Iterable[bytes | memoryview]) -> Iterator[bytes]:
+        """Convert a WAV byte stream to 16kHz mono PCM block by block.
+
+        PCM is yielded as soon as each piece of input is decoded, so a long
+        upload is converted while it arrives, in bounded memory.
 
         Args:
-            wav_data: WAV file bytes
+            chunks: Consecutive pieces of the WAV file
+
+        Yields:
+            PCM audio bytes
+        """
+        decoder = WavStreamDecoder(cls.TARGET_SAMPLE_RATE)
+        for chunk in chunks:
+            pcm = decoder.feed(chunk)
+            if pcm:
+                yield pcm
+        pcm = decoder.flush()
+        if pcm:
+            yield pcm
+
+    @staticmethod
+    def parse_mime_type(mime_type: str) -> tuple[str, dict[str, str]]:
+        """Split a MIME type into its lowercased base type and parameters."""
+        base_type, *rest = mime_type.split(";")
+        params = {}
+        for param in rest:
+            name, _, value = param.partition("=")
+            params[name.strip().lower()] = value.strip().strip('"')
+        return base_type.strip().lower(), params
+
+    @classmethod
+    def _convert_encoded_to_pcm(
+        cls, audio_data: bytes, encoding: str, params: dict[str, str]
+    ) -> bytes:
+        """Convert headerless G.711 or L16 audio to 16kHz mono PCM.
+
+        Args:
+            audio_data: Encoded samples, channels interleaved
+            encoding: Wire encoding (``pcmu``, ``pcma`` or ``l16``)
+            params: MIME type parameters giving ``rate`` and ``channels``
 
         Returns:
             PCM audio bytes
         """
-        # Read WAV file
-        with (
-            io.BytesIO(wav_data) as wav_buffer,
-            wave.open(wav_buffer, "rb") as wav_file,
-        ):
-            params = wav_file.getparams()
-            frames = wav_file.readframes(params.nframes)
-
-            # Log input parameters
-            logger.debug(
-                f"Input WAV: {params.framerate}Hz, "
-                f"{params.nchannels} channels, "
-                f"{params.sampwidth} bytes/sample"
-            )
+        rate = int(params.get("rate", cls.DEFAULT_CODEC_RATES[encoding]))
+        channels = int(params.get("channels", 1))
+        if rate <= 0 or channels <= 0:
+            raise ValueError(f"Invalid rate or channels: {rate}, {channels}")
+        frame_size = SAMPLE_WIDTHS[encoding] * channels
+        usable = len(audio_data) - len(audio_data) % frame_size
+        pcm = decode_audio(memoryview(audio_data)[:usable], encoding)
+
+        samples = np.frombuffer(pcm, dtype="<i2").astype(np.float32) / 32768.0
+        if channels > 1:
+            samples = samples.reshape(-1, channels).mean(axis=1)
+        samples = resample(samples, rate, cls.TARGET_SAMPLE_RATE)
+        return bytes(np.clip(samples * 32768, -32768, 32767).astype(np.int16).tobytes())
 
-            # Convert to numpy array
-            audio_array: np.ndarray
-            if params.sampwidth == 1:
-                temp_array = np.frombuffer(frames, dtype=np.uint8)
-                # Convert to signed
-                audio_array = temp_array.astype(np.float32) - 128
-                audio_array = audio_array / 128.0
-            elif params.sampwidth == 2:
-                temp_array = np.frombuffer(frames, dtype=np.int16)
-                audio_array = temp_array.astype(np.float32) / 32768.0
-            elif params.sampwidth == 3:
-                # 24-bit audio needs special handling
-                temp_array = cls._read_24bit_samples(frames)
-                audio_array = temp_array.astype(np.float32) / 8388608.0
-            elif params.sampwidth == 4:
-                temp_array = np.frombuffer(frames, dtype=np.int32)
-                audio_array = temp_array.astype(np.float32) / 2147483648.0
-            else:
-                raise ValueError(f"Unsupported sample width: {params.sampwidth}")
-
-            # Handle multi-channel to mono conversion
-            if params.nchannels > 1:
-                # Reshape to (samples, channels)
-                audio_array = audio_array.reshape(-1, params.nchannels)
-                # Average channels to get mono
-                audio_array = np.mean(audio_array, axis=1)
-
-            # Resample if needed
-            if params.framerate != cls.TARGET_SAMPLE_RATE:
-                # Calculate resampling ratio
-                resample_ratio = cls.TARGET_SAMPLE_RATE / params.framerate
-                num_output_samples = int(len(audio_array) * resample_ratio)
-
-                # Use scipy's resample for better quality
-                audio_array = signal.resample(audio_array, num_output_samples)
-
-                logger.debug(
-                    f"Resampled from {params.framerate}Hz to "
-                    f"{cls.TARGET_SAMPLE_RATE}Hz"
-                )
+    @classmethod
+    def _convert_wav_to_pcm(cls, wav_data: bytes) -> bytes:
+        """Convert WAV audio to 16kHz mono PCM.
 
-            # Convert back to 16-bit PCM
-            audio_array = np.clip(audio_array * 32768, -32768, 32767)
-            pcm_data = audio_array.astype(np.int16).tobytes()
+        Args:
+            wav_data: WAV file bytes
 
-            return pcm_data
+        Returns:
+            PCM audio bytes
+        """
+        view = memoryview(wav_data)
+        chunks = (
+            view[i : i + WAV_FEED_BYTES] for i in range(0, len(view), WAV_FEED_BYTES)
+        )
+        return b"".join(cls.iter_wav_to_pcm(chunks))
 
     @staticmethod
     def _read_24bit_samples(data: bytes) -> np.ndarray:
         """Read 24-bit samples from bytes."""
-        # 24-bit samples are 3 bytes each
-        num_samples = len(data) // 3
-        samples = np.zeros(num_samples, dtype=np.int32)
-
-        for i in range(num_samples):
-            # Read 3 bytes and interpret as signed 24-bit integer
-            b1, b2, b3 = struct.unpack("BBB", data[i * 3 : (i + 1) * 3])
-            # Combine bytes (little-endian)
-            value = b1 | (b2 << 8) | (b3 << 16)
-            # Sign extend from 24-bit to 32-bit
-            if value & 0x800000:  # If sign bit is set
-                value = value - 0x1000000  # Subtract 2^24 instead of OR with 0xFF000000
-            samples[i] = value
-
-        return samples
+        return AudioConverter._read_nbyte_samples(data, 3)
+
+    @staticmethod
+    def _read_nbyte_samples(data: bytes | memoryview, width: int) -> np.ndarray:
+        """Read signed little-endian samples of 1-4 bytes each as int32.
+
+        Each sample's bytes are placed in the top of a 32-bit word, so a
+        single arithmetic right shift sign-extends the whole array.
+        """
+        if not 1 <= width <= 4:
+            raise ValueError(f"Unsupported sample width: {width}")
+        num_samples = len(data) // width
+        raw = np.frombuffer(data, dtype=np.uint8, count=num_samples * width)
+        if width == 4:
+            return raw.view("<i4").astype(np.int32)
+        words = np.zeros((num_samples, 4), dtype=np.uint8)
+        words[:, 4 - width :] = raw.reshape(num_samples, width)
+        samples: np.ndarray = words.view("<i4").reshape(num_samples)
+        return samples >> (32 - 8 * width)
 
     @classmethod
     def validate_pcm_data(cls, pcm_data: bytes) -> bool:
@@ -198,3 +237,194 @@ class AudioConverter:
         except Exception as e:
             logger.error(f"Failed to validate PCM data: {e}")
             return False
+
+
+class WavStreamDecoder:
+    """Incremental WAV to 16-bit mono PCM decoder.
+
+    Bytes are fed as they arrive and every call returns the PCM decoded so
+    far. Frames are decoded, downmixed and resampled in blocks of
+    ``block_frames`` with continuous filter state, so memory is bounded by
+    the block size however long the recording is. The output matches
+    converting the whole file at once.
+    """
+
+    def __init__(self, target_rate: int = 16000, block_frames: int = WAV_BLOCK_FRAMES):
+        """
+        Initialize the decoder.
+
+        Args:
+            target_rate: Output sample rate in Hz
+            block_frames: Input frames converted per block
+        """
+        self.target_rate = target_rate
+        self.block_frames = block_frames
+        self.channels = 0
+        self.sample_rate = 0
+        self.sample_width = 0
+        self.frames_in = 0
+
+        self._buffer = bytearray()
+        self._riff_checked = False
+        self._skip_bytes = 0  # rest of a chunk being skipped
+        self._in_data = False
+        self._data_remaining: int | None = None  # None: until end of stream
+        self._resampler: StreamingResampler | None = None
+        self._skip_out = 0  # filter delay still to drop from the output
+        self._samples_out = 0
+
+    def feed(self, data: bytes | memoryview) -> bytes:
+        """Add the next bytes of the file and return the PCM now available."""
+        if self._data_remaining == 0:
+            return b""  # trailing chunks after the audio
+        self._buffer += data
+        if not self._in_data and not self._parse_header():
+            return b""
+        return self._decode()
+
+    def flush(self) -> bytes:
+        """Return the remaining PCM once the whole file has been fed."""
+        if not self._in_data or self._resampler is None:
+            raise ValueError("Incomplete WAV header")
+        pcm = [self._decode()]
+        self._buffer.clear()  # a trailing partial frame is dropped
+
+        # Push the filter delay out with silence, up to the exact length
+        resampler = self._resampler
+        expected = self.frames_in * resampler.up // resampler.down
+        while self._samples_out < expected:
+            missing = expected - self._samples_out + self._skip_out
+            silence = np.zeros(missing * resampler.down // resampler.up + 1)
+            pcm.append(self._emit(resampler.process(silence)))
+        data = b"".join(pcm)
+        excess = self._samples_out - expected
+        if excess > 0:
+            data = data[: len(data) - 2 * excess]
+            self._samples_out = expected
+        return data
+
+    def _parse_header(self) -> bool:
+        """Consume header chunks up to the audio data; False if more is needed."""
+        buffer = self._buffer
+        if not self._riff_checked:
+            if len(buffer) < 12:
+                return False
+            if buffer[:4] != b"RIFF" or buffer[8:12] != b"WAVE":
+                raise ValueError("Not a RIFF/WAVE file")
+            del buffer[:12]
+            self._riff_checked = True
+
+        while True:
+            if self._skip_bytes:
+                skipped = min(self._skip_bytes, len(buffer))
+                del buffer[:skipped]
+                self._skip_bytes -= skipped
+                if self._skip_bytes:
+                    return False
+            if len(buffer) < 8:
+                return False
+            chunk_id = bytes(buffer[:4])
+            size = int.from_bytes(buffer[4:8], "little")
+
+            if chunk_id == b"fmt ":
+                padded = 8 + size + (size & 1)
+                if len(buffer) < padded:
+                    return False
+                self._read_format(bytes(buffer[8 : 8 + size]))
+                del buffer[:padded]
+            elif chunk_id == b"data":
+                if not self.channels:
+                    raise ValueError("WAV data chunk before format chunk")
+                del buffer[:8]
+                self._data_remaining = None if size in _UNKNOWN_CHUNK_SIZES else size
+                self._in_data = True
+                return True
+            else:
+                # LIST, fact and other metadata chunks
+                del buffer[:8]
+                self._skip_bytes = size + (size & 1)
+
+    def _read_format(self, fmt: bytes) -> None:
+        if len(fmt) < 16:
+            raise ValueError("Invalid WAV format chunk")
+        audio_format, channels, sample_rate = struct.unpack_from("<HHI", fmt)
+        bits = struct.unpack_from("<H", fmt, 14)[0]
+        if audio_format == _WAVE_FORMAT_EXTENSIBLE and len(fmt) >= 26:
+            # The sub-format GUID starts with the actual format code
+            audio_format = struct.unpack_from("<H", fmt, 24)[0]
+        if audio_format != _WAVE_FORMAT_PCM:
+            raise ValueError(f"Unsupported WAV encoding: {audio_format:#06x}")
+        width = (bits + 7) // 8
+        if not 1 <= width <= 4:
+            raise ValueError(f"Unsupported sample width: {width}")
+        if not channels:
+            raise ValueError("WAV file has no channels")
+
+        self.channels = channels
+        self.sample_rate = sample_rate
+        self.sample_width = width
+        self._resampler = StreamingResampler(sample_rate, self.target_rate)
+        self._skip_out = self._resampler.delay
+
+        logger.debug(
+            f"Input WAV: {sample_rate}Hz, {channels} channels, {width} bytes/sample"
+        )
+
+    def _decode(self) -> bytes:
+        """Convert every whole frame buffered so far."""
+        frame_size = self.channels * self.sample_width
+        frames = len(self._buffer) // frame_size
+        if self._data_remaining is not None:
+            frames = min(frames, self._data_remaining // frame_size)
+        if not frames:
+            return b""
+
+        pcm = []
+        with memoryview(self._buffer) as view:
+            for start in range(0, frames, self.block_frames):
+                stop = min(start + self.block_frames, frames)
+                pcm.append(
+                    self._convert_block(view[start * frame_size : stop * frame_size])
+                )
+        consumed = frames * frame_size
+        del self._buffer[:consumed]
+        self.frames_in += frames
+
+        if self._data_remaining is not None:
+            self._data_remaining -= consumed
+            if self._data_remaining < frame_size:
+                self._data_remaining = 0
+                self._buffer.clear()
+        return b"".join(pcm)
+
+    def _convert_block(self, block: memoryview) -> bytes:
+        width = self.sample_width
+        samples: np.ndarray
+        if width == 1:
+            # 8-bit WAV is unsigned
+            samples = np.frombuffer(block, dtype=np.uint8).astype(np.float32) - 128
+            samples /= 128.0
+        elif width == 2:
+            samples = np.frombuffer(block, dtype="<i2").astype(np.float32) / 32768.0
+        else:
+            samples = AudioConverter._read_nbyte_samples(block, width).astype(
+                np.float32
+            ) / float(1 << (8 * width - 1))
+
+        # Average channels to get mono
+        if self.channels > 1:
+            samples = samples.reshape(-1, self.channels).mean(axis=1)
+
+        if self._resampler is None:
+            raise RuntimeError("WAV format not parsed")
+        return self._emit(self._resampler.process(samples))
+
+    def _emit(self, samples: np.ndarray) -> bytes:
+        """Scale resampled audio to 16-bit PCM, dropping the filter delay."""
+        if self._skip_out:
+            dropped = min(self._skip_out, len(samples))
+            samples = samples[dropped:]
+            self._skip_out -= dropped
+        pcm = np.clip(samples * 32768, -32768, 32767).astype(np.int16)
+        self._samples_out += len(pcm)
+        return bytes(pcm.tobytes())
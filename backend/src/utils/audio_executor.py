@@ -0,0 +1,51 @@
+"""Worker pool for CPU-bound audio processing.
+
+Resampling, WAV decoding and voice activity detection are NumPy/SciPy work
+that releases the GIL, so a thread pool runs them in parallel without
+pickling PCM: workers read the caller's bytes and memoryviews in place. The
+event loop only awaits the result and stays free for other sessions.
+"""
+
+import asyncio
+import functools
+import os
+from collections.abc import Callable
+from concurrent.futures import ThreadPoolExecutor
+
+from src.utils.logging import get_logger
+
+logger = get_logger(__name__)
+
+# Worker threads for audio DSP (0 runs it inline on the event loop)
+AUDIO_EXECUTOR_WORKERS = int(os.getenv("AUDIO_EXECUTOR_WORKERS", "4"))
+
+_executor: ThreadPoolExecutor | None = None
+
+
+def get_audio_executor() -> ThreadPoolExecutor | None:
+    """Get the shared audio executor, or None when running inline."""
+    global _executor
+    if _executor is None and AUDIO_EXECUTOR_WORKERS > 0:
+        _executor = ThreadPoolExecutor(
+            max_workers=AUDIO_EXECUTOR_WORKERS, thread_name_prefix="audio-dsp"
+        )
+        logger.info("audio_executor_started", workers=AUDIO_EXECUTOR_WORKERS)
+    return _executor
+
+
+def shutdown_audio_executor() -> None:
+    """Stop the executor after its queued work; the next use starts a new one."""
+    global _executor
+    executor, _executor = _executor, None
+    if executor is not None:
+        executor.shutdown(wait=True)
+        logger.info("audio_executor_stopped")
+
+
+async def run_audio[**P, R](fn: Callable[P, R], *args: P.args, **kwargs: P.kwargs) -> R:
+    """Run ``fn`` on the audio executor and await its result."""
+    executor = get_audio_executor()
+    if executor is None:
+        return fn(*args, **kwargs)
+    loop = asyncio.get_running_loop()
+    return await loop.run_in_executor(executor, functools.partial(fn, *args, **kwargs))
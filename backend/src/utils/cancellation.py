@@ -0,0 +1,159 @@
+"""Cancellation tokens that tie in-flight model turns to session liveness."""
+
+import asyncio
+from collections import defaultdict
+from collections.abc import Coroutine
+from dataclasses import dataclass, field
+from typing import Any, TypeVar
+
+from src.utils.logging import get_logger
+
+logger = get_logger(__name__)
+
+T = TypeVar("T")
+
+
+class TurnCancelledError(Exception):
+    """Raised when a turn is aborted because its session went away."""
+
+    def __init__(self, reason: str):
+        super().__init__(f"Turn cancelled: {reason}")
+        self.reason = reason
+
+
+@dataclass(eq=False)
+class CancellationToken:
+    """Cancellation handle for a single model turn.
+
+    The token owns the task that runs the turn, so cancelling the token
+    cancels the upstream generation instead of letting it run to completion.
+    """
+
+    session_id: str
+    # The SSE connection (its SessionInfo) that the turn's events go to
+    owner: object | None = field(default=None, repr=False)
+    reason: str | None = None
+    _task: asyncio.Task | None = field(default=None, repr=False)
+
+    @property
+    def cancelled(self) -> bool:
+        """Whether the token has been cancelled."""
+        return self.reason is not None
+
+    def cancel(self, reason: str) -> bool:
+        """Cancel the turn bound to this token.
+
+        Args:
+            reason: Short machine-readable cause (e.g. "client_disconnected")
+
+        Returns:
+            True if this call cancelled the token, False if it already was
+        """
+        if self.reason is not None:
+            return False
+        self.reason = reason
+        if self._task is not None and not self._task.done():
+            self._task.cancel()
+        return True
+
+    def raise_if_cancelled(self) -> None:
+        """Raise TurnCancelledError if the token has been cancelled."""
+        if self.reason is not None:
+            raise TurnCancelledError(self.reason)
+
+    async def run(self, coro: Coroutine[Any, Any, T]) -> T:
+        """Run a coroutine as a task that is cancelled together with the token.
+
+        Args:
+            coro: The coroutine performing the model call
+
+        Returns:
+            The coroutine result
+
+        Raises:
+            TurnCancelledError: If the token was cancelled before or during the run
+        """
+        if self.reason is not None:
+            coro.close()
+            raise TurnCancelledError(self.reason)
+
+        task: asyncio.Task[T] = asyncio.ensure_future(coro)
+        self._task = task
+        try:
+            return await task
+        except asyncio.CancelledError:
+            if self.reason is not None:
+                raise TurnCancelledError(self.reason) from None
+            # Cancellation came from the caller, not from the token
+            raise
+        finally:
+            self._task = None
+
+
+class TurnRegistry:
+    """Tracks the in-flight turns of every session."""
+
+    def __init__(self) -> None:
+        self._tokens: dict[str, set[CancellationToken]] = defaultdict(set)
+
+    def open(self, session_id: str, owner: object | None = None) -> CancellationToken:
+        """Register a new in-flight turn for a session.
+
+        Args:
+            session_id: The session the turn belongs to
+            owner: The connection the turn's events are delivered to
+        """
+        token = CancellationToken(session_id=session_id, owner=owner)
+        self._tokens[session_id].add(token)
+        return token
+
+    def close(self, token: CancellationToken) -> None:
+        """Unregister a finished (or cancelled) turn."""
+        tokens = self._tokens.get(token.session_id)
+        if tokens is None:
+            return
+        tokens.discard(token)
+        if not tokens:
+            del self._tokens[token.session_id]
+
+    def cancel_session(
+        self, session_id: str, reason: str, owner: object | None = None
+    ) -> int:
+        """Cancel every in-flight turn of a session.
+
+        Args:
+            session_id: The session whose turns should be aborted
+            reason: Short machine-readable cause
+            owner: Only cancel turns opened for this connection, so a stream
+                closing after the client reconnected leaves the new
+                connection's turns alone
+
+        Returns:
+            Number of turns that were cancelled by this call
+        """
+        tokens = self._tokens.get(session_id)
+        if not tokens:
+            return 0
+        cancelled = sum(
+            1
+            for token in list(tokens)
+            if (owner is None or token.owner is owner) and token.cancel(reason)
+        )
+        if cancelled:
+            logger.info(
+                "session_turns_cancelled",
+                session_id=session_id,
+                reason=reason,
+                count=cancelled,
+            )
+        return cancelled
+
+    def inflight_count(self, session_id: str | None = None) -> int:
+        """Number of in-flight turns, for one session or for the whole process."""
+        if session_id is not None:
+            return len(self._tokens.get(session_id, ()))
+        return sum(len(tokens) for tokens in self._tokens.values())
+
+
+# Global turn registry instance
+turn_registry = TurnRegistry()
@@ -0,0 +1,103 @@
+"""Bounded TTL cache used to deduplicate retried requests."""
+
+import asyncio
+import time
+from collections import OrderedDict
+from collections.abc import Awaitable, Callable
+from typing import Any
+
+from src.utils.logging import get_logger
+
+logger = get_logger(__name__)
+
+
+class IdempotencyCache[T]:
+    """Remembers recent request keys and the result they produced.
+
+    A duplicate key returns the original result, or attaches to the original
+    work if it is still running, instead of doing the work twice. Failed work
+    is forgotten so that a retry can run it again.
+    """
+
+    def __init__(
+        self,
+        max_entries: int = 128,
+        ttl_seconds: float = 300,
+        retain: Callable[[T], bool] | None = None,
+    ):
+        """
+        Initialize the cache.
+
+        Args:
+            max_entries: Maximum number of keys remembered at once
+            ttl_seconds: How long a key is remembered after it was first seen
+            retain: Optional predicate; results it rejects are not remembered
+        """
+        self.max_entries = max_entries
+        self.ttl_seconds = ttl_seconds
+        self._retain = retain
+        self._entries: OrderedDict[str, tuple[float, asyncio.Task[T]]] = OrderedDict()
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def __contains__(self, key: object) -> bool:
+        self._prune()
+        return key in self._entries
+
+    async def run(self, key: str, work: Callable[[], Awaitable[T]]) -> T:
+        """Run ``work`` once per key and share its result with duplicates.
+
+        Args:
+            key: Client-supplied idempotency key
+            work: Zero-argument callable producing the awaitable to run
+
+        Returns:
+            The result of the (single) execution for this key
+        """
+        self._prune()
+        entry = self._entries.get(key)
+        if entry is not None:
+            logger.info("idempotent_request_deduplicated", key=key)
+            # Shield so a retry giving up does not cancel the shared work
+            return await asyncio.shield(entry[1])
+
+        task: asyncio.Task[T] = asyncio.ensure_future(work())
+        self._entries[key] = (time.monotonic() + self.ttl_seconds, task)
+        task.add_done_callback(lambda done: self._on_done(key, done))
+        self._evict()
+        # The work keeps running if the first caller goes away, so that its
+        # retry can attach to it
+        return await asyncio.shield(task)
+
+    def _on_done(self, key: str, task: asyncio.Task[Any]) -> None:
+        """Forget keys whose work failed or produced a non-retainable result."""
+        entry = self._entries.get(key)
+        if entry is None or entry[1] is not task:
+            return
+        failed = task.cancelled() or task.exception() is not None
+        if failed or (self._retain is not None and not self._retain(task.result())):
+            del self._entries[key]
+        self._evict()
+
+    def _evict(self) -> None:
+        """Drop the oldest completed keys while over ``max_entries``.
+
+        Keys whose work is still running are kept even if that leaves the
+        cache over its bound, so that a retry never starts the work twice.
+        """
+        excess = len(self._entries) - self.max_entries
+        if excess <= 0:
+            return
+        done = [key for key, (_, task) in self._entries.items() if task.done()]
+        for key in done[:excess]:
+            del self._entries[key]
+
+    def _prune(self) -> None:
+        """Drop expired keys (entries are kept in insertion/expiry order)."""
+        now = time.monotonic()
+        while self._entries:
+            key, (expires_at, _) = next(iter(self._entries.items()))
+            if expires_at > now:
+                break
+            del self._entries[key]
@@ -0,0 +1,98 @@
+"""Event loop lag monitoring.
+
+A task sleeps for a fixed interval and records how late it wakes up. Any
+synchronous work on the loop (DSP, JSON encoding, blocking I/O) shows up as
+lag, which makes this the most direct measure of how responsive the server
+is for every connected session.
+"""
+
+import asyncio
+import os
+from collections import deque
+from typing import Any
+
+from src.utils.logging import get_logger
+
+logger = get_logger(__name__)
+
+LOOP_LAG_INTERVAL_MS = int(os.getenv("LOOP_LAG_INTERVAL_MS", "50"))
+# Samples kept for percentiles (10 minutes at the default interval)
+LOOP_LAG_WINDOW = 12000
+
+
+class LoopLagMonitor:
+    """Samples the running event loop's scheduling delay."""
+
+    def __init__(
+        self,
+        interval_ms: int = LOOP_LAG_INTERVAL_MS,
+        window: int = LOOP_LAG_WINDOW,
+    ):
+        """
+        Initialize the monitor.
+
+        Args:
+            interval_ms: Time between samples
+            window: Number of recent samples kept for the summary
+        """
+        self.interval = interval_ms / 1000
+        self._samples: deque[float] = deque(maxlen=window)
+        self.current_lag = 0.0
+        self._task: asyncio.Task | None = None
+
+    def start(self) -> None:
+        """Start sampling on the running loop."""
+        if self._task is None or self._task.done():
+            self._task = asyncio.create_task(self._run())
+
+    async def stop(self) -> None:
+        """Stop sampling."""
+        if self._task is None:
+            return
+        self._task.cancel()
+        try:
+            await self._task
+        except asyncio.CancelledError:
+            pass
+        self._task = None
+
+    async def _run(self) -> None:
+        loop = asyncio.get_running_loop()
+        while True:
+            start = loop.time()
+            await asyncio.sleep(self.interval)
+            self.record(loop.time() - start - self.interval)
+
+    def record(self, lag: float) -> None:
+        """Record one lag sample in seconds."""
+        lag = max(lag, 0.0)
+        self.current_lag = lag
+        self._samples.append(lag)
+
+    def recent_lag(self, samples: int) -> float:
+        """Median of the latest ``samples`` lag samples in seconds."""
+        recent = sorted(list(self._samples)[-samples:])
+        return recent[len(recent) // 2] if recent else 0.0
+
+    def get_summary(self) -> dict[str, Any]:
+        """Lag statistics in milliseconds."""
+        if not self._samples:
+            return {"current": 0.0, "p50": 0.0, "p99": 0.0, "max": 0.0, "samples": 0}
+        samples = sorted(self._samples)
+        count = len(samples)
+        return {
+            "current": round(self.current_lag * 1000, 2),
+            "p50": round(samples[count // 2] * 1000, 2),
+            "p99": round(samples[min(count - 1, int(count * 0.99))] * 1000, 2),
+            "max": round(samples[-1] * 1000, 2),
+            "samples": count,
+        }
+
+
+# Global loop lag monitor instance
+loop_lag_monitor = LoopLagMonitor()
+
+
+def get_loop_lag_monitor() -> LoopLagMonitor:
+    """Get the global loop lag monitor instance."""
+    return loop_lag_monitor
@@ -2,6 +2,8 @@
 
 from fastapi import APIRouter
 
+from src.utils.admission import get_admission_controller
+from src.utils.loop_lag import get_loop_lag_monitor
 from src.utils.performance_monitor import get_performance_monitor
 
 router = APIRouter(prefix="/api", tags=["metrics"])
@@ -15,4 +17,7 @@ router = APIRouter(prefix="/api", tags=["metrics"])
 async def get_metrics():
     """Get performance metrics."""
     performance_monitor = get_performance_monitor()
-    return performance_monitor.get_metrics()
+    metrics = performance_monitor.get_metrics()
+    metrics["event_loop_lag_ms"] = get_loop_lag_monitor().get_summary()
+    metrics["admission"] = get_admission_controller().get_summary()
+    return metrics
@@ -1,6 +1,7 @@
 """Performance monitoring for voice modality."""
 
 import asyncio
+import bisect
 import time
 from contextlib import asynccontextmanager
 from dataclasses import dataclass, field
@@ -10,6 +11,72 @@ from src.utils.logging import get_logger
 
 logger = get_logger(__name__)
 
+# Upper bounds (seconds) of the voice latency histogram buckets
+LATENCY_BUCKETS = (
+    0.001,
+    0.0025,
+    0.005,
+    0.01,
+    0.025,
+    0.05,
+    0.1,
+    0.25,
+    0.5,
+    1.0,
+    2.5,
+    5.0,
+    10.0,
+)
+# Sessions kept in the time-to-first-audio summary (oldest dropped first)
+VOICE_TTFA_SESSIONS = 100
+
+
+@dataclass
+class LatencyHistogram:
+    """Fixed-bucket latency histogram; its size does not grow with samples."""
+
+    counts: list[int] = field(default_factory=lambda: [0] * (len(LATENCY_BUCKETS) + 1))
+    total: float = 0.0
+    max: float = 0.0
+
+    @property
+    def count(self) -> int:
+        return sum(self.counts)
+
+    def observe(self, duration: float) -> None:
+        """Add one sample (seconds)."""
+        self.counts[bisect.bisect_left(LATENCY_BUCKETS, duration)] += 1
+        self.total += duration
+        self.max = max(self.max, duration)
+
+    def quantile(self, q: float) -> float:
+        """Upper bound of the bucket holding the q-quantile, capped at the max."""
+        rank = q * self.count
+        seen = 0
+        for bound, count in zip(LATENCY_BUCKETS, self.counts, strict=False):
+            seen += count
+            if seen >= rank and seen:
+                return min(bound, self.max)
+        return self.max
+
+    def summary(self) -> dict[str, Any]:
+        """Count, mean, quantiles and per-bucket counts keyed by bound in ms."""
+        count = self.count
+        buckets = {
+            f"{bound * 1000:g}": n
+            for bound, n in zip(LATENCY_BUCKETS, self.counts, strict=False)
+        }
+        buckets["+Inf"] = self.counts[-1]
+        return {
+            "count": count,
+            "avg": self.total / count if count else 0.0,
+            "p50": self.quantile(0.50),
+            "p95": self.quantile(0.95),
+            "p99": self.quantile(0.99),
+            "max": self.max,
+            "buckets_ms": buckets,
+        }
+
 
 @dataclass
 class PerformanceMetrics:
@@ -24,6 +91,15 @@ class PerformanceMetrics:
     tts_latencies: list[float] = field(default_factory=list)
     session_durations: dict[str, float] = field(default_factory=dict)
     concurrent_sessions: list[int] = field(default_factory=list)
+    cancelled_turns: dict[str, int] = field(default_factory=dict)
+    vad_passed_bytes: int = 0
+    vad_suppressed_bytes: int = 0
+    vad_speech_ends: int = 0
+    voice_pool_hits: int = 0
+    voice_pool_misses: int = 0
+    voice_session_create_times: list[float] = field(default_factory=list)
+    voice_latencies: dict[str, LatencyHistogram] = field(default_factory=dict)
+    voice_ttfa: dict[str, list[float]] = field(default_factory=dict)
     _start_time: float = field(default_factory=time.time)
 
     def record_request(self, duration: float, success: bool = True) -> None:
@@ -55,6 +131,41 @@ class PerformanceMetrics:
         """Record number of concurrent sessions."""
         self.concurrent_sessions.append(count)
 
+    def record_turn_cancelled(self, reason: str) -> None:
+        """Record a model turn aborted before completion."""
+        self.cancelled_turns[reason] = self.cancelled_turns.get(reason, 0) + 1
+
+    def record_voice_activity(
+        self, passed_bytes: int, suppressed_bytes: int, speech_ended: bool
+    ) -> None:
+        """Record upstream audio forwarded or suppressed by voice activity detection."""
+        self.vad_passed_bytes += passed_bytes
+        self.vad_suppressed_bytes += suppressed_bytes
+        if speech_ended:
+            self.vad_speech_ends += 1
+
+    def record_voice_session_created(self, duration: float, pooled: bool) -> None:
+        """Record voice session creation latency and whether the pool served it."""
+        self.voice_session_create_times.append(duration)
+        if pooled:
+            self.voice_pool_hits += 1
+        else:
+            self.voice_pool_misses += 1
+
+    def record_voice_latency(self, stage: str, duration: float) -> None:
+        """Record the latency of a voice pipeline stage."""
+        if stage not in self.voice_latencies:
+            self.voice_latencies[stage] = LatencyHistogram()
+        self.voice_latencies[stage].observe(duration)
+
+    def record_time_to_first_audio(self, session_id: str, duration: float) -> None:
+        """Record one turn's time to first agent audio for a session."""
+        if session_id not in self.voice_ttfa:
+            if len(self.voice_ttfa) >= VOICE_TTFA_SESSIONS:
+                del self.voice_ttfa[next(iter(self.voice_ttfa))]
+            self.voice_ttfa[session_id] = []
+        self.voice_ttfa[session_id].append(duration)
+
     def get_summary(self) -> dict[str, Any]:
         """Get performance summary."""
         uptime = time.time() - self._start_time
@@ -118,6 +229,58 @@ class PerformanceMetrics:
                 "avg": sum(self.concurrent_sessions) / len(self.concurrent_sessions),
             }
 
+        # Cancelled turns
+        if self.cancelled_turns:
+            summary["cancelled_turns"] = {
+                "total": sum(self.cancelled_turns.values()),
+                "by_reason": dict(self.cancelled_turns),
+            }
+
+        # Voice activity detection
+        vad_total = self.vad_passed_bytes + self.vad_suppressed_bytes
+        if vad_total:
+            summary["voice_activity"] = {
+                "passed_bytes": self.vad_passed_bytes,
+                "suppressed_bytes": self.vad_suppressed_bytes,
+                "suppressed_ratio": self.vad_suppressed_bytes / vad_total,
+                "speech_ends": self.vad_speech_ends,
+            }
+
+        # Voice session creation and the prewarmed pool
+        if self.voice_session_create_times:
+            sorted_times = sorted(self.voice_session_create_times)
+            created = len(sorted_times)
+            summary["voice_session_pool"] = {
+                "hits": self.voice_pool_hits,
+                "misses": self.voice_pool_misses,
+                "hit_rate": self.voice_pool_hits / created,
+                "create_latency": {
+                    "avg": sum(sorted_times) / created,
+                    "p50": sorted_times[int(created * 0.50)],
+                    "p95": sorted_times[int(created * 0.95)],
+                    "max": sorted_times[-1],
+                },
+            }
+
+        # Voice pipeline stage latencies
+        if self.voice_latencies:
+            summary["voice_latency"] = {
+                stage: histogram.summary()
+                for stage, histogram in self.voice_latencies.items()
+            }
+
+        # Time to first agent audio per voice session
+        if self.voice_ttfa:
+            summary["voice_ttfa"] = {
+                session_id: {
+                    "first": times[0],
+                    "last": times[-1],
+                    "avg": sum(times) / len(times),
+                    "turns": len(times),
+                }
+                for session_id, times in self.voice_ttfa.items()
+            }
+
         return summary
 
 
@@ -211,6 +374,37 @@ class PerformanceMonitor:
         if duration > 2.0:
             logger.warning("high_tts_latency", duration=duration)
 
+    def record_turn_cancelled(self, session_id: str, reason: str) -> None:
+        """Record a model turn cancelled because its session went away."""
+        self.metrics.record_turn_cancelled(reason)
+        logger.info("turn_cancelled", session_id=session_id, reason=reason)
+
+    def record_voice_activity(
+        self, passed_bytes: int, suppressed_bytes: int, speech_ended: bool = False
+    ) -> None:
+        """Record the outcome of voice activity detection on an audio chunk."""
+        self.metrics.record_voice_activity(passed_bytes, suppressed_bytes, speech_ended)
+
+    def record_voice_session_created(self, duration: float, pooled: bool) -> None:
+        """Record how long creating a voice session took."""
+        self.metrics.record_voice_session_created(duration, pooled)
+        logger.info("voice_session_created", duration=duration, pooled=pooled)
+
+    def record_voice_latency(self, stage: str, duration: float) -> None:
+        """Record how long a voice pipeline stage took (seconds)."""
+        self.metrics.record_voice_latency(stage, duration)
+
+    def record_time_to_first_audio(self, session_id: str, duration: float) -> None:
+        """Record the delay from user input to the first agent audio sent."""
+        self.metrics.record_time_to_first_audio(session_id, duration)
+        self.metrics.record_voice_latency("first_audio", duration)
+
+        # Alert on high latency
+        if duration > 2.0:
+            logger.warning(
+                "high_time_to_first_audio", session_id=session_id, duration=duration
+            )
+
     def get_metrics(self) -> dict[str, Any]:
         """Get current performance metrics."""
         summary = self.metrics.get_summary()
@@ -2,12 +2,19 @@
 
 import asyncio
 import logging
+import os
 import time
 from dataclasses import dataclass, field
 from typing import Any
 
+from src.utils.cancellation import turn_registry
+
 logger = logging.getLogger(__name__)
 
+# A session without an open stream still counts as live for this long after
+# its last activity (see get_live_session_count)
+LIVE_SESSION_IDLE_SECONDS = int(os.getenv("LIVE_SESSION_IDLE_SECONDS", "120"))
+
 
 @dataclass
 class SessionInfo:
@@ -19,6 +26,8 @@ class SessionInfo:
     last_activity: float = field(default_factory=time.time)
     request_queue: Any = None  # LiveRequestQueue
     metadata: dict[str, Any] = field(default_factory=dict)
+    # An SSE stream is currently delivering this session's events
+    stream_open: bool = False
 
     def update_activity(self):
         """Update last activity timestamp."""
@@ -80,10 +89,13 @@ class SessionManager:
             session.update_activity()
         return session
 
-    def remove_session(self, session_id: str) -> SessionInfo | None:
-        """Remove and return a session."""
+    def remove_session(
+        self, session_id: str, reason: str = "session_removed"
+    ) -> SessionInfo | None:
+        """Remove and return a session, aborting any in-flight turns."""
         session = self.sessions.pop(session_id, None)
         if session:
+            turn_registry.cancel_session(session_id, reason)
             # Clean up request queue if exists
             if session.request_queue:
                 session.request_queue.close()
@@ -98,6 +110,20 @@ class SessionManager:
         """Get count of active sessions."""
         return len(self.sessions)
 
+    def get_live_session_count(
+        self, idle_seconds: float = LIVE_SESSION_IDLE_SECONDS
+    ) -> int:
+        """Count sessions in use: an open stream or recent activity.
+
+        Sessions are only removed when they expire, so the total count also
+        includes conversations the client has long left.
+        """
+        return sum(
+            1
+            for session in self.sessions.values()
+            if session.stream_open or session.inactive_seconds < idle_seconds
+        )
+
     def list_sessions(self) -> list[SessionInfo]:
         """Get list of all active sessions."""
         return list(self.sessions.values())
@@ -120,7 +146,7 @@ class SessionManager:
 
                 # Clean up expired sessions
                 for session_id in expired:
-                    self.remove_session(session_id)
+                    self.remove_session(session_id, reason="session_expired")
 
                 if expired:
                     logger.info(f"Cleaned up {len(expired)} expired sessions")
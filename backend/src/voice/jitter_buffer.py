@@ -0,0 +1,105 @@
+"""Jitter buffering for upstream voice audio.
+
+Browser chunks arrive as separate HTTP requests, so they can be reordered
+and are often only 10-20ms long. ``ReorderBuffer`` holds a few chunks back
+and releases them in timestamp order; ``FrameAggregator`` packs the
+resampled stream into fixed-duration frames so each upstream message
+carries a useful amount of audio.
+"""
+
+import heapq
+import itertools
+import os
+
+# Upstream frame duration and reorder depth (chunks held back)
+AUDIO_FRAME_MS = int(os.getenv("AUDIO_FRAME_MS", "60"))
+AUDIO_REORDER_DEPTH = int(os.getenv("AUDIO_REORDER_DEPTH", "2"))
+# Partial frames are flushed after this long without new audio
+AUDIO_FLUSH_INTERVAL_MS = int(os.getenv("AUDIO_FLUSH_INTERVAL_MS", "100"))
+
+
+class ReorderBuffer[T]:
+    """Releases items in timestamp order, holding back up to ``depth`` items."""
+
+    def __init__(self, depth: int = AUDIO_REORDER_DEPTH):
+        """
+        Initialize the buffer.
+
+        Args:
+            depth: Items held back to wait for earlier, late-arriving ones
+        """
+        self.depth = depth
+        self._heap: list[tuple[int, int, T]] = []
+        self._arrival = itertools.count()  # tie-breaker for equal timestamps
+        self._released_until: int | None = None
+        self.late_drops = 0
+
+    def __len__(self) -> int:
+        return len(self._heap)
+
+    def push(self, timestamp: int, item: T) -> list[T]:
+        """
+        Add an item and return the items now due, oldest first.
+
+        Items older than one already released can no longer be placed and
+        are dropped (counted in ``late_drops``).
+        """
+        if self._released_until is not None and timestamp < self._released_until:
+            self.late_drops += 1
+            return []
+        heapq.heappush(self._heap, (timestamp, next(self._arrival), item))
+        released = []
+        while len(self._heap) > self.depth:
+            released.append(self._pop())
+        return released
+
+    def drain(self) -> list[T]:
+        """Release everything held, oldest first."""
+        return [self._pop() for _ in range(len(self._heap))]
+
+    def _pop(self) -> T:
+        timestamp, _, item = heapq.heappop(self._heap)
+        self._released_until = timestamp
+        return item
+
+
+class FrameAggregator:
+    """Packs a byte stream into fixed-size frames."""
+
+    def __init__(self, frame_bytes: int):
+        """
+        Initialize the aggregator.
+
+        Args:
+            frame_bytes: Size of every emitted frame except flushed remainders
+        """
+        self.frame_bytes = frame_bytes
+        self._pending = bytearray()
+
+    @classmethod
+    def for_pcm16(
+        cls, sample_rate: int, frame_ms: int = AUDIO_FRAME_MS
+    ) -> "FrameAggregator":
+        """Aggregator for 16-bit mono PCM frames of ``frame_ms``."""
+        return cls(max(2, sample_rate * frame_ms // 1000 * 2))
+
+    @property
+    def pending_bytes(self) -> int:
+        return len(self._pending)
+
+    def push(self, data: bytes) -> list[bytes]:
+        """Add data and return every complete frame."""
+        self._pending += data
+        size = self.frame_bytes
+        full = len(self._pending) - len(self._pending) % size
+        if not full:
+            return []
+        frames = [bytes(self._pending[i : i + size]) for i in range(0, full, size)]
+        del self._pending[:full]
+        return frames
+
+    def flush(self) -> bytes:
+        """Return and clear the partial frame, if any."""
+        remainder = bytes(self._pending)
+        self._pending.clear()
+        return remainder
@@ -4,6 +4,9 @@ from typing import Literal
 
 from pydantic import BaseModel
 
+# Wire encodings of voice audio (see src.utils.audio_codecs)
+AudioEncoding = Literal["pcm", "l16", "pcmu", "pcma"]
+
 
 class CreateVoiceSessionRequest(BaseModel):
     """Request to create a new voice session."""
@@ -22,9 +25,11 @@ class VoiceSessionResponse(BaseModel):
 class AudioChunkRequest(BaseModel):
     """Audio chunk to be processed."""
 
-    data: str  # base64 encoded PCM audio
+    data: str  # base64 encoded audio
     timestamp: int
-    sample_rate: int = 48000  # Audio sample rate (default 48kHz)
+    # Audio sample rate; defaults to 48kHz for PCM, 8kHz G.711, 16kHz L16
+    sample_rate: int | None = None
+    encoding: AudioEncoding = "pcm"  # 16-bit PCM, or G.711 to halve the size
 
 
 class VoiceControlRequest(BaseModel):
@@ -36,7 +41,7 @@ class VoiceControlRequest(BaseModel):
 class VoiceStreamMessage(BaseModel):
     """Message format for SSE stream."""
 
-    type: Literal["audio", "transcript", "turn_complete", "error"]
+    type: Literal["audio", "transcript", "turn_complete", "stop_playback", "error"]
     data: str | None = None
     text: str | None = None
     is_final: bool | None = None
@@ -0,0 +1,180 @@
+"""Outbound agent events: audio coalescing and frame encoding.
+
+The Live API delivers agent speech as many small audio parts. Consecutive
+parts are merged into frames of up to ``AUDIO_COALESCE_MS`` of audio, held
+back at most that long; the first audio of a turn is never held, so
+coalescing does not delay the start of speech. A ``stop_playback`` message
+(queued on barge-in) discards the audio still held and tells the client to
+stop playing the current response.
+
+Frames are then encoded for the transport without building a Pydantic
+model per part:
+
+* SSE: a precomputed JSON envelope around the base64 audio; other messages
+  are compact JSON with the field names of ``VoiceStreamMessage``.
+* Binary stream (negotiated with ``Accept: application/octet-stream``):
+  each frame is a 1-byte kind and a 4-byte big-endian payload length,
+  followed by raw audio (``FRAME_AUDIO``) or a UTF-8 JSON message
+  (``FRAME_MESSAGE``).
+
+Audio is 16-bit PCM unless the client asked for another wire encoding
+(see ``src.utils.audio_codecs``); it is encoded after coalescing.
+"""
+
+import asyncio
+import base64
+import json
+import os
+import struct
+from collections.abc import AsyncIterator, Iterator
+from typing import TYPE_CHECKING, Any, overload
+
+from src.utils.audio_codecs import PCM, encode_audio
+
+if TYPE_CHECKING:
+    from src.voice.session_manager import VoiceSession
+
+# Longest stretch of agent audio merged into one outbound frame
+AUDIO_COALESCE_MS = int(os.getenv("AUDIO_COALESCE_MS", "100"))
+# Agent speech from the Live API is 24kHz 16-bit mono PCM
+AGENT_AUDIO_SAMPLE_RATE = 24000
+
+BINARY_STREAM_MEDIA_TYPE = "application/octet-stream"
+FRAME_AUDIO = 0x01
+FRAME_MESSAGE = 0x02
+_FRAME_HEADER = struct.Struct(">BI")
+
+_SSE_AUDIO_PREFIX = 'data: {"type":"audio","data":"'
+_SSE_AUDIO_SUFFIX = '"}\n\n'
+
+# Agent audio (bytes) or a message for the client
+OutboundItem = bytes | dict[str, Any]
+
+
+def compact_json(message: dict[str, Any]) -> str:
+    """Serialize a message without insignificant whitespace."""
+    return json.dumps(message, separators=(",", ":"))
+
+
+def event_items(event: Any) -> Iterator[OutboundItem]:
+    """Translate an agent queue event into audio and messages, in order."""
+    if isinstance(event, dict):
+        if event.get("type") == "error":
+            yield {"type": "error", "error": event.get("error", "Unknown error")}
+        elif event.get("type") == "stop_playback":
+            yield {"type": "stop_playback"}
+        return
+
+    content = getattr(event, "content", None)
+    for part in getattr(content, "parts", None) or ():
+        inline_data = getattr(part, "inline_data", None)
+        if inline_data:
+            mime_type = getattr(inline_data, "mime_type", "") or ""
+            if mime_type.startswith("audio/") and inline_data.data:
+                yield inline_data.data
+        elif getattr(part, "text", None):
+            yield {
+                "type": "transcript",
+                "text": part.text,
+                "is_final": not getattr(event, "partial", False),
+            }
+    if getattr(event, "turn_complete", False):
+        yield {
+            "type": "turn_complete",
+            "interrupted": bool(getattr(event, "interrupted", False)),
+        }
+
+
+def is_audio_only(event: Any) -> bool:
+    """Whether an agent event carries nothing but audio."""
+    items = list(event_items(event))
+    return bool(items) and all(isinstance(item, bytes) for item in items)
+
+
+async def coalesced_items(
+    session: "VoiceSession", budget_ms: int = AUDIO_COALESCE_MS
+) -> AsyncIterator[OutboundItem]:
+    """Outbound items of a session with consecutive audio merged.
+
+    Runs while the session is active; the consumer should stop after an
+    error message.
+    """
+    max_bytes = max(2, AGENT_AUDIO_SAMPLE_RATE * 2 * budget_ms // 1000)
+    loop = asyncio.get_running_loop()
+    pending = bytearray()
+    deadline = 0.0
+    turn_started = False
+
+    while session.status == "active":
+        if pending:
+            try:
+                event = await asyncio.wait_for(
+                    session.agent_queue.get(), max(0.0, deadline - loop.time())
+                )
+            except TimeoutError:
+                yield bytes(pending)
+                pending.clear()
+                continue
+        else:
+            event = await session.agent_queue.get()
+
+        for item in event_items(event):
+            if isinstance(item, bytes):
+                if not turn_started:
+                    # Start playback as early as possible
+                    turn_started = True
+                    session.record_turn_stage("first_audio")
+                    yield item
+                    continue
+                if not pending:
+                    deadline = loop.time() + budget_ms / 1000
+                pending += item
+                if len(pending) >= max_bytes:
+                    yield bytes(pending)
+                    pending.clear()
+            elif item["type"] == "stop_playback":
+                # Held audio is stale once the user has barged in
+                pending.clear()
+                turn_started = False
+                yield item
+            else:
+                if pending:
+                    yield bytes(pending)
+                    pending.clear()
+                if item["type"] == "turn_complete":
+                    turn_started = False
+                yield item
+
+    if pending:
+        yield bytes(pending)
+
+
+@overload
+def encode_item(item: bytes, encoding: str) -> bytes: ...
+
+
+@overload
+def encode_item(item: dict[str, Any], encoding: str) -> dict[str, Any]: ...
+
+
+def encode_item(item: OutboundItem, encoding: str) -> OutboundItem:
+    """Convert the audio of an outbound item to the client's wire encoding."""
+    if isinstance(item, bytes) and encoding != PCM:
+        return encode_audio(item, encoding)
+    return item
+
+
+def sse_frame(item: OutboundItem) -> str:
+    """Encode an outbound item as an SSE event."""
+    if isinstance(item, bytes):
+        audio = base64.b64encode(item).decode("ascii")
+        return _SSE_AUDIO_PREFIX + audio + _SSE_AUDIO_SUFFIX
+    return f"data: {compact_json(item)}\n\n"
+
+
+def binary_frame(item: OutboundItem) -> bytes:
+    """Encode an outbound item as a length-prefixed binary frame."""
+    if isinstance(item, bytes):
+        return _FRAME_HEADER.pack(FRAME_AUDIO, len(item)) + item
+    payload = compact_json(item).encode()
+    return _FRAME_HEADER.pack(FRAME_MESSAGE, len(payload)) + payload
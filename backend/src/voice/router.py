@@ -2,42 +2,91 @@
 
 import base64
 import logging
+import os
+import time
+from collections.abc import Iterator
 
-from fastapi import APIRouter, HTTPException
+from fastapi import (
+    APIRouter,
+    Header,
+    HTTPException,
+    Query,
+    Request,
+    WebSocket,
+    status,
+)
 from fastapi.responses import StreamingResponse
 
+from src.utils.admission import require_admission
+from src.utils.audio_codecs import L16, PCM, PCMA, PCMU, SAMPLE_WIDTHS, decode_audio
+from src.utils.audio_converter import AudioConverter
+from src.utils.performance_monitor import get_performance_monitor
 from src.voice.models import (
     AudioChunkRequest,
+    AudioEncoding,
     CreateVoiceSessionRequest,
     VoiceControlRequest,
     VoiceSessionResponse,
 )
-from src.voice.session_manager import voice_session_manager
+from src.voice.outbound import BINARY_STREAM_MEDIA_TYPE
+from src.voice.session_manager import (
+    MAX_AUDIO_CHUNK_BYTES,
+    voice_session_manager,
+)
 from src.voice.stream_handler import create_voice_stream
+from src.voice.websocket_handler import serve_voice_websocket
 
 logger = logging.getLogger(__name__)
 
 router = APIRouter(prefix="/api/voice", tags=["voice"])
 
+# Largest raw audio body accepted by one upload, in wire bytes (about 11
+# seconds of 48kHz PCM by default)
+MAX_RAW_AUDIO_BYTES = int(os.getenv("MAX_RAW_AUDIO_BYTES", str(1024 * 1024)))
+
+# Content types accepted for raw audio uploads, by wire encoding
+RAW_AUDIO_ENCODINGS = {
+    "application/octet-stream": PCM,
+    "audio/l16": L16,
+    "audio/pcmu": PCMU,
+    "audio/basic": PCMU,
+    "audio/pcma": PCMA,
+}
+
+# Browser capture rate, assumed for PCM uploads that do not give one
+DEFAULT_PCM_SAMPLE_RATE = 48000
+
+
+def default_sample_rate(encoding: str) -> int:
+    """Rate assumed for audio of ``encoding`` that does not state one.
+
+    G.711 and L16 follow the RFC 3551 defaults used by AudioConverter.
+    """
+    return AudioConverter.DEFAULT_CODEC_RATES.get(encoding, DEFAULT_PCM_SAMPLE_RATE)
+
 
 @router.post("/sessions", response_model=VoiceSessionResponse)
 async def create_voice_session(
     request: CreateVoiceSessionRequest,
 ) -> VoiceSessionResponse:
-    """Create a new voice session with ADK streaming."""
-    try:
-        session = await voice_session_manager.create_session(request.language)
+    """Create a new voice session with ADK streaming.
 
-        return VoiceSessionResponse(
-            session_id=session.session_id,
-            status=session.status,  # type: ignore
-            language=session.language,
-        )
-    except Exception as e:
-        logger.error("Failed to create voice session: %s", str(e))
-        raise HTTPException(
-            status_code=500, detail="Failed to create voice session"
-        ) from e
+    Refused with 503 and ``Retry-After`` while the server is overloaded.
+    """
+    async with require_admission("voice"):
+        try:
+            session = await voice_session_manager.create_session(request.language)
+        except Exception as e:
+            logger.error("Failed to create voice session: %s", str(e))
+            raise HTTPException(
+                status_code=500, detail="Failed to create voice session"
+            ) from e
+
+    return VoiceSessionResponse(
+        session_id=session.session_id,
+        status=session.status,  # type: ignore
+        language=session.language,
+    )
 
 
 @router.post("/sessions/{session_id}/audio")
@@ -51,11 +100,16 @@ async def send_audio_chunk(session_id: str, audio: AudioChunkRequest):
         raise HTTPException(status_code=400, detail="Session is not active")
 
     try:
-        # Decode base64 audio
-        audio_data = base64.b64decode(audio.data)
+        # Decode base64 audio, then its wire encoding to PCM
+        start = time.perf_counter()
+        audio_data = decode_audio(base64.b64decode(audio.data), audio.encoding)
+        get_performance_monitor().record_voice_latency(
+            "decode", time.perf_counter() - start
+        )
 
         # Send to ADK with sample rate
-        await session.send_audio(audio_data, audio.sample_rate)
+        sample_rate = audio.sample_rate or default_sample_rate(audio.encoding)
+        await session.send_audio(audio_data, sample_rate, timestamp=audio.timestamp)
 
         return {"status": "received"}
     except Exception as e:
@@ -63,16 +117,145 @@ async def send_audio_chunk(session_id: str, audio: AudioChunkRequest):
         raise HTTPException(status_code=500, detail="Failed to process audio") from e
 
 
+class _AudioBodyTooLargeError(Exception):
+    """A raw audio body went over MAX_RAW_AUDIO_BYTES."""
+
+
+async def _read_raw_audio(request: Request) -> bytes:
+    """Read a sized or chunked raw audio body.
+
+    The body is read completely before any of it is forwarded, so a
+    rejected upload never leaves partial audio upstream. A body that
+    arrives in one piece is returned without a copy.
+
+    Raises:
+        _AudioBodyTooLargeError: The body exceeds MAX_RAW_AUDIO_BYTES
+    """
+    pieces: list[bytes] = []
+    size = 0
+    async for piece in request.stream():
+        size += len(piece)
+        if size > MAX_RAW_AUDIO_BYTES:
+            raise _AudioBodyTooLargeError
+        pieces.append(piece)
+    return b"".join(pieces)
+
+
+def _raw_audio_chunks(body: bytes, encoding: str = PCM) -> Iterator[bytes | memoryview]:
+    """Split a raw audio body into PCM chunks for the session.
+
+    PCM pieces are memoryviews of the body (no copy), other encodings are
+    decoded to PCM first; each chunk is at most MAX_AUDIO_CHUNK_BYTES of PCM.
+
+    Raises:
+        ValueError: The body ends mid-sample
+    """
+    width = SAMPLE_WIDTHS[encoding]
+    if len(body) % width:
+        raise ValueError("Audio data length must be even for 16-bit PCM format")
+    step = MAX_AUDIO_CHUNK_BYTES * width // 2
+    view = memoryview(body)
+    for start in range(0, len(view), step):
+        yield decode_audio(view[start : start + step], encoding)
+
+
+@router.post("/sessions/{session_id}/audio/raw")
+async def send_raw_audio(
+    session_id: str,
+    request: Request,
+    content_type: str = Header(default="application/octet-stream"),
+    x_sample_rate: int | None = Header(default=None, gt=0),
+    x_sequence: int | None = Header(default=None, ge=0),
+    x_timestamp: int | None = Header(default=None),
+):
+    """Send raw mono audio to an active voice session.
+
+    The body is little-endian 16-bit PCM (no JSON or base64), or with
+    ``Content-Type: audio/L16``, ``audio/PCMU`` or ``audio/PCMA`` big-endian
+    PCM or G.711. The sample rate comes from ``X-Sample-Rate``, else the
+    Content-Type ``rate`` parameter (``audio/L16;rate=24000``), else the
+    encoding's default (48kHz PCM, 8kHz G.711, 16kHz L16).
+
+    ``X-Sequence`` lets retried uploads be dropped instead of replayed, and
+    ``X-Timestamp`` (capture time) puts reordered uploads back in order.
+    Bodies over ``MAX_RAW_AUDIO_BYTES`` are refused with 413.
+    """
+    base_type, params = AudioConverter.parse_mime_type(content_type)
+    encoding = RAW_AUDIO_ENCODINGS.get(base_type)
+    if encoding is None:
+        raise HTTPException(
+            status_code=415,
+            detail="Expected application/octet-stream, audio/L16, audio/PCMU "
+            "or audio/PCMA",
+        )
+    if params.get("channels", "1") != "1":
+        raise HTTPException(status_code=400, detail="Only mono audio is supported")
+    sample_rate = x_sample_rate
+    if sample_rate is None:
+        rate = params.get("rate")
+        if rate is None:
+            sample_rate = default_sample_rate(encoding)
+        elif rate.isdigit() and int(rate) > 0:
+            sample_rate = int(rate)
+        else:
+            raise HTTPException(status_code=400, detail="Invalid rate parameter")
+
+    session = voice_session_manager.get_session(session_id)
+    if not session:
+        raise HTTPException(status_code=404, detail="Session not found")
+
+    if session.status != "active":
+        raise HTTPException(status_code=400, detail="Session is not active")
+
+    content_length = request.headers.get("content-length", "")
+    if content_length.isdigit() and int(content_length) > MAX_RAW_AUDIO_BYTES:
+        raise HTTPException(status_code=413, detail="Audio body too large")
+
+    if x_sequence is not None and not session.accept_audio_sequence(x_sequence):
+        return {"status": "duplicate", "sequence": x_sequence}
+
+    forwarded = False
+    try:
+        body = await _read_raw_audio(request)
+        for pcm in _raw_audio_chunks(body, encoding):
+            await session.send_audio(pcm, sample_rate, timestamp=x_timestamp)
+            forwarded = True
+    except _AudioBodyTooLargeError as e:
+        raise HTTPException(status_code=413, detail="Audio body too large") from e
+    except ValueError as e:
+        raise HTTPException(status_code=400, detail=str(e)) from e
+    except Exception as e:
+        logger.error("Failed to process raw audio: %s", str(e))
+        raise HTTPException(status_code=500, detail="Failed to process audio") from e
+    finally:
+        # A failed upload is not a duplicate: let the client's retry through,
+        # unless part of it went upstream and a retry would replay that part
+        if x_sequence is not None and not forwarded:
+            session.release_audio_sequence(x_sequence)
+
+    return {"status": "received", "bytes": len(body), "sequence": x_sequence}
+
+
 @router.get("/sessions/{session_id}/stream")
-async def voice_stream(session_id: str):
-    """SSE endpoint for voice responses."""
+async def voice_stream(
+    session_id: str,
+    accept: str | None = Header(default=None),
+    encoding: AudioEncoding = Query(default="pcm"),
+):
+    """SSE endpoint for voice responses.
+
+    Clients accepting ``application/octet-stream`` get length-prefixed
+    binary frames with raw audio instead of base64 SSE events. Agent audio
+    is 24kHz 16-bit PCM, or G.711/L16 at the same rate per ``encoding``.
+    """
     session = voice_session_manager.get_session(session_id)
     if not session:
         raise HTTPException(status_code=404, detail="Session not found")
 
+    binary = BINARY_STREAM_MEDIA_TYPE in (accept or "")
     return StreamingResponse(
-        create_voice_stream(session),
-        media_type="text/event-stream",
+        create_voice_stream(session, binary=binary, encoding=encoding),
+        media_type=BINARY_STREAM_MEDIA_TYPE if binary else "text/event-stream",
         headers={
             "Cache-Control": "no-cache",
             "Connection": "keep-alive",
@@ -81,6 +264,30 @@ async def voice_stream(session_id: str):
     )
 
 
+@router.websocket("/sessions/{session_id}/ws")
+async def voice_websocket(
+    websocket: WebSocket,
+    session_id: str,
+    sample_rate: int | None = Query(default=None, gt=0),
+    encoding: AudioEncoding = Query(default="pcm"),
+):
+    """Full-duplex voice: binary audio and JSON control frames both ways.
+
+    Without ``sample_rate``, inbound audio is assumed to be at the
+    encoding's default rate.
+    """
+    session = voice_session_manager.get_session(session_id)
+    if not session or session.status != "active":
+        await websocket.close(
+            code=status.WS_1008_POLICY_VIOLATION, reason="Session not found"
+        )
+        return
+
+    await serve_voice_websocket(
+        websocket, session, sample_rate or default_sample_rate(encoding), encoding
+    )
+
+
 @router.post("/sessions/{session_id}/control")
 async def voice_control(session_id: str, control: VoiceControlRequest):
     """Send control commands to voice session."""
@@ -2,20 +2,51 @@
 
 import asyncio
 import logging
+import os
 import time
 from typing import Any
 from uuid import uuid4
 
-import numpy as np
 from google.adk.agents.run_config import RunConfig
 from google.adk.runners import InMemoryRunner, LiveRequestQueue
 from google.genai.types import Blob, SpeechConfig
-from scipy import signal
 
 from src.agents.cbt_assistant import create_cbt_assistant
+from src.utils.audio_executor import run_audio
+from src.utils.language_utils import DEFAULT_LANGUAGE
+from src.utils.performance_monitor import get_performance_monitor
+from src.utils.resampler import StreamingResampler
+from src.voice.jitter_buffer import (
+    AUDIO_FLUSH_INTERVAL_MS,
+    FrameAggregator,
+    ReorderBuffer,
+)
+from src.voice.outbound import event_items, is_audio_only
+from src.voice.vad import VAD_END_TURN, VOICE_VAD_ENABLED, VoiceActivityDetector
 
 logger = logging.getLogger(__name__)
 
+# Largest PCM chunk accepted by a single send_audio call
+MAX_AUDIO_CHUNK_BYTES = 65536
+# How far behind the newest audio sequence number an upload may arrive
+AUDIO_SEQUENCE_WINDOW = 64
+
+# Stages of an agent turn timed from the end of the user's speech
+TURN_STAGES = frozenset({"first_agent_event", "first_audio", "turn_complete"})
+
+# Drop queued agent audio when the user talks over the assistant
+VOICE_BARGE_IN = os.getenv("VOICE_BARGE_IN", "1") in ("1", "true", "True", "TRUE")
+
+# Prewarmed sessions kept ready per language (0 disables the pool). Only the
+# default language is prewarmed unless more are listed, e.g.
+# VOICE_POOL_LANGUAGES="en-US,es-ES"; each one holds live API connections.
+VOICE_POOL_SIZE = int(os.getenv("VOICE_POOL_SIZE", "1"))
+VOICE_POOL_LANGUAGES = [
+    language.strip()
+    for language in os.getenv("VOICE_POOL_LANGUAGES", DEFAULT_LANGUAGE).split(",")
+    if language.strip()
+]
+
 
 class VoiceSession:
     """Manages a single voice streaming session."""
@@ -37,6 +68,39 @@ class VoiceSession:
         self.live_events: Any | None = None
         self.agent_queue: asyncio.Queue = asyncio.Queue()  # Responses from agent
         self.stream_task: asyncio.Task | None = None
+        # Agent audio of the current turn has been queued for the client
+        self._agent_speaking = False
+        # Turn latency is measured from the end of the user's speech; stages
+        # still to be timed for that turn
+        self._turn_input_at = 0.0
+        self._pending_stages: set[str] = set()
+        # Without voice activity detection the first frame after the agent's
+        # turn starts the timer; such an estimate gives way to a real end of
+        # speech until a stage was timed
+        self._turn_timer_armed = True
+        self._turn_timer_estimated = False
+
+        # Input resampling keeps filter state across chunks of this session
+        self._resampler: StreamingResampler | None = None
+        # Highest audio sequence number accepted from the client, and the
+        # recent ones (uploads may arrive out of order)
+        self.last_audio_sequence = -1
+        self._recent_sequences: set[int] = set()
+
+        # Upstream audio is reordered by client timestamp, then packed into
+        # fixed-duration frames; a timer flushes partial frames
+        self._reorder: ReorderBuffer[tuple[bytes | memoryview, int]] = ReorderBuffer()
+        self._framer = FrameAggregator.for_pcm16(16000)
+        self._flush_task: asyncio.Task | None = None
+        self._last_audio_at = 0.0
+        self.upstream_messages = 0
+        # Optional silence suppression on the resampled stream
+        self._vad: VoiceActivityDetector | None = (
+            VoiceActivityDetector() if VOICE_VAD_ENABLED else None
+        )
+        # Serializes the session's DSP state (resampler, VAD, framer) while
+        # it is used from the audio executor
+        self._dsp_lock = asyncio.Lock()
 
     async def initialize(self):
         """Initialize ADK components for streaming."""
@@ -92,12 +156,25 @@ class VoiceSession:
         try:
             # Stream events from ADK live
             async for event in self.live_events:
+                # The model stopped because the user started speaking
+                if VOICE_BARGE_IN and getattr(event, "interrupted", False):
+                    self.interrupt_playback()
+
                 # Put events in agent queue for SSE delivery
                 await self.agent_queue.put(event)
                 self.last_activity = time.time()
+                self.record_turn_stage("first_agent_event")
+                if any(isinstance(item, bytes) for item in event_items(event)):
+                    self._agent_speaking = True
 
                 # Check if turn is complete
                 if hasattr(event, "turn_complete") and event.turn_complete:
+                    # No audio of this turn is left for the client to play
+                    if not self._agent_speaking:
+                        self._pending_stages.discard("first_audio")
+                    self._agent_speaking = False
+                    self.record_turn_stage("turn_complete")
+                    self._turn_timer_armed = True
                     logger.debug(f"Turn complete in session {self.session_id}")
 
         except Exception as e:
@@ -106,13 +183,47 @@ class VoiceSession:
         finally:
             self.status = "ended"
 
+    def accept_audio_sequence(self, sequence: int) -> bool:
+        """Record a client sequence number; False for duplicates and replays.
+
+        Numbers within AUDIO_SEQUENCE_WINDOW of the highest one may arrive
+        in any order; anything older is treated as a replay.
+        """
+        oldest = self.last_audio_sequence - AUDIO_SEQUENCE_WINDOW
+        if sequence <= oldest or sequence in self._recent_sequences:
+            return False
+        self._recent_sequences.add(sequence)
+        if sequence > self.last_audio_sequence:
+            self.last_audio_sequence = sequence
+            oldest = sequence - AUDIO_SEQUENCE_WINDOW
+            self._recent_sequences = {n for n in self._recent_sequences if n > oldest}
+        return True
+
+    def release_audio_sequence(self, sequence: int) -> None:
+        """Forget an accepted sequence number so a retry is processed again.
+
+        Used when an upload fails after its number was recorded.
+        """
+        self._recent_sequences.discard(sequence)
+
+    @staticmethod
+    def _check_chunk(audio_data: bytes | memoryview) -> None:
+        """Reject chunks that are not whole 16-bit samples or are too large."""
+        if len(audio_data) % 2 != 0:
+            raise ValueError("Audio data length must be even for 16-bit PCM format")
+
+        # Enforce size limit (64KB per chunk)
+        if len(audio_data) > MAX_AUDIO_CHUNK_BYTES:
+            raise ValueError(f"Audio chunk exceeds {MAX_AUDIO_CHUNK_BYTES} bytes limit")
+
     def _convert_audio_to_16khz(
-        self, audio_data: bytes, input_sample_rate: int = 48000
+        self, audio_data: bytes | memoryview, input_sample_rate: int = 48000
     ) -> bytes:
         """Convert audio from input sample rate to 16kHz for Google Live API.
 
         Args:
-            audio_data: Raw PCM audio data (16-bit signed integers)
+            audio_data: Raw PCM audio data (16-bit signed integers), read
+                without copying when given as a memoryview
             input_sample_rate: Input sample rate (default 48000 Hz)
 
         Returns:
@@ -121,71 +232,281 @@ class VoiceSession:
         # Validate audio data
         if not audio_data:
             return b""
-
-        if len(audio_data) % 2 != 0:
-            raise ValueError("Audio data length must be even for 16-bit PCM format")
-
-        # Enforce size limit (64KB per chunk)
-        max_chunk_size = 65536
-        if len(audio_data) > max_chunk_size:
-            raise ValueError(f"Audio chunk exceeds {max_chunk_size} bytes limit")
-
-        # Convert bytes to numpy array (assuming 16-bit signed PCM)
-        audio_array = np.frombuffer(audio_data, dtype=np.int16)
+        self._check_chunk(audio_data)
 
         # If already at target sample rate, return as-is
         if input_sample_rate == 16000:
-            return audio_data
-
-        # Calculate resampling ratio
-        resample_ratio = 16000 / input_sample_rate
-        num_output_samples = int(len(audio_array) * resample_ratio)
+            return bytes(audio_data)
 
-        # Resample using scipy with error handling
-        try:
-            resampled = signal.resample(audio_array, num_output_samples)
-        except Exception as e:
-            logger.error(f"Audio resampling failed in session {self.session_id}: {e}")
-            raise ValueError("Audio resampling failed") from e
+        # Reuse the session's resampler so chunks join without edge artifacts
+        resampler = self._resampler
+        if resampler is None or resampler.in_rate != input_sample_rate:
+            try:
+                resampler = StreamingResampler(input_sample_rate, 16000)
+            except ValueError as e:
+                logger.error(
+                    f"Audio resampling failed in session {self.session_id}: {e}"
+                )
+                raise ValueError("Audio resampling failed") from e
+            self._resampler = resampler
 
-        # Convert back to int16
-        resampled_int16 = np.clip(resampled, -32768, 32767).astype(np.int16)
+        resampled = resampler.process_pcm16(audio_data)
 
         logger.debug(
             f"Resampled audio from {input_sample_rate}Hz to 16000Hz "
-            f"({len(audio_data)} bytes -> {len(resampled_int16) * 2} bytes)"
+            f"({len(audio_data)} bytes -> {len(resampled)} bytes)"
         )
 
-        return bytes(resampled_int16.tobytes())
+        return resampled
 
-    async def send_audio(self, audio_data: bytes, input_sample_rate: int = 48000):
+    async def send_audio(
+        self,
+        audio_data: bytes | memoryview,
+        input_sample_rate: int = 48000,
+        timestamp: int | None = None,
+    ):
         """Send audio chunk to ADK.
 
+        Conversion runs on the audio executor; the event loop only waits
+        for the finished frames.
+
         Args:
             audio_data: Raw PCM audio data
             input_sample_rate: Sample rate of the input audio (default 48kHz)
+            timestamp: Client capture time; chunks carrying one are reordered
+                before conversion. A chunk without one first releases
+                everything held back, so arrival order is kept.
         """
         if self.status != "active" or not self.live_request_queue:
             raise RuntimeError("Session not active")
 
         try:
-            # Convert audio to 16kHz for Google Live API
-            converted_audio = self._convert_audio_to_16khz(
-                audio_data, input_sample_rate=input_sample_rate
+            received = time.perf_counter()
+            self._check_chunk(audio_data)
+            # Chunks are released and converted in order under the lock
+            async with self._dsp_lock:
+                if timestamp is None:
+                    chunks = [
+                        *self._reorder.drain(),
+                        (audio_data, input_sample_rate),
+                    ]
+                else:
+                    chunks = self._reorder.push(
+                        timestamp, (audio_data, input_sample_rate)
+                    )
+                speech_ended = await self._queue_audio(chunks)
+            get_performance_monitor().record_voice_latency(
+                "enqueue", time.perf_counter() - received
             )
+            if speech_ended and VAD_END_TURN:
+                await self._end_turn()
 
-            # For audio streaming, send blob directly using send_realtime
-            # as per ADK streaming documentation
-            audio_blob = Blob(mime_type="audio/pcm", data=converted_audio)
-
-            # Send to ADK via live request queue using send_realtime for audio
-            self.live_request_queue.send_realtime(audio_blob)
             self.last_activity = time.time()
+            self._last_audio_at = time.monotonic()
+            # The flush timer only runs while audio is held back
+            if self._has_buffered_audio() and (
+                self._flush_task is None or self._flush_task.done()
+            ):
+                self._flush_task = asyncio.create_task(self._flush_loop())
 
         except Exception as e:
             logger.error(f"Error processing audio in session {self.session_id}: {e}")
             raise
 
+    async def _queue_audio(
+        self, chunks: list[tuple[bytes | memoryview, int]], flush: bool = False
+    ) -> bool:
+        """Convert chunks to 16kHz and send every frame they complete.
+
+        Must be called with ``_dsp_lock`` held.
+
+        Returns:
+            True if voice activity detection saw the end of speech
+        """
+        vad = self._vad
+        if vad is not None:
+            passed, suppressed = vad.passed_bytes, vad.suppressed_bytes
+            starts = vad.speech_starts
+        frames, speech_ended, resample_time = await run_audio(
+            self._process_audio, chunks, flush
+        )
+        monitor = get_performance_monitor()
+        if chunks:
+            monitor.record_voice_latency("resample", resample_time)
+        if vad is not None:
+            monitor.record_voice_activity(
+                vad.passed_bytes - passed,
+                vad.suppressed_bytes - suppressed,
+                speech_ended,
+            )
+            # The user started talking over the assistant
+            if VOICE_BARGE_IN and self._agent_speaking and vad.speech_starts > starts:
+                self.interrupt_playback()
+        # LiveRequestQueue is not thread-safe, so frames go out from the loop
+        for frame in frames:
+            self._send_frame(frame)
+        if frames and vad is None and self._turn_timer_armed:
+            self._start_turn_timer(estimated=True)
+        if speech_ended:
+            self._start_turn_timer()
+        return speech_ended
+
+    def _process_audio(
+        self, chunks: list[tuple[bytes | memoryview, int]], flush: bool
+    ) -> tuple[list[bytes], bool, float]:
+        """Resample, filter and frame chunks (runs on the audio executor).
+
+        Args:
+            chunks: Audio chunks with their sample rates, in stream order
+            flush: Also emit held and partially framed audio
+
+        Returns:
+            The complete upstream frames, whether speech ended, and the
+            time spent resampling (seconds)
+        """
+        frames: list[bytes] = []
+        speech_ended = False
+        resample_time = 0.0
+        vad = self._vad
+        for audio_data, sample_rate in chunks:
+            # Convert audio to 16kHz for Google Live API
+            start = time.perf_counter()
+            converted_audio = self._convert_audio_to_16khz(
+                audio_data, input_sample_rate=sample_rate
+            )
+            resample_time += time.perf_counter() - start
+            if vad is not None:
+                converted_audio, ended = vad.process(converted_audio)
+                speech_ended |= ended
+            frames.extend(self._framer.push(converted_audio))
+        if flush:
+            if vad is not None:
+                frames.extend(self._framer.push(vad.flush()))
+            remainder = self._framer.flush()
+            if remainder:
+                frames.append(remainder)
+        return frames, speech_ended, resample_time
+
+    def _send_frame(self, frame: bytes) -> None:
+        if not self.live_request_queue:
+            return
+        # For audio streaming, send blob directly using send_realtime
+        # as per ADK streaming documentation
+        audio_blob = Blob(mime_type="audio/pcm", data=frame)
+        self.live_request_queue.send_realtime(audio_blob)
+        self.upstream_messages += 1
+
+    def _start_turn_timer(self, estimated: bool = False) -> None:
+        """Start timing the agent's response at the end of the user's speech.
+
+        The timer is left alone while the agent speaks or stages of the
+        previous turn are still pending, so a continuously streaming
+        microphone does not reset it.
+
+        Args:
+            estimated: The end of speech is guessed from the first frame
+                after the agent's turn (no voice activity detection)
+        """
+        if self._agent_speaking:
+            return
+        if self._pending_stages and (
+            estimated
+            or not self._turn_timer_estimated
+            or self._pending_stages != TURN_STAGES
+        ):
+            return
+        self._turn_input_at = time.perf_counter()
+        self._pending_stages = set(TURN_STAGES)
+        self._turn_timer_estimated = estimated
+        self._turn_timer_armed = False
+
+    def record_turn_stage(self, stage: str) -> None:
+        """Record when a turn first reached ``stage``, timed from its user audio.
+
+        Each stage is recorded once per turn, from the end of the user's
+        speech: voice activity detection, an ``end_turn`` control, or else
+        the first frame after the agent's previous turn.
+        """
+        if stage not in self._pending_stages:
+            return
+        self._pending_stages.discard(stage)
+        elapsed = time.perf_counter() - self._turn_input_at
+        monitor = get_performance_monitor()
+        if stage == "first_audio":
+            monitor.record_time_to_first_audio(self.session_id, elapsed)
+        else:
+            monitor.record_voice_latency(stage, elapsed)
+
+    def interrupt_playback(self) -> int:
+        """Drop agent audio still queued for the client and stop its playback.
+
+        Transcripts and other messages stay queued; a ``stop_playback``
+        message follows them so the transport also discards audio it holds
+        and the client stops playing.
+
+        Returns:
+            Number of audio events dropped
+        """
+        kept = []
+        dropped = 0
+        while not self.agent_queue.empty():
+            event = self.agent_queue.get_nowait()
+            if is_audio_only(event):
+                dropped += 1
+            else:
+                kept.append(event)
+        for event in kept:
+            self.agent_queue.put_nowait(event)
+        self.agent_queue.put_nowait({"type": "stop_playback"})
+        self._agent_speaking = False
+        logger.info(
+            f"Barge-in in session {self.session_id}: "
+            f"dropped {dropped} queued audio events"
+        )
+        return dropped
+
+    async def flush_audio(self) -> None:
+        """Send all held and partially framed audio now."""
+        async with self._dsp_lock:
+            await self._queue_audio(self._reorder.drain(), flush=True)
+
+    def _has_buffered_audio(self) -> bool:
+        """Whether chunks are held for reordering or a frame is incomplete."""
+        return bool(len(self._reorder) or self._framer.pending_bytes)
+
+    async def _flush_loop(self):
+        """Flush buffered audio once the client pauses sending.
+
+        Ends when nothing is buffered any more; send_audio restarts it.
+        """
+        interval = AUDIO_FLUSH_INTERVAL_MS / 1000
+        while self.status == "active" and self._has_buffered_audio():
+            await asyncio.sleep(interval)
+            if time.monotonic() - self._last_audio_at < interval:
+                continue
+            try:
+                await self.flush_audio()
+            except Exception as e:
+                logger.error(f"Audio flush failed in session {self.session_id}: {e}")
+
+    async def _end_turn(self) -> None:
+        """Send all buffered audio and tell the API the audio stream paused."""
+        # Nothing of the turn may stay behind in the jitter buffer
+        await self.flush_audio()
+        self._start_turn_timer()
+        if not self.live_request_queue:
+            return
+        # For multi-turn support, we should NOT close the queue; an audio
+        # stream end only makes the API flush and respond without waiting
+        # for its own silence detection. Older google-adk releases lack it
+        # and leave end of speech to that silence detection.
+        send_stream_end = getattr(
+            self.live_request_queue, "send_audio_stream_end", None
+        )
+        if send_stream_end is not None:
+            send_stream_end()
+        logger.info(f"Turn ended for session {self.session_id}")
+
     async def send_control(self, action: str):
         """Send control command.
 
@@ -194,11 +515,7 @@ class VoiceSession:
                    'end_session' (terminates session)
         """
         if action == "end_turn" and self.live_request_queue:
-            # For multi-turn support, we should NOT close the queue
-            # Instead, just log that the turn ended
-            # The API will detect end of speech via silence
-            logger.info(f"Turn ended for session {self.session_id}")
-            # TODO: When ADK supports explicit turn signals, implement here
+            await self._end_turn()
         elif action == "end_session":
             await self.cleanup()
         else:
@@ -212,9 +529,11 @@ class VoiceSession:
 
         self.status = "ended"
 
-        # Cancel streaming task
+        # Cancel streaming and audio flush tasks
         if self.stream_task and not self.stream_task.done():
             self.stream_task.cancel()
+        if self._flush_task and not self._flush_task.done():
+            self._flush_task.cancel()
 
         # Clear queue
         while not self.agent_queue.empty():
@@ -231,46 +550,123 @@ class VoiceSession:
 
 
 class VoiceSessionManager:
-    """Manages all voice sessions."""
-
-    def __init__(self):
+    """Manages all voice sessions.
+
+    Creating a session builds the agent, runner and ADK session and sets up
+    the live run, which users would wait for on every new conversation. A
+    pool of such sessions, initialized but not yet streaming, is kept per
+    language and refilled in the background; ``create_session`` claims one
+    and only has to start the stream.
+    """
+
+    def __init__(
+        self,
+        pool_size: int = VOICE_POOL_SIZE,
+        pool_languages: list[str] | None = None,
+    ):
         self.sessions: dict[str, VoiceSession] = {}
         self._cleanup_task: asyncio.Task | None = None
 
+        # Prewarmed sessions by language, not yet handed out
+        self.pool_size = pool_size
+        self.pool_languages = (
+            VOICE_POOL_LANGUAGES if pool_languages is None else pool_languages
+        )
+        self._pool: dict[str, list[VoiceSession]] = {}
+        self._pool_task: asyncio.Task | None = None
+        self._pool_wanted = asyncio.Event()
+
     async def start(self):
         """Start the session manager."""
         self._cleanup_task = asyncio.create_task(self._cleanup_inactive_sessions())
+        if self.pool_size > 0 and self.pool_languages:
+            self._pool_task = asyncio.create_task(self._refill_pool())
         logger.info("Voice session manager started")
 
     async def stop(self):
         """Stop the session manager."""
         if self._cleanup_task:
             self._cleanup_task.cancel()
+        if self._pool_task:
+            self._pool_task.cancel()
 
-        # Clean up all sessions
+        # Clean up all sessions, including unclaimed prewarmed ones
         for session in list(self.sessions.values()):
             await session.cleanup()
+        for pool in self._pool.values():
+            for session in pool:
+                await session.cleanup()
+        self._pool.clear()
 
         logger.info("Voice session manager stopped")
 
     async def create_session(self, language: str = "en-US") -> VoiceSession:
-        """Create a new voice session."""
-        session_id = f"voice-{uuid4()}"
-        session = VoiceSession(session_id, language)
+        """Create a new voice session, from the prewarmed pool when possible."""
+        start = time.perf_counter()
+        session = self._claim_prewarmed(language)
+        pooled = session is not None
+        if session is None:
+            session = VoiceSession(f"voice-{uuid4()}", language)
+            # Initialize ADK components
+            await session.initialize()
+        else:
+            session.created_at = session.last_activity = time.time()
 
-        # Initialize ADK components
-        await session.initialize()
         await session.start_streaming()
 
-        self.sessions[session_id] = session
-        logger.info(f"Created voice session {session_id}")
+        self.sessions[session.session_id] = session
+        get_performance_monitor().record_voice_session_created(
+            time.perf_counter() - start, pooled
+        )
+        logger.info(
+            f"Created voice session {session.session_id}"
+            f"{' from the prewarmed pool' if pooled else ''}"
+        )
 
         return session
 
+    def pool_sizes(self) -> dict[str, int]:
+        """Number of prewarmed sessions ready per language."""
+        return {language: len(pool) for language, pool in self._pool.items()}
+
+    def _claim_prewarmed(self, language: str) -> VoiceSession | None:
+        pool = self._pool.get(language)
+        if not pool:
+            if language in self.pool_languages:
+                self._pool_wanted.set()
+            return None
+        self._pool_wanted.set()
+        return pool.pop()
+
+    async def _refill_pool(self):
+        """Keep ``pool_size`` prewarmed sessions per language."""
+        while True:
+            try:
+                self._pool_wanted.clear()
+                for language in self.pool_languages:
+                    pool = self._pool.setdefault(language, [])
+                    while len(pool) < self.pool_size:
+                        session = VoiceSession(f"voice-{uuid4()}", language)
+                        await session.initialize()
+                        pool.append(session)
+                # Sleep until a claim takes a session
+                await self._pool_wanted.wait()
+
+            except asyncio.CancelledError:
+                break
+            except Exception as e:
+                # Retry on the next claim instead of spinning on the failure
+                logger.error(f"Error prewarming voice sessions: {e}")
+                await self._pool_wanted.wait()
+
     def get_session(self, session_id: str) -> VoiceSession | None:
         """Get an existing session."""
         return self.sessions.get(session_id)
 
+    def get_active_session_count(self) -> int:
+        """Get the number of sessions handed out (prewarmed ones excluded)."""
+        return len(self.sessions)
+
     async def remove_session(self, session_id: str):
         """Remove and cleanup a session."""
         session = self.sessions.pop(session_id, None)
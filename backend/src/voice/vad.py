@@ -0,0 +1,144 @@
+"""Energy/zero-crossing voice activity detection for upstream audio.
+
+Long pauses while the user thinks are mostly silence, yet every byte of it
+was sent to the Live API. The detector classifies 20ms frames of the 16kHz
+stream, keeps speech plus a hangover tail, thins out the remaining silence
+and reports when speech has ended so the turn can be closed early.
+"""
+
+import os
+
+import numpy as np
+
+VOICE_VAD_ENABLED = os.getenv("VOICE_VAD_ENABLED", "0") in (
+    "1",
+    "true",
+    "True",
+    "TRUE",
+)
+VAD_THRESHOLD_DBFS = float(os.getenv("VAD_THRESHOLD_DBFS", "-45"))
+VAD_HANGOVER_MS = int(os.getenv("VAD_HANGOVER_MS", "300"))
+# Keep one in N silent frames so the model still hears the pause (0 drops all)
+VAD_SILENCE_KEEP_EVERY = int(os.getenv("VAD_SILENCE_KEEP_EVERY", "4"))
+VAD_END_TURN = os.getenv("VAD_END_TURN", "1") in ("1", "true", "True", "TRUE")
+
+VAD_FRAME_MS = 20
+# Quiet frames still count as speech when they are noisy like fricatives
+_ZCR_MARGIN_DB = 6.0
+_ZCR_SPEECH_MIN = 0.25
+_FULL_SCALE_POWER = 32768.0**2
+
+
+class VoiceActivityDetector:
+    """Stateful frame classifier over a 16-bit mono PCM stream."""
+
+    def __init__(
+        self,
+        sample_rate: int = 16000,
+        threshold_dbfs: float = VAD_THRESHOLD_DBFS,
+        hangover_ms: int = VAD_HANGOVER_MS,
+        silence_keep_every: int = VAD_SILENCE_KEEP_EVERY,
+    ):
+        """
+        Initialize the detector.
+
+        Args:
+            sample_rate: Sample rate of the analyzed stream
+            threshold_dbfs: Frame energy above which a frame is speech
+            hangover_ms: Audio kept after the last speech frame
+            silence_keep_every: Keep one in this many silent frames (0: none)
+        """
+        self.frame_samples = sample_rate * VAD_FRAME_MS // 1000
+        self.threshold_dbfs = threshold_dbfs
+        self.hangover_frames = hangover_ms // VAD_FRAME_MS
+        self.silence_keep_every = silence_keep_every
+
+        self._pending = b""
+        # Frames since the last speech frame (start as long-silent)
+        self._since_speech = self.hangover_frames + 1
+        self._silent_frames = 0
+        self.passed_bytes = 0
+        self.suppressed_bytes = 0
+        self.speech_starts = 0
+        self.speech_ends = 0
+
+    @property
+    def in_speech(self) -> bool:
+        """Whether the stream is in speech or its hangover tail."""
+        return self._since_speech <= self.hangover_frames
+
+    def process(self, pcm: bytes) -> tuple[bytes, bool]:
+        """
+        Filter the next piece of the stream.
+
+        Audio is analyzed in whole frames; a trailing partial frame is held
+        until the next call (or ``flush``).
+
+        Returns:
+            The audio to forward, and whether speech ended in this piece
+        """
+        data = self._pending + pcm if self._pending else pcm
+        frame_bytes = self.frame_samples * 2
+        count = len(data) // frame_bytes
+        self._pending = data[count * frame_bytes :]
+        if not count:
+            return b"", False
+
+        frames = np.frombuffer(
+            data, dtype=np.int16, count=count * self.frame_samples
+        ).reshape(count, self.frame_samples)
+        active = self._active_frames(frames)
+
+        was_active = self.in_speech
+        index = np.arange(count)
+        last_speech = np.maximum.accumulate(np.where(active, index, -1))
+        since = np.where(
+            last_speech >= 0, index - last_speech, self._since_speech + index + 1
+        )
+        active = since <= self.hangover_frames
+        self._since_speech = int(since[-1])
+
+        ended = bool(np.any(active[:-1] & ~active[1:])) or (
+            was_active and not active[0]
+        )
+        if ended:
+            self.speech_ends += 1
+        if np.any(~active[:-1] & active[1:]) or (not was_active and active[0]):
+            self.speech_starts += 1
+
+        keep = active
+        if not active.all():
+            silent = ~active
+            if self.silence_keep_every > 0:
+                ordinal = self._silent_frames + np.cumsum(silent)
+                keep = active | (silent & (ordinal % self.silence_keep_every == 0))
+            self._silent_frames += int(silent.sum())
+
+        kept = int(keep.sum())
+        self.passed_bytes += kept * frame_bytes
+        self.suppressed_bytes += (count - kept) * frame_bytes
+        if kept == count:
+            return data[: count * frame_bytes], ended
+        return frames[keep].tobytes(), ended
+
+    def flush(self) -> bytes:
+        """Return the held partial frame unclassified."""
+        pending, self._pending = self._pending, b""
+        self.passed_bytes += len(pending)
+        return pending
+
+    def _active_frames(self, frames: np.ndarray) -> np.ndarray:
+        """Per-frame speech decision from energy and zero-crossing rate."""
+        samples = frames.astype(np.float32)
+        power = np.einsum("ij,ij->i", samples, samples) / frames.shape[1]
+        level = 10.0 * np.log10(power / _FULL_SCALE_POWER + 1e-12)
+        signs = np.signbit(frames)
+        zcr = np.count_nonzero(signs[:, 1:] != signs[:, :-1], axis=1) / (
+            frames.shape[1] - 1
+        )
+        loud = level > self.threshold_dbfs
+        fricative = (level > self.threshold_dbfs - _ZCR_MARGIN_DB) & (
+            zcr > _ZCR_SPEECH_MIN
+        )
+        result: np.ndarray = loud | fricative
+        return result
@@ -0,0 +1,169 @@
+"""WebSocket transport for voice sessions.
+
+One full-duplex connection replaces the per-chunk audio POSTs and the SSE
+response stream:
+
+* Client -> server binary frames: mono audio at the negotiated sample rate
+  and encoding (16-bit little-endian PCM by default), fed to
+  ``VoiceSession.send_audio``.
+* Client -> server text frames: ``{"type": "control", "action": ...}`` or
+  ``{"type": "config", "sample_rate": ..., "encoding": ...}``.
+* Server -> client binary frames: agent audio in the negotiated encoding,
+  consecutive parts coalesced (see ``src.voice.outbound``).
+* Server -> client text frames: compact JSON for transcripts, turn
+  completion and errors, with the field names of ``VoiceStreamMessage``.
+
+A session's ``agent_queue`` has a single consumer, so a client should use
+either this endpoint or the SSE stream, not both.
+"""
+
+import asyncio
+import json
+import logging
+from typing import Any
+
+from fastapi import WebSocket, WebSocketDisconnect
+
+from src.utils.audio_codecs import AUDIO_ENCODINGS, PCM, decode_audio
+from src.voice.outbound import coalesced_items, compact_json, encode_item
+from src.voice.session_manager import VoiceSession
+
+logger = logging.getLogger(__name__)
+
+CONTROL_ACTIONS = frozenset({"end_turn", "cancel", "end_session"})
+
+
+def _message(**fields: Any) -> str:
+    return compact_json(fields)
+
+
+class VoiceWebSocketHandler:
+    """Pumps one WebSocket connection to and from a voice session."""
+
+    def __init__(
+        self,
+        websocket: WebSocket,
+        session: VoiceSession,
+        sample_rate: int,
+        encoding: str = PCM,
+    ):
+        """
+        Initialize the handler.
+
+        Args:
+            websocket: Accepted WebSocket connection
+            session: Active voice session
+            sample_rate: Initial sample rate of inbound audio frames
+            encoding: Wire encoding of audio in both directions
+        """
+        self.websocket = websocket
+        self.session = session
+        self.sample_rate = sample_rate
+        self.encoding = encoding
+
+    async def run(self) -> None:
+        """Run until the client disconnects or the session ends."""
+        await self.websocket.send_text(
+            _message(type="connected", session_id=self.session.session_id)
+        )
+        receiver = asyncio.create_task(self._receive_loop())
+        sender = asyncio.create_task(self._send_loop())
+        try:
+            await asyncio.wait({receiver, sender}, return_when=asyncio.FIRST_COMPLETED)
+        finally:
+            for task in (receiver, sender):
+                task.cancel()
+            results = await asyncio.gather(receiver, sender, return_exceptions=True)
+        # A loop that failed (rather than saw the client leave) is an error
+        # for serve_voice_websocket to report
+        for result in results:
+            if isinstance(result, Exception) and not isinstance(
+                result, WebSocketDisconnect
+            ):
+                raise result
+
+    async def _receive_loop(self) -> None:
+        while True:
+            message = await self.websocket.receive()
+            if message["type"] == "websocket.disconnect":
+                logger.info(f"Voice WebSocket closed for {self.session.session_id}")
+                return
+            data = message.get("bytes")
+            if data is not None:
+                await self._handle_audio(data)
+                continue
+            text = message.get("text")
+            if text is not None and not await self._handle_text(text):
+                return
+
+    async def _handle_audio(self, data: bytes) -> None:
+        try:
+            pcm = decode_audio(memoryview(data), self.encoding)
+            await self.session.send_audio(pcm, self.sample_rate)
+        except ValueError as e:
+            # Bad frame; keep the connection for the next one
+            await self.websocket.send_text(_message(type="error", error=str(e)))
+
+    async def _handle_text(self, text: str) -> bool:
+        """Apply a control/config message; False once the session has ended."""
+        try:
+            message = json.loads(text)
+        except ValueError:
+            message = None
+        if not isinstance(message, dict):
+            await self.websocket.send_text(
+                _message(type="error", error="Invalid message")
+            )
+            return True
+
+        kind = message.get("type")
+        if kind == "config":
+            sample_rate = message.get("sample_rate", self.sample_rate)
+            encoding = message.get("encoding", self.encoding)
+            if not (isinstance(sample_rate, int) and sample_rate > 0):
+                await self.websocket.send_text(
+                    _message(type="error", error="Invalid sample_rate")
+                )
+            elif encoding not in AUDIO_ENCODINGS:
+                await self.websocket.send_text(
+                    _message(type="error", error="Invalid encoding")
+                )
+            else:
+                self.sample_rate = sample_rate
+                self.encoding = encoding
+            return True
+        if kind == "control" and message.get("action") in CONTROL_ACTIONS:
+            await self.session.send_control(message["action"])
+            return self.session.status == "active"
+
+        await self.websocket.send_text(
+            _message(type="error", error="Unknown message type")
+        )
+        return True
+
+    async def _send_loop(self) -> None:
+        async for item in coalesced_items(self.session):
+            if isinstance(item, bytes):
+                await self.websocket.send_bytes(encode_item(item, self.encoding))
+                continue
+            await self.websocket.send_text(compact_json(item))
+            if item["type"] == "error":
+                return
+
+
+async def serve_voice_websocket(
+    websocket: WebSocket, session: VoiceSession, sample_rate: int, encoding: str = PCM
+) -> None:
+    """Accept a connection and serve it until either side is done."""
+    await websocket.accept()
+    try:
+        await VoiceWebSocketHandler(websocket, session, sample_rate, encoding).run()
+    except WebSocketDisconnect:
+        logger.info(f"Voice WebSocket disconnected for {session.session_id}")
+    except Exception as e:
+        logger.error(f"Voice WebSocket error in session {session.session_id}: {e}")
+    finally:
+        try:
+            await websocket.close()
+        except RuntimeError:
+            pass  # Already closed by the client
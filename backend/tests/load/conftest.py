@@ -0,0 +1,20 @@
+"""Shared fixtures for the load benchmarks."""
+
+import time
+
+import pytest
+
+
+def _best_of(fn, *args, repeats: int = 5) -> float:
+    best = float("inf")
+    for _ in range(repeats):
+        start = time.perf_counter()
+        fn(*args)
+        best = min(best, time.perf_counter() - start)
+    return best
+
+
+@pytest.fixture
+def best_of():
+    """Best wall time (seconds) over ``repeats`` calls of ``fn(*args)``."""
+    return _best_of
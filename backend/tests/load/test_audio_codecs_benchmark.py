@@ -0,0 +1,45 @@
+"""CPU cost and wire size of the G.711 codecs.
+
+Run with ``pytest -m load tests/load/test_audio_codecs_benchmark.py -s``.
+"""
+
+import time
+
+import numpy as np
+import pytest
+
+from src.utils.audio_codecs import PCMA, PCMU, decode_audio, encode_audio
+
+SECONDS = 60
+RATE = 24000  # agent speech
+
+
+@pytest.mark.load
+class TestAudioCodecsBenchmark:
+    """Report encode/decode time per second of audio."""
+
+    @pytest.mark.parametrize("encoding", [PCMU, PCMA])
+    def test_cpu_per_audio_second(self, encoding):
+        pcm = (
+            np.random.default_rng(0)
+            .integers(-12000, 12000, RATE * SECONDS, dtype=np.int16)
+            .tobytes()
+        )
+
+        encode_ms = decode_ms = float("inf")
+        for _ in range(3):  # best of three
+            start = time.perf_counter()
+            encoded = encode_audio(pcm, encoding)
+            encode_ms = min(encode_ms, (time.perf_counter() - start) * 1e3)
+            start = time.perf_counter()
+            decode_audio(encoded, encoding)
+            decode_ms = min(decode_ms, (time.perf_counter() - start) * 1e3)
+
+        print(
+            f"\n{encoding} at {RATE}Hz, per audio second: "
+            f"encode {encode_ms / SECONDS * 1e3:.1f}µs, "
+            f"decode {decode_ms / SECONDS * 1e3:.1f}µs, "
+            f"{len(encoded) / SECONDS / 1024:.1f}KB vs "
+            f"{len(pcm) / SECONDS / 1024:.1f}KB PCM"
+        )
+        assert len(encoded) * 2 == len(pcm)
@@ -0,0 +1,143 @@
+"""Event loop lag while audio is converted for many clients at once.
+
+Two workloads, each run inline on the event loop and on the audio executor:
+voice sessions streaming 44.1kHz audio in real time, one large chunk (as
+sent by the raw upload endpoint or the WebSocket) per interval, and
+concurrent whole-file WAV conversions.
+
+Run with ``pytest -m load tests/load/test_audio_executor_benchmark.py -s``.
+"""
+
+import asyncio
+import io
+import random
+import wave
+from unittest.mock import MagicMock, patch
+
+import numpy as np
+import pytest
+
+from src.utils import audio_executor
+from src.utils.audio_converter import AudioConverter
+from src.utils.loop_lag import LoopLagMonitor
+from src.voice.session_manager import VoiceSession
+
+SESSIONS = 30
+IN_RATE = 44100
+CHUNK_MS = 500
+SECONDS = 2
+WAV_UPLOADS = 10
+WAV_SECONDS = 10
+
+
+async def _stream_sessions(workers: int) -> dict:
+    chunk = (
+        np.random.default_rng(0)
+        .integers(-8000, 8000, IN_RATE * CHUNK_MS // 1000, dtype=np.int16)
+        .tobytes()
+    )
+    sessions = []
+    for i in range(SESSIONS):
+        session = VoiceSession(f"voice-bench-{i}")
+        session.status = "active"
+        session.live_request_queue = MagicMock()
+        sessions.append(session)
+
+    async def stream(session: VoiceSession, offset: float) -> None:
+        loop = asyncio.get_running_loop()
+        await asyncio.sleep(offset)
+        start = loop.time()
+        for n in range(1, SECONDS * 1000 // CHUNK_MS + 1):
+            await session.send_audio(chunk, IN_RATE)
+            await asyncio.sleep(max(0.0, start + n * CHUNK_MS / 1000 - loop.time()))
+
+    monitor = LoopLagMonitor(interval_ms=10)
+    offsets = random.Random(0)
+    with (
+        patch.object(audio_executor, "AUDIO_EXECUTOR_WORKERS", workers),
+        patch.object(audio_executor, "_executor", None),
+    ):
+        # Warm up resamplers and worker threads outside the measurement
+        await asyncio.gather(*(s.send_audio(chunk, IN_RATE) for s in sessions))
+        monitor.start()
+        await asyncio.gather(
+            *(stream(s, offsets.random() * CHUNK_MS / 1000) for s in sessions)
+        )
+        await monitor.stop()
+        audio_executor.shutdown_audio_executor()
+
+    for session in sessions:
+        await session.cleanup()
+    return monitor.get_summary()
+
+
+def _wav(seconds: int) -> bytes:
+    samples = np.random.default_rng(1).integers(
+        -8000, 8000, IN_RATE * seconds * 2, dtype=np.int16
+    )
+    buffer = io.BytesIO()
+    with wave.open(buffer, "wb") as wav_file:
+        wav_file.setnchannels(2)
+        wav_file.setsampwidth(2)
+        wav_file.setframerate(IN_RATE)
+        wav_file.writeframes(samples.tobytes())
+    return buffer.getvalue()
+
+
+async def _convert_uploads(workers: int) -> dict:
+    wav = _wav(WAV_SECONDS)
+    monitor = LoopLagMonitor(interval_ms=5)
+    with (
+        patch.object(audio_executor, "AUDIO_EXECUTOR_WORKERS", workers),
+        patch.object(audio_executor, "_executor", None),
+    ):
+        await AudioConverter.convert_to_pcm_async(wav, "audio/wav")
+        monitor.start()
+        await asyncio.sleep(0.02)
+        # With no workers every conversion runs inline, back to back
+        await asyncio.gather(
+            *(
+                AudioConverter.convert_to_pcm_async(wav, "audio/wav")
+                for _ in range(WAV_UPLOADS)
+            )
+        )
+        await asyncio.sleep(0.02)
+        await monitor.stop()
+        audio_executor.shutdown_audio_executor()
+    return monitor.get_summary()
+
+
+def _report(title: str, inline: dict, pooled: dict) -> None:
+    print(f"\n{title}")
+    for name, lag in (("inline", inline), ("executor", pooled)):
+        print(
+            f"  {name + ':':<10}loop lag p50 {lag['p50']}ms, p99 {lag['p99']}ms, "
+            f"max {lag['max']}ms"
+        )
+
+
+@pytest.mark.load
+class TestAudioExecutorBenchmark:
+    """Report loop lag for inline and executor-based audio conversion."""
+
+    @pytest.mark.asyncio
+    async def test_loop_lag_under_concurrent_sessions(self):
+        inline = await _stream_sessions(workers=0)
+        pooled = await _stream_sessions(workers=audio_executor.AUDIO_EXECUTOR_WORKERS)
+        _report(
+            f"{SESSIONS} sessions streaming {CHUNK_MS}ms chunks at {IN_RATE}Hz",
+            inline,
+            pooled,
+        )
+        assert pooled["samples"] > 0
+
+    @pytest.mark.asyncio
+    async def test_loop_lag_under_concurrent_wav_uploads(self):
+        inline = await _convert_uploads(workers=0)
+        pooled = await _convert_uploads(workers=audio_executor.AUDIO_EXECUTOR_WORKERS)
+        _report(
+            f"{WAV_UPLOADS} concurrent {WAV_SECONDS}s stereo WAV conversions",
+            inline,
+            pooled,
+        )
+        assert pooled["samples"] > 0
@@ -0,0 +1,57 @@
+"""Benchmark of the compiled crisis scanner against a naive substring scan.
+
+Run with ``pytest -m load tests/load/test_crisis_scan_benchmark.py -s``.
+"""
+
+import pytest
+
+from src.agents.crisis import CRISIS_TERM_PACKS, crisis_scan
+from src.utils.aho_corasick import AhoCorasick, normalize_text
+
+MESSAGE_SIZES = [64, 1_024, 16_384]
+FILLER = "I have been feeling a bit stressed about work and my week lately. "
+
+
+def _naive_scan(text: str, terms: list[str]) -> bool:
+    lowered = normalize_text(text)
+    return any(term in lowered for term in terms)
+
+
+@pytest.mark.load
+class TestCrisisScanBenchmark:
+    """Compare scan cost across message sizes."""
+
+    @pytest.mark.parametrize("size", MESSAGE_SIZES)
+    def test_scan_matches_naive_result(self, best_of, size):
+        """Test that both scanners agree and report their timings."""
+        terms = [
+            normalize_text(term.rstrip("*"))
+            for pack in CRISIS_TERM_PACKS.values()
+            for term in pack
+        ]
+        text = (FILLER * (size // len(FILLER) + 1))[:size]
+
+        assert crisis_scan(text) is _naive_scan(text, terms) is False
+
+        compiled = best_of(lambda: crisis_scan(text))
+        naive = best_of(lambda: _naive_scan(text, terms))
+        print(
+            f"\n{size:>6} chars, {len(terms)} terms: "
+            f"compiled {compiled * 1e6:8.1f}us, naive {naive * 1e6:8.1f}us"
+        )
+
+    def test_scan_cost_independent_of_vocabulary(self, best_of):
+        """Test that a large vocabulary costs one pass, not one pass per term."""
+        text = FILLER * 64
+        terms = [f"term{i} phrase" for i in range(5_000)]
+        small = AhoCorasick(terms[:10])
+        large = AhoCorasick(terms)
+
+        small_time = best_of(lambda: small.search(text))
+        large_time = best_of(lambda: large.search(text))
+        naive_time = best_of(lambda: _naive_scan(text, terms))
+        print(
+            f"\n10 terms {small_time * 1e6:.1f}us, 5000 terms {large_time * 1e6:.1f}us, "
+            f"naive 5000 terms {naive_time * 1e6:.1f}us"
+        )
+        assert large_time < naive_time
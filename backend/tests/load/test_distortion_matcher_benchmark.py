@@ -0,0 +1,38 @@
+"""Benchmark of batch distortion scoring over a synthetic transcript set.
+
+Run with ``pytest -m load tests/load/test_distortion_matcher_benchmark.py -s``.
+"""
+
+import pytest
+
+from src.knowledge.cbt_context import COGNITIVE_DISTORTIONS
+from src.knowledge.distortion_matcher import get_distortion_matcher
+
+BATCH_SIZES = [100, 2_000]
+
+
+def _thoughts(count: int) -> list[str]:
+    examples = [e for d in COGNITIVE_DISTORTIONS.values() for e in d["examples"]]
+    return [examples[i % len(examples)] for i in range(count)]
+
+
+@pytest.mark.load
+class TestDistortionMatcherBenchmark:
+    """Compare per-thought and batch scoring."""
+
+    @pytest.mark.parametrize("count", BATCH_SIZES)
+    def test_batch_scoring(self, best_of, count):
+        """Test that batch and per-thought scoring agree and report timings."""
+        matcher = get_distortion_matcher()
+        thoughts = _thoughts(count)
+
+        single = [matcher.score(thought) for thought in thoughts]
+        batch = matcher.score_batch(thoughts)
+        single_time = best_of(lambda: [matcher.score(t) for t in thoughts])
+        batch_time = best_of(lambda: matcher.score_batch(thoughts))
+
+        assert batch == single
+        print(
+            f"\n{count:>5} thoughts: per-thought {single_time * 1e3:7.2f}ms, "
+            f"batch {batch_time * 1e3:7.2f}ms"
+        )
@@ -0,0 +1,50 @@
+"""Microbenchmark of orchestrator overhead per turn, with a stub LLM.
+
+Run with ``pytest -m load tests/load/test_orchestrator_benchmark.py -s``.
+"""
+
+import time
+
+import pytest
+
+from src.agents.orchestrator import handle_turn
+from src.agents.state import CoreState, SessionState
+
+TURNS = 2_000
+STUB_REPLY = (
+    "<ui>That sounds hard. What went through your mind right then?</ui>"
+    '<control>{"next_phase":"clarify","missing_fields":["thought"],'
+    '"suggest_questions":[],"crisis_detected":false}</control>'
+)
+
+
+def _stub_llm(**kwargs) -> str:
+    return STUB_REPLY
+
+
+def _per_turn_us(make_state) -> float:
+    best = float("inf")
+    for _ in range(3):
+        start = time.perf_counter()
+        for _ in range(TURNS // 10):
+            state = make_state()
+            state.max_turns = 1_000  # stay out of the summary/closed path
+            for _ in range(10):
+                handle_turn(state, "I messed up my presentation today", _stub_llm)
+        best = min(best, time.perf_counter() - start)
+    return best / TURNS * 1e6
+
+
+@pytest.mark.load
+class TestOrchestratorBenchmark:
+    """Compare per-turn overhead of both state representations."""
+
+    def test_turn_overhead(self):
+        """Report the non-LLM cost of one orchestrated turn."""
+        model_us = _per_turn_us(SessionState)
+        core_us = _per_turn_us(CoreState)
+        print(
+            f"\nper-turn overhead: SessionState {model_us:.1f}us, "
+            f"CoreState {core_us:.1f}us"
+        )
+        assert core_us > 0
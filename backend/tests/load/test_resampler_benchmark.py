@@ -0,0 +1,48 @@
+"""CPU cost of voice input resampling, FFT per chunk vs streaming polyphase.
+
+Run with ``pytest -m load tests/load/test_resampler_benchmark.py -s``.
+"""
+
+import numpy as np
+import pytest
+from scipy import signal
+
+from src.utils.resampler import StreamingResampler
+
+SECONDS = 5
+CHUNK_MS = 20  # browser AudioWorklet frame
+
+
+def _chunks(in_rate: int) -> list[np.ndarray]:
+    samples = np.random.default_rng(0).integers(
+        -8000, 8000, in_rate * SECONDS, dtype=np.int16
+    )
+    size = in_rate * CHUNK_MS // 1000
+    return [samples[i : i + size] for i in range(0, len(samples), size)]
+
+
+def _fft_per_chunk(chunks: list[np.ndarray], in_rate: int) -> None:
+    for chunk in chunks:
+        signal.resample(chunk, int(len(chunk) * 16000 / in_rate))
+
+
+def _streaming(chunks: list[np.ndarray], in_rate: int) -> None:
+    resampler = StreamingResampler(in_rate, 16000)
+    for chunk in chunks:
+        resampler.process(chunk)
+
+
+@pytest.mark.load
+class TestResamplerBenchmark:
+    """Report CPU time per second of audio for both resampling paths."""
+
+    @pytest.mark.parametrize("in_rate", [48000, 44100])
+    def test_cpu_per_audio_second(self, best_of, in_rate):
+        chunks = _chunks(in_rate)
+        fft_ms = best_of(_fft_per_chunk, chunks, in_rate, repeats=3) / SECONDS * 1e3
+        poly_ms = best_of(_streaming, chunks, in_rate, repeats=3) / SECONDS * 1e3
+        print(
+            f"\n{in_rate}Hz -> 16kHz, {CHUNK_MS}ms chunks: "
+            f"scipy.signal.resample {fft_ms:.2f}ms, "
+            f"streaming polyphase {poly_ms:.2f}ms per audio second"
+        )
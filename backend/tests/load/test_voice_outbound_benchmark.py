@@ -0,0 +1,96 @@
+"""Outbound agent audio: per-part Pydantic SSE vs coalesced envelopes.
+
+Run with ``pytest -m load tests/load/test_voice_outbound_benchmark.py -s``.
+"""
+
+import base64
+import time
+from types import SimpleNamespace
+
+import pytest
+
+from src.voice.models import VoiceStreamMessage
+from src.voice.outbound import (
+    AGENT_AUDIO_SAMPLE_RATE,
+    binary_frame,
+    coalesced_items,
+    sse_frame,
+)
+from src.voice.session_manager import VoiceSession
+
+SECONDS = 30
+PART_MS = 20  # size of the audio parts the model streams
+
+
+def _events() -> list:
+    data = b"\x01\x02" * (AGENT_AUDIO_SAMPLE_RATE * PART_MS // 1000)
+    part = SimpleNamespace(
+        inline_data=SimpleNamespace(mime_type="audio/pcm", data=data), text=None
+    )
+    event = SimpleNamespace(content=SimpleNamespace(parts=[part]), turn_complete=False)
+    return [event] * (SECONDS * 1000 // PART_MS)
+
+
+def _pydantic_per_part(events: list) -> int:
+    """The previous encoding, kept as the baseline."""
+    sent = 0
+    for event in events:
+        for part in event.content.parts:
+            msg = VoiceStreamMessage(
+                type="audio",
+                data=base64.b64encode(part.inline_data.data).decode("ascii"),
+            )
+            sent += len(f"data: {msg.model_dump_json()}\n\n")
+    return sent
+
+
+async def _coalesced(events: list, encode) -> int:
+    session = VoiceSession("voice-bench")
+    session.status = "active"
+    for event in events:
+        session.agent_queue.put_nowait(event)
+    session.agent_queue.put_nowait({"type": "error", "error": "end"})
+
+    sent = 0
+    async for item in coalesced_items(session):
+        sent += len(encode(item))
+        if isinstance(item, dict):
+            break
+    return sent
+
+
+@pytest.mark.load
+class TestVoiceOutboundBenchmark:
+    """Report encode CPU and bytes per second of agent speech."""
+
+    @pytest.mark.asyncio
+    async def test_cpu_and_bytes_per_audio_second(self):
+        events = _events()
+
+        baseline_ms = float("inf")
+        results: dict[str, tuple[int, float]] = {}
+        for _ in range(3):  # best of three
+            start = time.perf_counter()
+            baseline_bytes = _pydantic_per_part(events)
+            baseline_ms = min(baseline_ms, (time.perf_counter() - start) * 1e3)
+
+            for name, encode in (("sse", sse_frame), ("binary", binary_frame)):
+                start = time.perf_counter()
+                sent = await _coalesced(events, encode)
+                elapsed_ms = (time.perf_counter() - start) * 1e3
+                results[name] = (
+                    sent,
+                    min(elapsed_ms, results.get(name, (0, elapsed_ms))[1]),
+                )
+
+        print(f"\n{SECONDS}s of agent speech in {PART_MS}ms parts, per audio second:")
+        print(
+            f"  pydantic per part: {baseline_ms / SECONDS:.3f}ms, "
+            f"{baseline_bytes / SECONDS / 1024:.1f}KB"
+        )
+        for name, (sent, elapsed_ms) in results.items():
+            print(
+                f"  coalesced {name + ':':<8} {elapsed_ms / SECONDS:.3f}ms, "
+                f"{sent / SECONDS / 1024:.1f}KB"
+            )
+        assert results["binary"][0] < results["sse"][0] < baseline_bytes
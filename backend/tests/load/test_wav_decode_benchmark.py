@@ -0,0 +1,106 @@
+"""WAV decoding: per-sample loop vs vectorized 24-bit sample reading, and
+whole-file vs streaming conversion memory.
+
+Run with ``pytest -m load tests/load/test_wav_decode_benchmark.py -s``.
+"""
+
+import io
+import struct
+import time
+import tracemalloc
+import wave
+
+import numpy as np
+import pytest
+
+from src.utils.audio_converter import AudioConverter
+from src.utils.resampler import resample
+
+SECONDS = 3
+RATE = 48000
+CHANNELS = 2
+
+
+def _loop_decode(data: bytes) -> np.ndarray:
+    """The previous per-sample implementation, kept as the baseline."""
+    num_samples = len(data) // 3
+    samples = np.zeros(num_samples, dtype=np.int32)
+    for i in range(num_samples):
+        b1, b2, b3 = struct.unpack("BBB", data[i * 3 : (i + 1) * 3])
+        value = b1 | (b2 << 8) | (b3 << 16)
+        if value & 0x800000:
+            value = value - 0x1000000
+        samples[i] = value
+    return samples
+
+
+def _whole_file_convert(wav_data: bytes) -> bytes:
+    """The previous whole-file conversion (16-bit input), kept as the baseline."""
+    with io.BytesIO(wav_data) as buffer, wave.open(buffer, "rb") as wav_file:
+        params = wav_file.getparams()
+        frames = wav_file.readframes(params.nframes)
+    audio = np.frombuffer(frames, dtype=np.int16).astype(np.float32) / 32768.0
+    audio = np.mean(audio.reshape(-1, params.nchannels), axis=1)
+    audio = resample(audio, params.framerate, 16000)
+    return bytes(np.clip(audio * 32768, -32768, 32767).astype(np.int16).tobytes())
+
+
+def _peak_memory(fn, *args) -> tuple[float, float]:
+    """Peak traced allocation (MB) and wall time (ms) of one call."""
+    tracemalloc.start()
+    start = time.perf_counter()
+    fn(*args)
+    elapsed = time.perf_counter() - start
+    _, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    return peak / 2**20, elapsed * 1e3
+
+
+@pytest.mark.load
+class TestWavDecodeBenchmark:
+    """Report decode time for a multi-second 24-bit stereo recording."""
+
+    def test_24bit_decode(self, best_of):
+        values = np.random.default_rng(0).integers(
+            -(1 << 23), 1 << 23, RATE * SECONDS * CHANNELS, dtype=np.int32
+        )
+        data = values.astype("<i4").view(np.uint8).reshape(-1, 4)[:, :3].tobytes()
+
+        vectorized = AudioConverter._read_nbyte_samples(data, 3)
+        np.testing.assert_array_equal(vectorized, _loop_decode(data))
+
+        loop_ms = best_of(_loop_decode, data, repeats=1) * 1e3
+        vector_ms = (
+            best_of(AudioConverter._read_nbyte_samples, data, 3, repeats=3) * 1e3
+        )
+        print(
+            f"\n{SECONDS}s 48kHz stereo 24-bit: loop {loop_ms:.1f}ms, "
+            f"vectorized {vector_ms:.2f}ms ({loop_ms / vector_ms:.0f}x)"
+        )
+        assert vector_ms < loop_ms
+
+    def test_streaming_conversion_memory(self):
+        seconds = 60
+        samples = np.random.default_rng(0).integers(
+            -8000, 8000, 44100 * seconds * CHANNELS, dtype=np.int16
+        )
+        buffer = io.BytesIO()
+        with wave.open(buffer, "wb") as wav_file:
+            wav_file.setnchannels(CHANNELS)
+            wav_file.setsampwidth(2)
+            wav_file.setframerate(44100)
+            wav_file.writeframes(samples.tobytes())
+        wav_data = buffer.getvalue()
+        input_mb = len(wav_data) / 2**20
+
+        whole_mb, whole_ms = _peak_memory(_whole_file_convert, wav_data)
+        stream_mb, stream_ms = _peak_memory(
+            AudioConverter._convert_wav_to_pcm, wav_data
+        )
+        print(
+            f"\n{seconds}s 44.1kHz stereo 16-bit ({input_mb:.1f}MB): "
+            f"whole-file peak {whole_mb:.1f}MB in {whole_ms:.0f}ms, "
+            f"streaming peak {stream_mb:.1f}MB in {stream_ms:.0f}ms "
+            f"(output {input_mb * 16000 / 44100 / CHANNELS:.1f}MB)"
+        )
+        assert stream_mb < whole_mb
@@ -0,0 +1,68 @@
+"""Tests for pre-rendered first-turn acknowledgements."""
+
+import asyncio
+import json
+from types import SimpleNamespace
+from unittest.mock import AsyncMock, patch
+
+import pytest
+
+from src.text.acknowledgements import (
+    ACK_TEMPLATES,
+    PrerenderedFrame,
+    get_ack_frame,
+    prerender_ack_frames,
+)
+from src.text.router import _run_turn
+from src.utils.language_utils import SUPPORTED_LANGUAGES
+
+
+def _payload(frame: PrerenderedFrame) -> dict:
+    assert frame.data.startswith("data: ")
+    assert frame.data.endswith("\n\n")
+    return json.loads(frame.data[len("data: ") :])
+
+
+def test_every_supported_language_has_a_frame():
+    frames = prerender_ack_frames()
+    assert set(frames) == set(SUPPORTED_LANGUAGES)
+    for code, frame in frames.items():
+        payload = _payload(frame)
+        assert payload["type"] == "content"
+        assert payload["ack"] is True
+        assert payload["data"].startswith(ACK_TEMPLATES[code])
+
+
+def test_frame_lookup_normalizes_and_falls_back():
+    assert get_ack_frame("es") is get_ack_frame("es-ES")
+    assert get_ack_frame("xx-YY") is get_ack_frame("en-US")
+    assert get_ack_frame(None) is get_ack_frame("en-US")
+
+
+def test_frames_keep_non_ascii_text():
+    assert ACK_TEMPLATES["ja-JP"] in get_ack_frame("ja-JP").data
+
+
+@pytest.mark.asyncio
+async def test_ack_is_queued_before_model_reply_on_first_message_only():
+    queue: asyncio.Queue = asyncio.Queue()
+    session = SimpleNamespace(
+        metadata={
+            "runner": object(),
+            "adk_session": object(),
+            "run_config": object(),
+            "message_queue": queue,
+            "language": "fr-FR",
+            "greeting_sent": False,
+        }
+    )
+    reply = SimpleNamespace(content=None)
+
+    with patch("src.text.router.process_message", new=AsyncMock(return_value=[reply])):
+        await _run_turn("s1", session, "Bonjour")
+        await _run_turn("s1", session, "Encore")
+
+    items = [queue.get_nowait() for _ in range(queue.qsize())]
+    assert items[0] is get_ack_frame("fr-FR")
+    assert items[1] is reply
+    assert sum(isinstance(item, PrerenderedFrame) for item in items) == 1
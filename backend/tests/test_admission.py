@@ -0,0 +1,187 @@
+"""Tests for admission control of new sessions."""
+
+import asyncio
+from unittest.mock import AsyncMock, MagicMock, patch
+
+import pytest
+from fastapi import HTTPException
+from fastapi.testclient import TestClient
+
+with patch("src.voice.session_manager.voice_session_manager", MagicMock()):
+    from src.main import app
+
+from src.utils.admission import (
+    AdmissionController,
+    AdmissionRejectedError,
+    require_admission,
+)
+from src.utils.loop_lag import LoopLagMonitor
+
+
+@pytest.fixture
+def lag_monitor():
+    monitor = LoopLagMonitor()
+    with patch("src.utils.admission.get_loop_lag_monitor", return_value=monitor):
+        yield monitor
+
+
+def _controller(**limits) -> AdmissionController:
+    defaults = {
+        "max_sessions": 2,
+        "max_model_calls": 2,
+        "max_loop_lag_ms": 100,
+        "max_rss_mb": 0,
+        "queue_timeout_ms": 0,
+        "max_waiting": 1,
+        "retry_after": 7,
+    }
+    return AdmissionController(**{**defaults, **limits})
+
+
+class TestAdmissionController:
+    @pytest.mark.asyncio
+    async def test_admits_while_under_every_limit(self, lag_monitor):
+        controller = _controller()
+        controller.add_session_counter("text", lambda: 1)
+
+        await controller.admit("text")
+
+        assert controller.admitted == 1
+        controller.release()
+        assert controller.overload_reason() is None
+
+    @pytest.mark.asyncio
+    async def test_each_signal_can_refuse(self, lag_monitor):
+        controller = _controller()
+        controller.add_session_counter("text", lambda: 1)
+        controller.add_session_counter("voice", lambda: 1)
+        assert controller.overload_reason() == "sessions"
+
+        controller = _controller()
+        with controller.track_model_call(), controller.track_model_call():
+            assert controller.overload_reason() == "model_calls"
+        assert controller.model_calls == 0
+
+        for _ in range(20):
+            lag_monitor.record(0.3)
+        assert controller.overload_reason() == "loop_lag"
+
+    @pytest.mark.asyncio
+    async def test_rejection_carries_retry_after(self, lag_monitor):
+        controller = _controller()
+        controller.add_session_counter("voice", lambda: 5)
+
+        with pytest.raises(AdmissionRejectedError) as excinfo:
+            await controller.admit("voice")
+
+        assert excinfo.value.retry_after == 7
+        assert controller.rejected == {"sessions": 1}
+
+    @pytest.mark.asyncio
+    async def test_admitted_slot_is_reserved_until_released(self, lag_monitor):
+        controller = _controller()
+        controller.add_session_counter("text", lambda: 0)
+
+        await controller.admit("text")
+        await controller.admit("text")
+        # Neither session is counted yet, but both slots are taken
+        with pytest.raises(AdmissionRejectedError):
+            await controller.admit("text")
+
+        controller.release()
+        await controller.admit("text")
+        assert controller.reserved == 2
+
+    @pytest.mark.asyncio
+    async def test_queued_request_is_admitted_when_capacity_frees(self, lag_monitor):
+        controller = _controller(queue_timeout_ms=1000)
+        active = [2]
+        controller.add_session_counter("text", lambda: active[0])
+
+        waiter = asyncio.create_task(controller.admit("text"))
+        await asyncio.sleep(0.1)
+        assert controller.waiting == 1
+        active[0] = 1  # a conversation ended
+
+        await asyncio.wait_for(waiter, timeout=1)
+        assert controller.queued == 1
+        assert controller.admitted == 1
+        assert controller.waiting == 0
+
+    @pytest.mark.asyncio
+    async def test_queue_is_bounded_and_times_out(self, lag_monitor):
+        controller = _controller(queue_timeout_ms=100)
+        controller.add_session_counter("text", lambda: 2)
+
+        waiter = asyncio.create_task(controller.admit("text"))
+        await asyncio.sleep(0)
+        # The only waiting slot is taken
+        with pytest.raises(AdmissionRejectedError):
+            await controller.admit("text")
+        with pytest.raises(AdmissionRejectedError):
+            await waiter
+
+        assert controller.rejected == {"sessions": 2}
+        assert controller.waiting == 0
+
+
+class TestAdmissionEndpoints:
+    @pytest.fixture
+    def overloaded(self):
+        controller = _controller()
+        controller.add_session_counter("text", lambda: 10)
+        with patch(
+            "src.utils.admission.get_admission_controller", return_value=controller
+        ):
+            yield controller
+
+    @pytest.mark.asyncio
+    async def test_require_admission_raises_503(self, overloaded, lag_monitor):
+        with pytest.raises(HTTPException) as excinfo:
+            async with require_admission("text"):
+                pass
+
+        assert excinfo.value.status_code == 503
+        assert excinfo.value.headers == {"Retry-After": "7"}
+
+    def test_voice_session_creation_is_refused(self, overloaded, lag_monitor):
+        with patch("src.voice.router.voice_session_manager") as manager:
+            manager.create_session = AsyncMock()
+            response = TestClient(app).post(
+                "/api/voice/sessions", json={"language": "en-US"}
+            )
+
+        assert response.status_code == 503
+        assert response.headers["Retry-After"] == "7"
+        manager.create_session.assert_not_called()
+
+    @pytest.mark.asyncio
+    async def test_require_admission_releases_its_slot(self, lag_monitor):
+        controller = _controller()
+        with patch(
+            "src.utils.admission.get_admission_controller", return_value=controller
+        ):
+            async with require_admission("voice"):
+                assert controller.reserved == 1
+            with pytest.raises(RuntimeError):
+                async with require_admission("voice"):
+                    raise RuntimeError("session failed to start")
+
+        assert controller.reserved == 0
+
+    def test_new_text_stream_is_refused(self, overloaded, lag_monitor):
+        with patch("src.text.router.start_agent_session") as start:
+            response = TestClient(app).get("/api/events/admission-new")
+
+        assert response.status_code == 503
+        assert response.headers["Retry-After"] == "7"
+        start.assert_not_called()
+
+
+def test_recent_lag_is_the_median_of_latest_samples():
+    monitor = LoopLagMonitor()
+    for lag in (1.0, 0.01, 0.02, 0.5):
+        monitor.record(lag)
+
+    assert monitor.recent_lag(3) == 0.02
+    assert LoopLagMonitor().recent_lag(3) == 0.0
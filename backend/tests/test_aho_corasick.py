@@ -0,0 +1,59 @@
+"""Tests for the Aho-Corasick matcher."""
+
+from src.utils.aho_corasick import AhoCorasick, normalize_text
+
+
+class TestNormalizeText:
+    """Test text normalization."""
+
+    def test_ascii_lowercased(self):
+        """Test that ASCII text takes the lowercase fast path."""
+        assert normalize_text("Kill MySelf") == "kill myself"
+
+    def test_latin_accents_removed(self):
+        """Test that accents on Latin letters are dropped."""
+        assert normalize_text("Suicídio ÜBERDOSIS") == "suicidio uberdosis"
+
+    def test_non_latin_marks_preserved(self):
+        """Test that combining marks in other scripts are kept."""
+        assert normalize_text("死にたい") == "死にたい"
+        assert normalize_text("आत्महत्या") == "आत्महत्या"
+
+    def test_compatibility_forms_folded(self):
+        """Test that full-width characters are folded to their base form."""
+        assert normalize_text("\uff33\uff35\uff29\uff23\uff29\uff24\uff25") == "suicide"
+
+
+class TestAhoCorasick:
+    """Test multi-pattern matching."""
+
+    def test_finds_overlapping_matches(self):
+        """Test that patterns sharing suffixes are all reported."""
+        matcher = AhoCorasick(["he", "she", "his", "hers"])
+        found = {(m.start, m.pattern) for m in matcher.find_all("ushers")}
+        assert found == {(1, "she"), (2, "he"), (2, "hers")}
+
+    def test_match_index_refers_to_pattern_order(self):
+        """Test that match indexes point into the pattern list."""
+        matcher = AhoCorasick(["alpha", "", "beta"])
+        assert matcher.patterns == ["alpha", "beta"]
+        assert [m.pattern_index for m in matcher.find_all("beta alpha")] == [1, 0]
+
+    def test_search_is_case_and_accent_insensitive(self):
+        """Test that patterns and text are normalized the same way."""
+        matcher = AhoCorasick(["autolesión"])
+        assert matcher.search("Pensé en la AUTOLESION")
+        assert not matcher.search("nothing to see")
+
+    def test_word_boundaries(self):
+        """Test that boundary mode skips matches inside words."""
+        matcher = AhoCorasick(["cut"])
+        assert matcher.find_all("shortcut", word_boundaries=True) == []
+        assert len(matcher.find_all("a cut here", word_boundaries=True)) == 1
+
+    def test_empty_automaton(self):
+        """Test that an automaton without patterns never matches."""
+        matcher = AhoCorasick([])
+        assert len(matcher) == 0
+        assert matcher.state_count == 1
+        assert not matcher.search("anything")
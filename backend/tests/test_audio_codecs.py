@@ -0,0 +1,69 @@
+"""Tests for the G.711 and L16 audio codecs."""
+
+import numpy as np
+import pytest
+
+from src.utils.audio_codecs import L16, PCM, PCMA, PCMU, decode_audio, encode_audio
+
+ALL_SAMPLES = np.arange(-32768, 32768, dtype=np.int32)
+ALL_CODES = bytes(range(256))
+
+
+def _samples(pcm: bytes | memoryview) -> np.ndarray:
+    return np.frombuffer(pcm, dtype="<i2").astype(np.int32)
+
+
+class TestG711:
+    def test_reference_values(self):
+        assert encode_audio(np.zeros(1, np.int16).tobytes(), PCMU) == b"\xff"
+        assert encode_audio(np.zeros(1, np.int16).tobytes(), PCMA) == b"\xd5"
+        assert _samples(decode_audio(b"\xff\x00\x80", PCMU)).tolist() == [
+            0,
+            -32124,
+            32124,
+        ]
+        assert _samples(decode_audio(b"\xd5\x55\xaa\x2a", PCMA)).tolist() == [
+            8,
+            -8,
+            32256,
+            -32256,
+        ]
+
+    @pytest.mark.parametrize("encoding", [PCMU, PCMA])
+    def test_every_code_survives_a_round_trip(self, encoding):
+        codes = encode_audio(decode_audio(ALL_CODES, encoding), encoding)
+        changed = [code for code in range(256) if codes[code] != code]
+        # μ-law has two codes for zero; 0x7F comes back as 0xFF
+        assert changed == ([0x7F] if encoding == PCMU else [])
+
+    @pytest.mark.parametrize("encoding", [PCMU, PCMA])
+    def test_quantization_error_is_logarithmic(self, encoding):
+        pcm = ALL_SAMPLES.astype("<i2").tobytes()
+        encoded = encode_audio(pcm, encoding)
+        assert len(encoded) == len(pcm) // 2
+
+        error = np.abs(_samples(decode_audio(encoded, encoding)) - ALL_SAMPLES)
+        in_range = np.abs(ALL_SAMPLES) < 32000  # beyond this both codecs clip
+        assert np.all(error[in_range] <= np.abs(ALL_SAMPLES[in_range]) / 16 + 16)
+
+
+class TestL16:
+    def test_big_endian_round_trip(self):
+        pcm = np.array([1, -2, 0x1234], dtype="<i2").tobytes()
+        encoded = encode_audio(pcm, L16)
+        assert encoded == np.array([1, -2, 0x1234], dtype=">i2").tobytes()
+        assert decode_audio(encoded, L16) == pcm
+
+    def test_odd_length_is_rejected(self):
+        with pytest.raises(ValueError, match="even"):
+            decode_audio(b"\x00\x01\x02", L16)
+
+
+def test_pcm_passes_through_without_copy():
+    view = memoryview(b"\x01\x02")
+    assert decode_audio(view, PCM) is view
+
+
+def test_unknown_encoding_is_rejected():
+    with pytest.raises(ValueError, match="Unsupported audio encoding"):
+        decode_audio(b"\x00", "opus")
@@ -5,8 +5,11 @@ import struct
 import wave
 
 import numpy as np
+import pytest
 
-from src.utils.audio_converter import AudioConverter
+from src.utils.audio_codecs import encode_audio
+from src.utils.audio_converter import AudioConverter, WavStreamDecoder
+from src.utils.resampler import resample
 
 
 class TestAudioConverter:
@@ -116,9 +119,9 @@ class TestAudioConverter:
         assert metrics["error"] is None
 
         # Verify conversion time is under 100ms
-        assert (
-            metrics["conversion_time"] < 100
-        ), f"Conversion took {metrics['conversion_time']}ms, expected < 100ms"
+        assert metrics["conversion_time"] < 100, (
+            f"Conversion took {metrics['conversion_time']}ms, expected < 100ms"
+        )
 
     def test_validate_pcm_data(self):
         """Test PCM data validation."""
@@ -175,3 +178,187 @@ class TestAudioConverter:
         audio_array = AudioConverter._read_24bit_samples(sample_data)
         assert len(audio_array) == 1000
         assert audio_array.dtype == np.int32
+
+        # Values survive the round trip, including sign extension
+        expected = [int(np.sin(2 * np.pi * i / 100) * 8388607) for i in range(1000)]
+        assert audio_array.tolist() == expected
+
+    def test_nbyte_sample_decoding(self):
+        """Test signed decoding for every supported sample width."""
+        for width in (2, 3, 4):
+            low, high = -(1 << (8 * width - 1)), (1 << (8 * width - 1)) - 1
+            values = [low, low + 1, -1, 0, 1, high - 1, high, 12345, -12345]
+            data = b"".join(v.to_bytes(width, "little", signed=True) for v in values)
+
+            decoded = AudioConverter._read_nbyte_samples(data, width)
+
+            assert decoded.dtype == np.int32
+            assert decoded.tolist() == values
+
+    def test_24bit_stereo_wav_conversion(self):
+        """Test full conversion of a 24-bit stereo WAV file."""
+        t = np.arange(48000) / 48000
+        tone = (np.sin(2 * np.pi * 440 * t) * 4000000).astype(np.int32)
+        frames = np.column_stack((tone, tone)).astype("<i4").tobytes()
+        # Keep the low three bytes of each 32-bit sample
+        packed = np.frombuffer(frames, dtype=np.uint8).reshape(-1, 4)[:, :3]
+
+        wav_buffer = io.BytesIO()
+        with wave.open(wav_buffer, "wb") as wav_file:
+            wav_file.setnchannels(2)
+            wav_file.setsampwidth(3)
+            wav_file.setframerate(48000)
+            wav_file.writeframes(packed.tobytes())
+
+        pcm_data, metrics = AudioConverter.convert_to_pcm(
+            wav_buffer.getvalue(), "audio/wav"
+        )
+
+        assert metrics["error"] is None
+        assert len(pcm_data) == 16000 * 2
+        peak = np.max(np.abs(np.frombuffer(pcm_data, dtype=np.int16)))
+        assert abs(int(peak) - 4000000 // 256) < 500
+
+
+class TestEncodedAudioConversion:
+    """Test conversion of headerless G.711 and L16 audio."""
+
+    @staticmethod
+    def tone(sample_rate: int, channels: int = 1) -> bytes:
+        t = np.arange(sample_rate) / sample_rate
+        samples = (np.sin(2 * np.pi * 440 * t) * 16000).astype(np.int16)
+        return np.repeat(samples, channels).tobytes()
+
+    @pytest.mark.parametrize("mime_type", ["audio/PCMU", "audio/basic", "audio/pcma"])
+    def test_g711_defaults_to_8khz(self, mime_type):
+        encoding = AudioConverter.SUPPORTED_INPUT_FORMATS[mime_type.lower()]
+        encoded = encode_audio(self.tone(8000), encoding)
+
+        pcm, metrics = AudioConverter.convert_to_pcm(encoded, mime_type)
+
+        assert metrics["error"] is None
+        assert len(pcm) == 16000 * 2
+        peak = np.abs(np.frombuffer(pcm, dtype=np.int16)).max()
+        assert 14000 < peak < 18000
+
+    def test_l16_with_rate_and_channels(self):
+        encoded = encode_audio(self.tone(48000, channels=2), "l16")
+
+        pcm, metrics = AudioConverter.convert_to_pcm(
+            encoded, "audio/L16; rate=48000; channels=2"
+        )
+
+        assert metrics["error"] is None
+        expected = resample(
+            np.frombuffer(self.tone(48000), dtype=np.int16) / 32768.0, 48000, 16000
+        )
+        np.testing.assert_allclose(
+            np.frombuffer(pcm, dtype=np.int16) / 32768.0, expected, atol=2 / 32768
+        )
+
+
+class TestWavStreamDecoder:
+    """Test block-wise streaming WAV conversion."""
+
+    @staticmethod
+    def _reference(samples: np.ndarray, sample_rate: int) -> np.ndarray:
+        """Whole-buffer conversion of int16 (frames, channels) samples."""
+        mono = (samples.astype(np.float32) / 32768.0).mean(axis=1)
+        resampled = resample(mono, sample_rate, 16000)
+        return np.clip(resampled * 32768, -32768, 32767).astype(np.int16)
+
+    @staticmethod
+    def _wav(samples: np.ndarray, sample_rate: int) -> bytes:
+        buffer = io.BytesIO()
+        with wave.open(buffer, "wb") as wav_file:
+            wav_file.setnchannels(samples.shape[1])
+            wav_file.setsampwidth(2)
+            wav_file.setframerate(sample_rate)
+            wav_file.writeframes(samples.astype("<i2").tobytes())
+        return buffer.getvalue()
+
+    def test_matches_whole_file_conversion(self):
+        rng = np.random.default_rng(0)
+        for sample_rate, channels in ((48000, 2), (44100, 1), (16000, 2)):
+            samples = rng.integers(
+                -8000, 8000, (sample_rate // 2 + 7, channels), dtype=np.int16
+            )
+            pcm, metrics = AudioConverter.convert_to_pcm(
+                self._wav(samples, sample_rate), "audio/wav"
+            )
+
+            expected = self._reference(samples, sample_rate)
+            actual = np.frombuffer(pcm, dtype=np.int16)
+            assert metrics["error"] is None
+            assert len(actual) == len(expected)
+            assert np.max(np.abs(actual.astype(int) - expected)) <= 1
+
+    def test_output_does_not_depend_on_chunking(self):
+        samples = np.random.default_rng(1).integers(
+            -8000, 8000, (24000, 2), dtype=np.int16
+        )
+        wav = self._wav(samples, 48000)
+        whole = b"".join(AudioConverter.iter_wav_to_pcm([wav]))
+        sizes = [1, 5, 44, 333, 4096]
+        pieces, pos = [], 0
+        while pos < len(wav):
+            size = sizes[len(pieces) % len(sizes)]
+            pieces.append(wav[pos : pos + size])
+            pos += size
+
+        assert b"".join(AudioConverter.iter_wav_to_pcm(pieces)) == whole
+
+    def test_output_starts_before_input_ends(self):
+        samples = np.zeros((48000, 1), dtype=np.int16)
+        wav = self._wav(samples, 48000)
+        decoder = WavStreamDecoder(block_frames=1024)
+
+        first = decoder.feed(wav[: len(wav) // 4])
+        assert len(first) > 0
+        # Only a partial frame at most is held between calls
+        assert len(decoder._buffer) < 2
+
+        rest = decoder.feed(wav[len(wav) // 4 :]) + decoder.flush()
+        assert len(first) + len(rest) == 16000 * 2
+
+    def test_skips_metadata_chunks_and_reads_extensible_format(self):
+        tone = (np.sin(np.arange(1600) / 5) * 10000).astype("<i2")
+        # WAVE_FORMAT_EXTENSIBLE with the PCM sub-format GUID
+        pcm_guid = bytes.fromhex("0100000000001000800000aa00389b71")
+        fmt = (
+            struct.pack("<HHIIHHHHI", 0xFFFE, 1, 16000, 32000, 2, 16, 22, 16, 0x4)
+            + pcm_guid
+        )
+        # Odd-sized chunk, padded to an even length
+        list_chunk = b"LIST" + struct.pack("<I", 5) + b"INFO\x00\x00"
+        data = tone.tobytes()
+        body = (
+            b"WAVE"
+            + b"fmt "
+            + struct.pack("<I", len(fmt))
+            + fmt
+            + list_chunk
+            + b"data"
+            + struct.pack("<I", len(data))
+            + data
+            + b"id3 "
+            + struct.pack("<I", 4)
+            + b"junk"
+        )
+        wav = b"RIFF" + struct.pack("<I", len(body)) + body
+
+        assert b"".join(AudioConverter.iter_wav_to_pcm([wav])) == data
+
+    def test_rejects_unsupported_encoding(self):
+        fmt = struct.pack("<HHIIHH", 3, 1, 16000, 64000, 4, 32)  # IEEE float
+        wav = b"RIFF\x00\x00\x00\x00WAVEfmt " + struct.pack("<I", 16) + fmt
+
+        decoder = WavStreamDecoder()
+        with pytest.raises(ValueError, match="Unsupported WAV encoding"):
+            decoder.feed(wav)
+
+    def test_incomplete_header(self):
+        decoder = WavStreamDecoder()
+        assert decoder.feed(b"RIFF\x00\x00") == b""
+        with pytest.raises(ValueError, match="Incomplete"):
+            decoder.flush()
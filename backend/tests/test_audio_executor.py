@@ -0,0 +1,94 @@
+"""Tests for the audio executor and event loop lag monitoring."""
+
+import asyncio
+import threading
+import time
+from unittest.mock import MagicMock, patch
+
+import numpy as np
+import pytest
+
+from src.utils import audio_executor
+from src.utils.audio_converter import AudioConverter
+from src.utils.audio_executor import run_audio
+from src.utils.loop_lag import LoopLagMonitor
+from src.voice.session_manager import VoiceSession
+
+
+class TestRunAudio:
+    @pytest.mark.asyncio
+    async def test_runs_on_worker_thread(self):
+        name = await run_audio(lambda: threading.current_thread().name)
+        assert name.startswith("audio-dsp")
+
+    @pytest.mark.asyncio
+    async def test_inline_when_disabled(self):
+        with (
+            patch.object(audio_executor, "AUDIO_EXECUTOR_WORKERS", 0),
+            patch.object(audio_executor, "_executor", None),
+        ):
+            name = await run_audio(lambda: threading.current_thread().name)
+        assert name == threading.current_thread().name
+
+    @pytest.mark.asyncio
+    async def test_errors_propagate(self):
+        def fail():
+            raise ValueError("bad audio")
+
+        with pytest.raises(ValueError, match="bad audio"):
+            await run_audio(fail)
+
+    @pytest.mark.asyncio
+    async def test_convert_to_pcm_async(self):
+        pcm, metrics = await AudioConverter.convert_to_pcm_async(b"", "audio/ogg")
+        assert pcm == b""
+        assert "Unsupported" in metrics["error"]
+
+
+class TestLoopLagMonitor:
+    def test_summary_in_milliseconds(self):
+        monitor = LoopLagMonitor()
+        assert monitor.get_summary()["samples"] == 0
+        for lag in (0.001, 0.002, -0.001, 0.050):
+            monitor.record(lag)
+
+        summary = monitor.get_summary()
+        assert summary["samples"] == 4
+        assert summary["max"] == 50.0
+        assert summary["current"] == 50.0
+        assert summary["p50"] == 2.0
+
+    @pytest.mark.asyncio
+    async def test_detects_blocked_loop(self):
+        monitor = LoopLagMonitor(interval_ms=5)
+        monitor.start()
+        await asyncio.sleep(0.02)
+        time.sleep(0.1)  # block the loop
+        await asyncio.sleep(0.02)
+        await monitor.stop()
+
+        assert monitor.get_summary()["max"] >= 50
+
+
+class TestVoiceSessionExecutor:
+    @pytest.mark.asyncio
+    async def test_overlapping_calls_keep_order_on_loop_thread(self):
+        session = VoiceSession("voice-executor")
+        session.status = "active"
+        queue = MagicMock()
+        threads = []
+        queue.send_realtime.side_effect = lambda blob: threads.append(
+            threading.current_thread()
+        )
+        session.live_request_queue = queue
+        chunks = [np.full(960, i, dtype=np.int16).tobytes() for i in range(8)]
+
+        # Calls overlap while conversion runs off the loop
+        await asyncio.gather(*(session.send_audio(c, 16000) for c in chunks))
+        await session.flush_audio()
+
+        # LiveRequestQueue is only touched from the loop, in stream order
+        sent = b"".join(c.args[0].data for c in queue.send_realtime.call_args_list)
+        assert sent == b"".join(chunks)
+        assert set(threads) == {threading.current_thread()}
+        await session.cleanup()
@@ -0,0 +1,126 @@
+"""Tests for barge-in: dropping agent audio when the user talks over it."""
+
+from types import SimpleNamespace
+from unittest.mock import MagicMock
+
+import numpy as np
+import pytest
+
+from src.voice.outbound import coalesced_items
+from src.voice.session_manager import VoiceSession
+from src.voice.vad import VoiceActivityDetector
+
+RATE = 16000
+FRAME = 320  # 20ms
+
+
+def _tone(frames: int) -> bytes:
+    t = np.arange(frames * FRAME) / RATE
+    return (np.sin(2 * np.pi * 220 * t) * 8000).astype(np.int16).tobytes()
+
+
+def _silence(frames: int) -> bytes:
+    return np.zeros(frames * FRAME, dtype=np.int16).tobytes()
+
+
+def _audio_event(data: bytes):
+    part = SimpleNamespace(
+        inline_data=SimpleNamespace(mime_type="audio/pcm", data=data), text=None
+    )
+    return SimpleNamespace(content=SimpleNamespace(parts=[part]), turn_complete=False)
+
+
+def _transcript_event(text: str):
+    part = SimpleNamespace(inline_data=None, text=text)
+    return SimpleNamespace(
+        content=SimpleNamespace(parts=[part]), turn_complete=False, partial=False
+    )
+
+
+def _interrupted():
+    return SimpleNamespace(content=None, turn_complete=True, interrupted=True)
+
+
+def _drain(session: VoiceSession) -> list:
+    events = []
+    while not session.agent_queue.empty():
+        events.append(session.agent_queue.get_nowait())
+    return events
+
+
+class TestInterruptPlayback:
+    def test_queued_audio_is_dropped_and_other_messages_kept(self):
+        session = VoiceSession("voice-barge-in")
+        transcript = _transcript_event("Let me think")
+        for event in (_audio_event(b"a"), transcript, _audio_event(b"b")):
+            session.agent_queue.put_nowait(event)
+        session._agent_speaking = True
+
+        assert session.interrupt_playback() == 2
+        assert _drain(session) == [transcript, {"type": "stop_playback"}]
+        assert not session._agent_speaking
+
+    @pytest.mark.asyncio
+    async def test_model_interruption_drains_the_queue(self):
+        session = VoiceSession("voice-barge-in")
+        stop = _interrupted()
+
+        async def live_events():
+            for event in (_audio_event(b"a"), _audio_event(b"b"), stop):
+                yield event
+
+        session.live_events = live_events()
+        await session._stream_handler()
+
+        assert _drain(session) == [{"type": "stop_playback"}, stop]
+
+    @pytest.mark.asyncio
+    async def test_held_audio_is_discarded_by_the_coalescer(self):
+        session = VoiceSession("voice-barge-in")
+        session.status = "active"
+        for event in (
+            _audio_event(b"a" * 4),
+            _audio_event(b"b" * 4),
+            {"type": "stop_playback"},
+            _audio_event(b"c" * 4),
+        ):
+            session.agent_queue.put_nowait(event)
+
+        items = coalesced_items(session, budget_ms=100)
+        received = [await anext(items) for _ in range(3)]
+
+        assert received == [b"a" * 4, {"type": "stop_playback"}, b"c" * 4]
+
+
+class TestSpeechOnset:
+    def test_vad_counts_speech_starts(self):
+        vad = VoiceActivityDetector(hangover_ms=0, silence_keep_every=0)
+        vad.process(_silence(5) + _tone(5))
+        vad.process(_tone(5))
+        vad.process(_silence(5) + _tone(5))
+
+        assert vad.speech_starts == 2
+
+    @pytest.fixture
+    async def session(self):
+        voice_session = VoiceSession("voice-barge-in")
+        voice_session.status = "active"
+        voice_session.live_request_queue = MagicMock()
+        voice_session._vad = VoiceActivityDetector(hangover_ms=40, silence_keep_every=0)
+        yield voice_session
+        await voice_session.cleanup()
+
+    @pytest.mark.asyncio
+    async def test_user_speech_interrupts_agent_audio(self, session):
+        session.agent_queue.put_nowait(_audio_event(b"a"))
+        session._agent_speaking = True
+
+        await session.send_audio(_tone(6), RATE)
+
+        assert _drain(session) == [{"type": "stop_playback"}]
+
+    @pytest.mark.asyncio
+    async def test_user_speech_while_agent_is_silent_is_left_alone(self, session):
+        await session.send_audio(_tone(6), RATE)
+
+        assert session.agent_queue.empty()
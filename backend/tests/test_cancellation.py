@@ -0,0 +1,122 @@
+"""Tests for turn cancellation tokens."""
+
+import asyncio
+
+import pytest
+
+from src.utils.cancellation import (
+    CancellationToken,
+    TurnCancelledError,
+    TurnRegistry,
+)
+
+
+class TestCancellationToken:
+    """Test cancellation token behavior."""
+
+    @pytest.mark.asyncio
+    async def test_run_returns_result(self):
+        """Test that an uncancelled turn returns its result."""
+        token = CancellationToken(session_id="s1")
+
+        async def work():
+            return "done"
+
+        assert await token.run(work()) == "done"
+        assert not token.cancelled
+
+    @pytest.mark.asyncio
+    async def test_cancel_aborts_running_turn(self):
+        """Test that cancelling the token cancels the running task."""
+        token = CancellationToken(session_id="s1")
+        finished = False
+
+        async def slow_generation():
+            nonlocal finished
+            await asyncio.sleep(10)
+            finished = True
+
+        run_task = asyncio.create_task(token.run(slow_generation()))
+        await asyncio.sleep(0)
+        assert token.cancel("client_disconnected") is True
+
+        with pytest.raises(TurnCancelledError) as exc_info:
+            await run_task
+        assert exc_info.value.reason == "client_disconnected"
+        assert finished is False
+
+    @pytest.mark.asyncio
+    async def test_run_after_cancel_does_not_start(self):
+        """Test that a pre-cancelled token never starts the coroutine."""
+        token = CancellationToken(session_id="s1")
+        token.cancel("sse_shutdown")
+        started = False
+
+        async def work():
+            nonlocal started
+            started = True
+
+        with pytest.raises(TurnCancelledError):
+            await token.run(work())
+        assert started is False
+
+    def test_cancel_is_idempotent(self):
+        """Test that only the first cancel reason is kept."""
+        token = CancellationToken(session_id="s1")
+        assert token.cancel("first") is True
+        assert token.cancel("second") is False
+        assert token.reason == "first"
+        with pytest.raises(TurnCancelledError):
+            token.raise_if_cancelled()
+
+    @pytest.mark.asyncio
+    async def test_outer_cancellation_is_propagated(self):
+        """Test that caller cancellation is not reported as a token cancel."""
+        token = CancellationToken(session_id="s1")
+        run_task = asyncio.create_task(token.run(asyncio.sleep(10)))
+        await asyncio.sleep(0)
+        run_task.cancel()
+
+        with pytest.raises(asyncio.CancelledError):
+            await run_task
+        assert not token.cancelled
+
+
+class TestTurnRegistry:
+    """Test the in-flight turn registry."""
+
+    def test_open_close_tracks_inflight(self):
+        """Test in-flight accounting per session and globally."""
+        registry = TurnRegistry()
+        t1 = registry.open("s1")
+        registry.open("s1")
+        registry.open("s2")
+
+        assert registry.inflight_count("s1") == 2
+        assert registry.inflight_count() == 3
+
+        registry.close(t1)
+        assert registry.inflight_count("s1") == 1
+        assert registry.inflight_count() == 2
+
+    def test_cancel_session_only_hits_that_session(self):
+        """Test that cancelling a session leaves other sessions alone."""
+        registry = TurnRegistry()
+        t1 = registry.open("s1")
+        t2 = registry.open("s2")
+
+        assert registry.cancel_session("s1", "session_expired") == 1
+        assert t1.reason == "session_expired"
+        assert not t2.cancelled
+        assert registry.cancel_session("missing", "session_expired") == 0
+
+    def test_cancel_session_can_be_limited_to_one_connection(self):
+        """Test that a stale stream does not cancel a reconnected stream's turns."""
+        registry = TurnRegistry()
+        old_connection, new_connection = object(), object()
+        stale = registry.open("s1", owner=old_connection)
+        current = registry.open("s1", owner=new_connection)
+
+        assert registry.cancel_session("s1", "client_disconnected", old_connection) == 1
+        assert stale.cancelled
+        assert not current.cancelled
@@ -0,0 +1,91 @@
+"""Tests for the slotted orchestrator state and control data."""
+
+import pytest
+
+from src.agents.orchestrator import handle_turn
+from src.agents.state import (
+    STATE_FIELDS,
+    ControlBlock,
+    ControlData,
+    CoreState,
+    Phase,
+    SessionState,
+)
+from src.agents.state_delta import state_snapshot
+
+
+def _reply(next_phase: str) -> str:
+    return (
+        "<ui>Thanks.</ui><control>"
+        f'{{"next_phase":"{next_phase}","missing_fields":[],'
+        '"suggest_questions":[],"crisis_detected":false}</control>'
+    )
+
+
+class TestCoreState:
+    """Test the slotted state mirror."""
+
+    def test_fields_mirror_session_state(self):
+        """Test that both representations have the same fields and defaults."""
+        assert state_snapshot(CoreState()) == state_snapshot(SessionState())
+        assert set(STATE_FIELDS) <= set(CoreState.__slots__)
+
+    def test_is_slotted(self):
+        """Test that instances have no per-instance __dict__."""
+        with pytest.raises(AttributeError):
+            CoreState().unknown = 1  # type: ignore[attr-defined]
+
+    def test_handle_turn_on_core_state(self):
+        """Test that the orchestrator runs on the slotted state."""
+        core = CoreState()
+        result = handle_turn(core, "hello", lambda **kw: _reply("clarify"))
+        assert core.phase == Phase.CLARIFY
+        assert core.turn == 1
+        assert result["control"]["next_phase"] == "clarify"
+
+
+class TestControlData:
+    """Test control block validation without Pydantic."""
+
+    @pytest.mark.parametrize(
+        "data",
+        [
+            {"next_phase": "reframe"},
+            {
+                "next_phase": "summary",
+                "missing_fields": ["emotion"],
+                "suggest_questions": ["How strong?"],
+                "crisis_detected": True,
+                "confidence_shift": {"from": 70, "to": 45},
+            },
+            # Lax-mode coercions Pydantic accepts
+            {"next_phase": "clarify", "crisis_detected": 1},
+            {"next_phase": "clarify", "crisis_detected": "false"},
+            {"next_phase": "clarify", "confidence_shift": {"from": "70", "to": 45.0}},
+        ],
+    )
+    def test_valid_blocks_match_control_block(self, data):
+        """Test that accepted blocks dump like the Pydantic model."""
+        control = ControlData.from_dict(data)
+        assert control is not None
+        assert control.as_dict() == ControlBlock.model_validate(data).model_dump(
+            mode="json"
+        )
+
+    @pytest.mark.parametrize(
+        "data",
+        [
+            {},
+            {"next_phase": None},
+            {"next_phase": "nowhere"},
+            {"next_phase": "warmup", "missing_fields": "emotion"},
+            {"next_phase": "warmup", "crisis_detected": "maybe"},
+            {"next_phase": "warmup", "confidence_shift": {"from": "high"}},
+            {"next_phase": "warmup", "confidence_shift": {"from": 70.5}},
+            {"next_phase": "warmup", "missing_fields": [1]},
+            ["warmup"],
+        ],
+    )
+    def test_invalid_blocks_rejected(self, data):
+        """Test that blocks violating the contract are dropped."""
+        assert ControlData.from_dict(data) is None
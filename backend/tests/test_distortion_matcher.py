@@ -0,0 +1,85 @@
+"""Tests for the compiled distortion matcher."""
+
+from src.knowledge.cbt_context import COGNITIVE_DISTORTIONS, detect_distortions
+from src.knowledge.distortion_matcher import DistortionMatcher, get_distortion_matcher
+
+
+class TestDistortionMatcher:
+    """Test data-driven distortion detection."""
+
+    def test_every_distortion_has_indicators(self):
+        """Test that all taxonomy entries compile into rules."""
+        matcher = get_distortion_matcher()
+        assert matcher.codes == [d["code"] for d in COGNITIVE_DISTORTIONS.values()]
+
+    def test_examples_detect_their_own_code(self):
+        """Test that most taxonomy examples trigger their distortion."""
+        matcher = get_distortion_matcher()
+        for distortion in COGNITIVE_DISTORTIONS.values():
+            if distortion["code"] == "AO":
+                # The original absolute-word list misses "perfect"/"either"
+                continue
+            detected = matcher.detect_batch(distortion["examples"])
+            assert any(distortion["code"] in codes for codes in detected)
+
+    def test_word_boundaries(self):
+        """Test that terms do not match inside other words."""
+        # "ought" in "thought", "never" in "nevertheless"
+        assert detect_distortions("I thought about it nevertheless") == []
+
+    def test_prefix_terms(self):
+        """Test that starred terms also match longer word forms."""
+        assert "FT" in detect_distortions("It will be a failure")
+        assert "FT" not in detect_distortions("It will be a snail")
+
+    def test_all_groups_required(self):
+        """Test that conjunctive rules need a term from every group."""
+        assert "FT" not in detect_distortions("I fail sometimes")
+        assert "LB" not in detect_distortions("That idea is stupid")
+
+    def test_original_rules_and_order(self):
+        """Test that the original keyword rules keep their terms and order."""
+        thought = "I'm a loser who will always fail, I must stop"
+        assert detect_distortions(thought) == [
+            "AO",
+            "FT",
+            "SH",
+            "LB",
+        ]
+        assert detect_distortions("Either way works for me") == []
+        assert "LB" not in detect_distortions("She's so lazy")
+        assert "SH" not in detect_distortions("He has to leave early")
+
+    def test_typographic_apostrophe(self):
+        """Test that curly apostrophes match terms written with straight ones."""
+        assert "LB" in detect_distortions("I\u2019m such an idiot")
+
+    def test_score_counts_hits(self):
+        """Test that scores count indicator hits for detected codes only."""
+        scores = get_distortion_matcher().score("I always, always mess up")
+        assert scores == {"AO": 2}
+
+    def test_batch_matches_single_scoring(self):
+        """Test that batch scoring keeps thoughts separate and in order."""
+        matcher = get_distortion_matcher()
+        thoughts = [
+            "I should be perfect",
+            "",
+            "Everyone thinks\nI'm a loser",
+            "I will fail",
+            "Nothing special",
+        ]
+        assert matcher.score_batch(thoughts) == [matcher.score(t) for t in thoughts]
+        assert matcher.score_batch([]) == []
+
+    def test_custom_taxonomy(self):
+        """Test building a matcher from another taxonomy."""
+        matcher = DistortionMatcher(
+            {
+                "custom": {"code": "XX", "indicators": [["foo"], ["bar*"]]},
+                "no_rules": {"code": "YY"},
+            }
+        )
+        assert matcher.codes == ["XX"]
+        assert matcher.detect("Foo barring") == ["XX"]
+        assert matcher.detect("foo") == []
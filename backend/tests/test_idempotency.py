@@ -0,0 +1,144 @@
+"""Tests for the idempotency cache."""
+
+import asyncio
+
+import pytest
+
+from src.utils.idempotency import IdempotencyCache
+
+
+class TestIdempotencyCache:
+    """Test request deduplication."""
+
+    @pytest.mark.asyncio
+    async def test_duplicate_returns_original_result(self):
+        """Test that a completed key is replayed without rerunning work."""
+        cache: IdempotencyCache[str] = IdempotencyCache()
+        calls = 0
+
+        async def work():
+            nonlocal calls
+            calls += 1
+            return f"result-{calls}"
+
+        assert await cache.run("k1", work) == "result-1"
+        assert await cache.run("k1", work) == "result-1"
+        assert calls == 1
+
+    @pytest.mark.asyncio
+    async def test_duplicate_attaches_to_inflight_work(self):
+        """Test that concurrent duplicates share a single execution."""
+        cache: IdempotencyCache[str] = IdempotencyCache()
+        calls = 0
+        release = asyncio.Event()
+
+        async def work():
+            nonlocal calls
+            calls += 1
+            await release.wait()
+            return "done"
+
+        first = asyncio.create_task(cache.run("k1", work))
+        await asyncio.sleep(0)
+        second = asyncio.create_task(cache.run("k1", work))
+        await asyncio.sleep(0)
+        release.set()
+
+        assert await first == "done"
+        assert await second == "done"
+        assert calls == 1
+
+    @pytest.mark.asyncio
+    async def test_work_survives_first_caller_cancellation(self):
+        """Test that a retry can attach after the original caller went away."""
+        cache: IdempotencyCache[str] = IdempotencyCache()
+        release = asyncio.Event()
+
+        async def work():
+            await release.wait()
+            return "done"
+
+        first = asyncio.create_task(cache.run("k1", work))
+        await asyncio.sleep(0)
+        first.cancel()
+        with pytest.raises(asyncio.CancelledError):
+            await first
+
+        retry = asyncio.create_task(cache.run("k1", work))
+        await asyncio.sleep(0)
+        release.set()
+        assert await retry == "done"
+
+    @pytest.mark.asyncio
+    async def test_failed_work_is_forgotten(self):
+        """Test that a retry after a failure runs the work again."""
+        cache: IdempotencyCache[str] = IdempotencyCache()
+        attempts = 0
+
+        async def flaky():
+            nonlocal attempts
+            attempts += 1
+            if attempts == 1:
+                raise RuntimeError("upstream error")
+            return "ok"
+
+        with pytest.raises(RuntimeError):
+            await cache.run("k1", flaky)
+        assert "k1" not in cache
+        assert await cache.run("k1", flaky) == "ok"
+        assert attempts == 2
+
+    @pytest.mark.asyncio
+    async def test_retain_predicate(self):
+        """Test that rejected results are not remembered."""
+        cache: IdempotencyCache[str] = IdempotencyCache(
+            retain=lambda result: result != "cancelled"
+        )
+
+        async def cancelled():
+            return "cancelled"
+
+        assert await cache.run("k1", cancelled) == "cancelled"
+        assert "k1" not in cache
+
+    @pytest.mark.asyncio
+    async def test_ttl_and_capacity_bounds(self):
+        """Test that keys expire and that the cache stays bounded."""
+        cache: IdempotencyCache[int] = IdempotencyCache(max_entries=2, ttl_seconds=60)
+
+        async def work():
+            return 1
+
+        for key in ("a", "b", "c"):
+            await cache.run(key, work)
+        assert len(cache) == 2
+        assert "a" not in cache
+
+        expired: IdempotencyCache[int] = IdempotencyCache(ttl_seconds=0)
+        await expired.run("a", work)
+        assert "a" not in expired
+
+    @pytest.mark.asyncio
+    async def test_capacity_never_evicts_inflight_work(self):
+        """Test that a full cache keeps running keys so retries still attach."""
+        cache: IdempotencyCache[str] = IdempotencyCache(max_entries=1)
+        calls = 0
+        release = asyncio.Event()
+
+        async def work():
+            nonlocal calls
+            calls += 1
+            await release.wait()
+            return "done"
+
+        first = asyncio.create_task(cache.run("a", work))
+        second = asyncio.create_task(cache.run("b", work))
+        await asyncio.sleep(0)
+        retry = asyncio.create_task(cache.run("a", work))
+        await asyncio.sleep(0)
+        assert len(cache) == 2
+
+        release.set()
+        assert await asyncio.gather(first, second, retry) == ["done"] * 3
+        assert calls == 2
+        assert len(cache) == 1
@@ -0,0 +1,130 @@
+"""Tests for upstream audio jitter buffering."""
+
+import asyncio
+from unittest.mock import MagicMock, patch
+
+import numpy as np
+import pytest
+
+from src.voice.jitter_buffer import FrameAggregator, ReorderBuffer
+from src.voice.session_manager import VoiceSession
+
+
+class TestReorderBuffer:
+    def test_releases_in_timestamp_order(self):
+        buffer: ReorderBuffer[str] = ReorderBuffer(depth=2)
+        released = []
+        for timestamp in (10, 30, 20, 40, 50):
+            released += buffer.push(timestamp, f"t{timestamp}")
+        released += buffer.drain()
+
+        assert released == ["t10", "t20", "t30", "t40", "t50"]
+        assert len(buffer) == 0
+
+    def test_too_late_items_are_dropped(self):
+        buffer: ReorderBuffer[str] = ReorderBuffer(depth=0)
+        assert buffer.push(20, "a") == ["a"]
+        assert buffer.push(10, "late") == []
+        assert buffer.late_drops == 1
+
+    def test_equal_timestamps_keep_arrival_order(self):
+        buffer: ReorderBuffer[str] = ReorderBuffer(depth=1)
+        out = buffer.push(5, "a") + buffer.push(5, "b") + buffer.drain()
+        assert out == ["a", "b"]
+
+
+class TestFrameAggregator:
+    def test_packs_fixed_frames(self):
+        aggregator = FrameAggregator(4)
+        assert aggregator.push(b"ab") == []
+        assert aggregator.push(b"cdefghij") == [b"abcd", b"efgh"]
+        assert aggregator.pending_bytes == 2
+        assert aggregator.flush() == b"ij"
+        assert aggregator.flush() == b""
+
+    def test_pcm16_frame_size(self):
+        assert FrameAggregator.for_pcm16(16000, frame_ms=60).frame_bytes == 1920
+
+
+class TestVoiceSessionJitterBuffer:
+    @pytest.fixture
+    async def session(self):
+        voice_session = VoiceSession("voice-jitter")
+        voice_session.status = "active"
+        voice_session.live_request_queue = MagicMock()
+        yield voice_session
+        await voice_session.cleanup()
+
+    @staticmethod
+    def _sent(session) -> bytes:
+        calls = session.live_request_queue.send_realtime.call_args_list
+        return b"".join(c.args[0].data for c in calls)
+
+    @pytest.mark.asyncio
+    async def test_reordered_chunks_are_sent_in_order(self, session):
+        # 20ms chunks at 16kHz, each filled with its own index
+        chunks = [np.full(320, i, dtype=np.int16).tobytes() for i in range(6)]
+        for i in (0, 2, 1, 3, 5, 4):
+            await session.send_audio(chunks[i], 16000, timestamp=i * 20)
+        await session.flush_audio()
+
+        assert self._sent(session) == b"".join(chunks)
+        # 120ms of audio in 60ms frames instead of six 20ms messages
+        assert session.upstream_messages == 2
+
+    @pytest.mark.asyncio
+    async def test_timer_flushes_partial_frame(self, session):
+        with patch("src.voice.session_manager.AUDIO_FLUSH_INTERVAL_MS", 10):
+            await session.send_audio(b"\x01\x00" * 160, 16000)
+            assert session.upstream_messages == 0
+            await asyncio.sleep(0.05)
+
+        assert self._sent(session) == b"\x01\x00" * 160
+
+    @pytest.mark.asyncio
+    async def test_untimestamped_chunk_keeps_arrival_order(self, session):
+        chunks = [np.full(320, i, dtype=np.int16).tobytes() for i in range(3)]
+        await session.send_audio(chunks[0], 16000, timestamp=0)
+        await session.send_audio(chunks[1], 16000)
+        await session.send_audio(chunks[2], 16000, timestamp=40)
+        await session.flush_audio()
+
+        assert self._sent(session) == b"".join(chunks)
+
+    @pytest.mark.asyncio
+    async def test_flush_timer_only_runs_while_audio_is_buffered(self, session):
+        # Exactly one 60ms frame: nothing is held back
+        await session.send_audio(b"\x01\x00" * 960, 16000)
+        assert session._flush_task is None
+
+        with patch("src.voice.session_manager.AUDIO_FLUSH_INTERVAL_MS", 10):
+            await session.send_audio(b"\x01\x00" * 160, 16000)
+            flush_task = session._flush_task
+            assert flush_task is not None
+            await asyncio.wait_for(flush_task, timeout=1)
+        assert session.upstream_messages == 2
+
+    @pytest.mark.asyncio
+    async def test_end_turn_flushes(self, session):
+        await session.send_audio(b"\x01\x00" * 160, 16000, timestamp=0)
+        await session.send_control("end_turn")
+        assert self._sent(session) == b"\x01\x00" * 160
+
+    @pytest.mark.asyncio
+    async def test_invalid_chunk_fails_its_own_call(self, session):
+        with pytest.raises(ValueError):
+            await session.send_audio(b"\x00" * 3, 16000, timestamp=0)
+
+
+class TestAudioSequence:
+    def test_out_of_order_sequences_accepted_once(self):
+        session = VoiceSession("voice-seq")
+        assert session.accept_audio_sequence(2)
+        assert session.accept_audio_sequence(1)
+        assert not session.accept_audio_sequence(1)
+        assert not session.accept_audio_sequence(2)
+
+    def test_old_sequences_rejected(self):
+        session = VoiceSession("voice-seq")
+        assert session.accept_audio_sequence(100)
+        assert not session.accept_audio_sequence(10)
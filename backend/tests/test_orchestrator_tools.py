@@ -37,6 +37,65 @@ class TestCrisisDetection:
         """Test crisis keyword detection."""
         assert crisis_scan(text) == expected
 
+    @pytest.mark.parametrize(
+        "text",
+        [
+            "Quiero quitarme la vida",
+            "Penso em suicídio",
+            "Ich denke an SELBSTMORD",
+            "Je veux en finir",
+            "Ik denk aan zelfmoord",
+            "Myślę o samobójstwie",
+            "もう死にたい",
+            "我不想活了",
+            "자살을 생각해요",
+            "मैं आत्महत्या के बारे में सोचता हूं",
+            "I keep thinking I'd be better off dead",
+        ],
+    )
+    def test_crisis_scan_multilingual(self, text):
+        """Test that every language pack is checked, ignoring case and accents."""
+        assert crisis_scan(text) is True
+
+    @pytest.mark.parametrize(
+        "text",
+        [
+            "I overdosed last night",
+            "I keep self-harming",
+            "I have been cutting again",
+            "I am suicidal",
+            "I thought about killing myself",
+            "Pensé en suicidarme",
+        ],
+    )
+    def test_crisis_scan_inflected_forms(self, text):
+        """Test that prefix terms catch inflected endings."""
+        assert crisis_scan(text) is True
+
+    @pytest.mark.parametrize(
+        "text",
+        [
+            "halfway outside",
+            "I found a way out of the parking garage",
+            "can't go on vacation this year",
+            "Fritzen called",
+            "Nous allons en finir avec ce travail",
+            "I'm cutting back on coffee",
+            "I overdid it at the gym",
+        ],
+    )
+    def test_crisis_scan_ignores_benign_text(self, text):
+        """Test that terms only match whole words and ambiguous phrases are gone."""
+        assert crisis_scan(text) is False
+
+    def test_crisis_term_packs_cover_supported_languages(self):
+        """Test that each supported language has a term pack."""
+        from src.agents.crisis import CRISIS_TERM_PACKS
+        from src.utils.language_utils import SUPPORTED_LANGUAGES
+
+        for code in SUPPORTED_LANGUAGES:
+            assert CRISIS_TERM_PACKS.get(code.split("-")[0])
+
     def test_safety_message_english(self):
         """Test English safety message."""
         message = safety_message("en")
@@ -6,6 +6,7 @@ import time
 import pytest
 
 from src.utils.performance_monitor import (
+    LatencyHistogram,
     PerformanceMetrics,
     PerformanceMonitor,
     get_performance_monitor,
@@ -177,3 +178,75 @@ class TestPerformanceMonitor:
 
         assert monitor.metrics.request_count == 1
         assert monitor.metrics.error_count == 1
+
+    def test_record_turn_cancelled(self):
+        """Test that cancelled turns are counted by reason."""
+        monitor = PerformanceMonitor()
+        monitor.record_turn_cancelled("session-1", "client_disconnected")
+        monitor.record_turn_cancelled("session-2", "client_disconnected")
+        monitor.record_turn_cancelled("session-3", "session_expired")
+
+        summary = monitor.get_metrics()
+        assert summary["cancelled_turns"]["total"] == 3
+        assert summary["cancelled_turns"]["by_reason"] == {
+            "client_disconnected": 2,
+            "session_expired": 1,
+        }
+
+    def test_record_voice_session_created(self):
+        """Test that pool hits, misses and creation latency are summarized."""
+        monitor = PerformanceMonitor()
+        monitor.record_voice_session_created(0.01, pooled=True)
+        monitor.record_voice_session_created(0.02, pooled=True)
+        monitor.record_voice_session_created(1.5, pooled=False)
+
+        pool = monitor.get_metrics()["voice_session_pool"]
+        assert pool["hits"] == 2
+        assert pool["misses"] == 1
+        assert pool["hit_rate"] == pytest.approx(2 / 3)
+        assert pool["create_latency"]["p50"] == 0.02
+        assert pool["create_latency"]["max"] == 1.5
+
+    def test_record_voice_latency(self):
+        """Test that voice stage latencies feed per-stage histograms."""
+        monitor = PerformanceMonitor()
+        for duration in (0.004, 0.004, 0.004, 0.3):
+            monitor.record_voice_latency("resample", duration)
+        monitor.record_voice_latency("enqueue", 0.02)
+
+        latency = monitor.get_metrics()["voice_latency"]
+        assert set(latency) == {"resample", "enqueue"}
+        resample = latency["resample"]
+        assert resample["count"] == 4
+        assert resample["p50"] == 0.005  # upper bound of its bucket
+        assert resample["p99"] == 0.3  # capped by the max
+        assert resample["buckets_ms"]["5"] == 3
+        assert resample["buckets_ms"]["500"] == 1
+
+    def test_record_time_to_first_audio(self):
+        """Test that time to first audio is summarized per session."""
+        monitor = PerformanceMonitor()
+        monitor.record_time_to_first_audio("voice-1", 0.8)
+        monitor.record_time_to_first_audio("voice-1", 0.4)
+        monitor.record_time_to_first_audio("voice-2", 0.5)
+
+        summary = monitor.get_metrics()
+        assert summary["voice_ttfa"]["voice-1"] == {
+            "first": 0.8,
+            "last": 0.4,
+            "avg": pytest.approx(0.6),
+            "turns": 2,
+        }
+        assert summary["voice_latency"]["first_audio"]["count"] == 3
+
+
+class TestLatencyHistogram:
+    """Test the fixed-bucket latency histogram."""
+
+    def test_overflow_bucket_and_empty_quantiles(self):
+        histogram = LatencyHistogram()
+        assert histogram.quantile(0.5) == 0.0
+
+        histogram.observe(30.0)
+        assert histogram.summary()["buckets_ms"]["+Inf"] == 1
+        assert histogram.quantile(0.99) == 30.0
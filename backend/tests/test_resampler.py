@@ -0,0 +1,83 @@
+"""Tests for polyphase resampling."""
+
+import numpy as np
+import pytest
+
+from src.utils.resampler import (
+    FILTER_HALF_LENGTH,
+    StreamingResampler,
+    filter_coefficients,
+    rational_ratio,
+    resample,
+)
+
+RATES = [8000, 22050, 24000, 44100, 48000]
+
+
+def _chunked(resampler: StreamingResampler, samples: np.ndarray, seed: int = 0):
+    rng = np.random.default_rng(seed)
+    parts, start = [], 0
+    while start < len(samples):
+        size = int(rng.integers(1, 2000))
+        parts.append(resampler.process(samples[start : start + size]))
+        start += size
+    return np.concatenate(parts)
+
+
+class TestRationalRatio:
+    def test_reduces_rates(self):
+        assert rational_ratio(48000, 16000) == (1, 3)
+        assert rational_ratio(44100, 16000) == (160, 441)
+        assert rational_ratio(8000, 16000) == (2, 1)
+
+    def test_rejects_invalid_rates(self):
+        with pytest.raises(ValueError):
+            rational_ratio(0, 16000)
+
+    def test_coefficients_are_cached(self):
+        assert filter_coefficients(1, 3) is filter_coefficients(1, 3)
+
+
+class TestStreamingResampler:
+    @pytest.mark.parametrize("in_rate", RATES)
+    def test_chunking_does_not_change_output(self, in_rate):
+        samples = np.random.default_rng(1).standard_normal(in_rate // 2)
+        whole = StreamingResampler(in_rate, 16000).process(samples)
+        chunked = _chunked(StreamingResampler(in_rate, 16000), samples)
+        np.testing.assert_allclose(chunked, whole, atol=1e-9)
+
+    @pytest.mark.parametrize("in_rate", RATES)
+    def test_matches_whole_buffer_resampling_after_filter_delay(self, in_rate):
+        samples = np.random.default_rng(2).standard_normal(in_rate // 2)
+        streamed = StreamingResampler(in_rate, 16000).process(samples)
+        reference = resample(samples, in_rate, 16000)
+        up, down = rational_ratio(in_rate, 16000)
+        delay = FILTER_HALF_LENGTH * max(up, down) // down
+        np.testing.assert_allclose(
+            streamed[delay:], reference[: len(streamed) - delay], atol=1e-9
+        )
+
+    def test_output_rate(self):
+        resampler = StreamingResampler(48000, 16000)
+        total = sum(len(resampler.process(np.zeros(480))) for _ in range(100))
+        assert total == 16000
+
+    def test_no_boundary_artifacts_in_sine(self):
+        t = np.arange(48000) / 48000
+        tone = np.sin(2 * np.pi * 440 * t) * 10000
+        pcm = tone.astype(np.int16).tobytes()
+        resampler = StreamingResampler(48000, 16000)
+        # 20ms chunks, as sent by the browser
+        out = b"".join(
+            resampler.process_pcm16(pcm[i : i + 1920]) for i in range(0, len(pcm), 1920)
+        )
+        result = np.frombuffer(out, dtype=np.int16).astype(np.float64)
+        t_out = (np.arange(len(result)) - FILTER_HALF_LENGTH) / 16000
+        expected = np.sin(2 * np.pi * 440 * t_out) * 10000
+        steady = slice(100, -100)
+        assert np.max(np.abs(result[steady] - expected[steady])) < 100
+
+    def test_same_rate_passthrough(self):
+        samples = np.arange(10, dtype=np.int16)
+        out = StreamingResampler(16000, 16000).process(samples)
+        np.testing.assert_array_equal(out, samples)
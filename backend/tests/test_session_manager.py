@@ -6,6 +6,7 @@ from unittest.mock import MagicMock
 
 import pytest
 
+from src.utils.cancellation import turn_registry
 from src.utils.session_manager import SessionInfo, SessionManager
 
 
@@ -144,6 +145,18 @@ class TestSessionManager:
         # Remove non-existent session
         assert manager.remove_session("non-existent") is None
 
+    def test_remove_session_cancels_inflight_turns(self):
+        """Test that removing a session aborts its in-flight turns."""
+        manager = SessionManager()
+        manager.create_session("test-123", "user-456")
+        token = turn_registry.open("test-123")
+
+        try:
+            manager.remove_session("test-123", reason="session_expired")
+            assert token.reason == "session_expired"
+        finally:
+            turn_registry.close(token)
+
     def test_get_active_session_count(self):
         """Test counting active sessions."""
         manager = SessionManager()
@@ -157,6 +170,20 @@ class TestSessionManager:
         manager.remove_session("test-1")
         assert manager.get_active_session_count() == 1
 
+    def test_get_live_session_count(self):
+        """Test that idle sessions without a stream are not counted as live."""
+        manager = SessionManager()
+        recent = manager.create_session("recent", "user-1")
+        idle = manager.create_session("idle", "user-2")
+        streaming = manager.create_session("streaming", "user-3")
+        idle.last_activity -= 600
+        streaming.last_activity -= 600
+        streaming.stream_open = True
+
+        assert manager.get_live_session_count(idle_seconds=120) == 2
+        assert manager.get_active_session_count() == 3
+        assert recent.inactive_seconds < 120
+
     @pytest.mark.asyncio
     async def test_periodic_cleanup(self):
         """Test automatic cleanup of expired sessions."""
@@ -0,0 +1,121 @@
+"""Tests for speculative distortion analysis."""
+
+import threading
+from concurrent.futures import ThreadPoolExecutor
+
+from src.agents.composer import retrieve_micro_knowledge
+from src.agents.parser_agent import parse_parser_output
+from src.agents.speculative import SpeculativeParser
+from src.agents.state import CoreState, Phase, SessionState
+from src.agents.state_delta import encode_state
+
+ANALYSIS = {
+    "thought_analyzed": "They think I'm useless",
+    "identified_distortions": [
+        {"code": "MW", "name": "Mind Reading", "evidence": "They think"},
+        {"code": "LB", "name": "Labeling", "evidence": ""},
+    ],
+    "primary_distortion": "MW",
+}
+
+
+class TestSpeculativeParser:
+    """Test launching and collecting background analyses."""
+
+    def test_launch_only_in_parser_phases(self):
+        """Test that analyses start during CLARIFY/REFRAME only."""
+        parser = SpeculativeParser(lambda text: ANALYSIS)
+        try:
+            assert parser.launch(CoreState(phase=Phase.WARMUP), "hi") is False
+            assert parser.launch(CoreState(phase=Phase.CLARIFY), "   ") is False
+            assert parser.launch(CoreState(phase=Phase.CLARIFY), "hi") is True
+        finally:
+            parser.shutdown()
+
+    def test_harvest_stores_finished_result(self):
+        """Test that a finished analysis lands on the state next turn."""
+        parser = SpeculativeParser(lambda text: ANALYSIS)
+        state = CoreState(phase=Phase.REFRAME)
+        try:
+            parser.launch(state, "They think I'm useless")
+            state._pending_analysis.result(timeout=5)
+            assert parser.harvest(state) is True
+            assert state.distortion_analysis == ANALYSIS
+            assert state._pending_analysis is None
+        finally:
+            parser.shutdown()
+
+    def test_harvest_does_not_wait(self):
+        """Test that an unfinished analysis never blocks the turn."""
+        release = threading.Event()
+
+        def slow(text):
+            release.wait(timeout=5)
+            return ANALYSIS
+
+        executor = ThreadPoolExecutor(max_workers=1)
+        parser = SpeculativeParser(slow, executor=executor)
+        state = CoreState(phase=Phase.CLARIFY)
+        parser.launch(state, "thought")
+
+        assert parser.harvest(state) is False
+        assert state.distortion_analysis is None
+        release.set()
+        executor.shutdown(wait=True)
+
+    def test_failed_analysis_is_dropped(self):
+        """Test that analyzer errors do not reach the turn."""
+
+        def broken(text):
+            raise RuntimeError("model unavailable")
+
+        parser = SpeculativeParser(broken)
+        state = CoreState(phase=Phase.CLARIFY)
+        try:
+            parser.launch(state, "thought")
+            state._pending_analysis.result(timeout=5)
+            assert parser.harvest(state) is False
+            assert state.distortion_analysis is None
+        finally:
+            parser.shutdown()
+
+
+class TestPrecomputedDistortions:
+    """Test use of cached analyses in the next prompt."""
+
+    def test_reframe_knowledge_includes_analysis(self):
+        """Test that REFRAME micro-knowledge lists precomputed distortions."""
+        state = CoreState(phase=Phase.REFRAME, distortion_analysis=ANALYSIS)
+        kb = retrieve_micro_knowledge(state)
+        assert "MW (They think)" in kb
+        assert "; LB" in kb
+
+    def test_other_phases_ignore_analysis(self):
+        """Test that the analysis is only injected during REFRAME."""
+        state = CoreState(phase=Phase.CLARIFY, distortion_analysis=ANALYSIS)
+        assert "pre-analysis" not in retrieve_micro_knowledge(state)
+
+    def test_analysis_is_not_sent_with_state(self):
+        """Test that the analysis stays out of client deltas and snapshots."""
+        for state in (
+            CoreState(phase=Phase.REFRAME, distortion_analysis=ANALYSIS),
+            SessionState(phase=Phase.REFRAME, distortion_analysis=ANALYSIS),
+        ):
+            payload = encode_state(state, full=True)
+            assert "distortion_analysis" not in payload["state"]
+            assert "distortion_analysis" not in payload["state_delta"]
+
+
+class TestParseParserOutput:
+    """Test extraction of the parser JSON."""
+
+    def test_fenced_json(self):
+        """Test that fenced JSON replies are parsed."""
+        raw = '```json\n{"identified_distortions": []}\n```'
+        assert parse_parser_output(raw) == {"identified_distortions": []}
+
+    def test_invalid_output(self):
+        """Test that non-analysis replies are rejected."""
+        assert parse_parser_output("not json") is None
+        assert parse_parser_output('{"other": 1}') is None
+        assert parse_parser_output("") is None
@@ -0,0 +1,104 @@
+"""Tests for versioned state deltas in turn payloads."""
+
+from src.agents.orchestrator import handle_turn
+from src.agents.state import Phase, SessionState
+from src.agents.state_delta import encode_state, state_snapshot
+
+
+def _reply(next_phase: str) -> str:
+    return (
+        "<ui>Thanks.</ui><control>"
+        f'{{"next_phase":"{next_phase}","missing_fields":[],'
+        '"suggest_questions":[],"crisis_detected":false}</control>'
+    )
+
+
+class TestStateSnapshot:
+    """Test the lightweight state snapshot."""
+
+    def test_snapshot_matches_json_dump(self):
+        """Test that the snapshot equals a JSON-mode Pydantic dump."""
+        state = SessionState(phase=Phase.REFRAME, suds_pre=60)
+        assert state_snapshot(state) == state.model_dump(mode="json")
+
+    def test_snapshot_copies_dicts(self):
+        """Test that later in-place updates do not change the snapshot."""
+        state = SessionState()
+        snapshot = state_snapshot(state)
+        state.progress["thought"] = True
+        assert snapshot["progress"]["thought"] is False
+
+
+class TestEncodeState:
+    """Test state versioning and diffing."""
+
+    def test_first_encoding_is_full(self):
+        """Test that version 1 always carries the full snapshot."""
+        state = SessionState()
+        payload = encode_state(state)
+        assert payload["state_version"] == 1
+        assert payload["state_base_version"] == 0
+        assert payload["state"] == state.model_dump(mode="json")
+
+    def test_only_changed_fields_are_sent(self):
+        """Test that later encodings carry just the delta."""
+        state = SessionState()
+        encode_state(state)
+        state.turn = 1
+        state.progress["situation"] = True
+
+        payload = encode_state(state)
+        assert payload["state_version"] == 2
+        assert payload["state_base_version"] == 1
+        assert "state" not in payload
+        assert payload["state_delta"] == {
+            "turn": 1,
+            "progress": {
+                "situation": True,
+                "thought": False,
+                "emotion": False,
+                "intensity": False,
+            },
+        }
+
+    def test_unchanged_state_keeps_version(self):
+        """Test that an empty delta does not bump the version."""
+        state = SessionState()
+        encode_state(state)
+        payload = encode_state(state)
+        assert payload["state_delta"] == {}
+        assert payload["state_version"] == payload["state_base_version"] == 1
+
+    def test_full_snapshot_on_request(self):
+        """Test that clients can ask for the complete state."""
+        state = SessionState()
+        encode_state(state)
+        payload = encode_state(state, full=True)
+        assert payload["state"] == state_snapshot(state)
+
+
+class TestHandleTurnPayload:
+    """Test delta payloads produced by the orchestrator."""
+
+    def test_turns_emit_deltas(self):
+        """Test that consecutive turns send versioned deltas."""
+        state = SessionState()
+        first = handle_turn(state, "hello", lambda **kw: _reply("warmup"))
+        second = handle_turn(state, "more", lambda **kw: _reply("clarify"))
+
+        assert first["state"]["turn"] == 1
+        assert second["state_base_version"] == first["state_version"]
+        assert second["state_delta"] == {"phase": "clarify", "turn": 2}
+        assert "state" not in second
+
+    def test_llm_receives_plain_state(self):
+        """Test that the model adapter gets a JSON-ready state dict."""
+        state = SessionState()
+        seen = {}
+
+        def llm(**kwargs):
+            seen.update(kwargs["state"])
+            return _reply("warmup")
+
+        handle_turn(state, "hello", llm, full_state=True)
+        assert seen["phase"] == "warmup"
@@ -0,0 +1,115 @@
+"""Tests for the bounded session state store."""
+
+import threading
+import time
+
+import pytest
+
+from src.agents.state import Phase
+from src.agents.state_store import SessionStateStore
+
+
+class TestSessionStateStore:
+    """Test storage, eviction and locking of session states."""
+
+    def test_get_or_create_returns_same_state(self):
+        """Test that states are created once and updated in place."""
+        store = SessionStateStore()
+        state = store.get_or_create("s1")
+        state.phase = Phase.CLARIFY
+        assert store.get_or_create("s1") is state
+        assert store.get("s1").phase == Phase.CLARIFY
+        assert store.get("missing") is None
+
+    def test_lru_eviction(self):
+        """Test that the least recently used session is evicted at capacity."""
+        store = SessionStateStore(max_sessions=2, stripes=1)
+        store.get_or_create("a")
+        store.get_or_create("b")
+        store.get("a")  # refresh "a"
+        store.get_or_create("c")
+
+        assert "a" in store
+        assert "b" not in store
+        assert "c" in store
+        assert len(store) == 2
+        assert store.evictions == 1
+
+    def test_idle_expiry(self, monkeypatch):
+        """Test that idle sessions expire after the TTL."""
+        store = SessionStateStore(idle_ttl_seconds=10)
+        now = time.monotonic()
+        monkeypatch.setattr(time, "monotonic", lambda: now)
+        store.get_or_create("old")
+
+        monkeypatch.setattr(time, "monotonic", lambda: now + 11)
+        assert "old" not in store
+        assert store.expirations == 1
+
+    def test_memory_flat_under_churn(self):
+        """Test that the store never grows past its bound."""
+        store = SessionStateStore(max_sessions=64, stripes=8)
+        for i in range(5_000):
+            store.get_or_create(f"session-{i}")
+        assert len(store) <= 64
+
+    def test_delete_and_pop(self):
+        """Test explicit removal of sessions."""
+        store = SessionStateStore()
+        state = store.get_or_create("s1")
+        assert store.pop("s1") is state
+        assert store.pop("s1") is None
+        store.get_or_create("s2")
+        del store["s2"]
+        with pytest.raises(KeyError):
+            del store["s2"]
+
+    def test_session_serializes_same_session_only(self):
+        """Test that turns of different sessions do not wait for each other."""
+        store = SessionStateStore(stripes=1)
+        entered = threading.Event()
+        release = threading.Event()
+
+        def slow_turn():
+            with store.session("busy"):
+                entered.set()
+                release.wait(timeout=5)
+
+        worker = threading.Thread(target=slow_turn)
+        worker.start()
+        assert entered.wait(timeout=5)
+
+        # Same stripe, different session: must not block
+        with store.session("other") as state:
+            state.turn += 1
+        assert store.get("other").turn == 1
+
+        release.set()
+        worker.join(timeout=5)
+
+    def test_session_in_use_is_not_evicted(self):
+        """Test that a turn keeps its session through LRU eviction."""
+        store = SessionStateStore(max_sessions=1, stripes=1)
+        with store.session("busy") as state:
+            store.get_or_create("other")
+            state.turn += 1
+            assert "busy" in store
+            assert store.get("busy") is state
+
+        assert store.get("busy").turn == 1
+        # Back to capacity once the turn ended
+        store.get_or_create("next")
+        assert len(store) == 1
+
+    def test_session_in_use_does_not_expire(self, monkeypatch):
+        """Test that a long turn outlives the idle TTL."""
+        store = SessionStateStore(idle_ttl_seconds=10)
+        now = time.monotonic()
+        monkeypatch.setattr(time, "monotonic", lambda: now)
+        with store.session("slow") as state:
+            monkeypatch.setattr(time, "monotonic", lambda: now + 11)
+            assert "slow" in store
+            state.turn += 1
+
+        assert store.get("slow").turn == 1
+        assert store.expirations == 0
@@ -0,0 +1,82 @@
+"""Tests for the streamed-reply early-stop guard."""
+
+from src.agents.stream_guard import (
+    CHARS_PER_TOKEN,
+    DEFAULT_TOKEN_CAP,
+    ControlStreamGuard,
+    phase_token_cap,
+)
+
+CONTROL = '<control>{"next_phase":"clarify","missing_fields":[]}</control>'
+
+
+def _feed_all(guard: ControlStreamGuard, chunks: list[str]) -> int:
+    """Feed chunks until the guard stops; return how many were consumed."""
+    for count, chunk in enumerate(chunks, start=1):
+        if guard.feed(chunk):
+            return count
+    return len(chunks)
+
+
+class TestControlStreamGuard:
+    """Test stop decisions on streamed text."""
+
+    def test_stops_when_control_closes(self):
+        """Test that reading stops at a valid control block, tail dropped."""
+        guard = ControlStreamGuard()
+        reply = "<ui>Tell me more.</ui>" + CONTROL + " and some trailing chatter"
+        chunks = [reply[i : i + 7] for i in range(0, len(reply), 7)]
+
+        consumed = _feed_all(guard, chunks)
+
+        assert guard.stop_reason == "control_closed"
+        assert consumed < len(chunks)
+        assert guard.text == "<ui>Tell me more.</ui>" + CONTROL
+
+    def test_closing_tag_split_across_chunks(self):
+        """Test that a tag split between chunks is still detected."""
+        guard = ControlStreamGuard()
+        assert not guard.feed('<ui>Hi</ui><control>{"next_phase":"warmup"}</con')
+        assert guard.feed("trol>extra")
+        assert guard.text.endswith("</control>")
+
+    def test_closing_tag_is_case_insensitive(self):
+        """Test that an upper-case closing tag is found across chunks."""
+        guard = ControlStreamGuard()
+        assert not guard.feed('<ui>Hi</ui><CONTROL>{"next_phase":"warmup"}</CON')
+        assert guard.feed("TROL> tail")
+        assert guard.text.endswith("</CONTROL>")
+
+    def test_invalid_control_keeps_streaming(self):
+        """Test that a malformed block does not stop the stream."""
+        guard = ControlStreamGuard()
+        assert not guard.feed("<ui>Hi</ui><control>{not json}</control>")
+        assert guard.stop_reason is None
+        assert guard.feed('<control>{"next_phase":"warmup"}</control>')
+        assert guard.stop_reason == "control_closed"
+
+    def test_token_cap(self):
+        """Test that the budget stops runaway replies."""
+        guard = ControlStreamGuard(max_tokens=10)
+        consumed = _feed_all(guard, ["word " * 3] * 20)
+        assert guard.stop_reason == "token_cap"
+        assert len(guard.text) >= 10 * CHARS_PER_TOKEN
+        assert consumed < 20
+
+    def test_feed_after_stop(self):
+        """Test that a stopped guard ignores further chunks."""
+        guard = ControlStreamGuard()
+        guard.feed("<ui>a</ui>" + CONTROL)
+        text = guard.text
+        assert guard.feed("more")
+        assert guard.text == text
+
+
+class TestPhaseTokenCap:
+    """Test per-phase budgets."""
+
+    def test_known_and_unknown_phases(self):
+        """Test phase lookup and fallback."""
+        assert phase_token_cap("summary") > phase_token_cap("clarify")
+        assert phase_token_cap("REFRAME") == phase_token_cap("reframe")
+        assert phase_token_cap(None) == DEFAULT_TOKEN_CAP
@@ -1,5 +1,6 @@
 """Tests for the text router endpoints."""
 
+import asyncio
 from unittest.mock import AsyncMock, MagicMock, patch
 
 import pytest
@@ -13,6 +14,7 @@ with (
 ):
     from src.main import app
 
+from src.utils.cancellation import turn_registry
 from src.utils.session_manager import SessionInfo as SessionInfoModel
 
 
@@ -131,6 +133,88 @@ class TestMessageEndpoints:
             assert response.status_code == 200
             assert response.json()["status"] == "sent"
 
+    def test_send_message_idempotent_retry(self, client, mock_session_manager):
+        """Test that a retried message with the same key runs a single turn."""
+        mock_session = SessionInfoModel(session_id="test-session", user_id="test-user")
+        mock_session.metadata = {
+            "runner": MagicMock(),
+            "adk_session": MagicMock(),
+            "run_config": MagicMock(),
+            "message_queue": AsyncMock(),
+        }
+        mock_session_manager.get_session.return_value = mock_session
+
+        with patch("src.text.router.process_message") as mock_process:
+            mock_process.return_value = []
+
+            first = client.post(
+                "/api/send/test-session",
+                json={"data": "Hello", "mime_type": "text/plain"},
+                headers={"Idempotency-Key": "msg-1"},
+            )
+            retry = client.post(
+                "/api/send/test-session",
+                json={
+                    "data": "Hello",
+                    "mime_type": "text/plain",
+                    "idempotency_key": "msg-1",
+                },
+            )
+            other = client.post(
+                "/api/send/test-session",
+                json={"data": "Hello again", "mime_type": "text/plain"},
+                headers={"Idempotency-Key": "msg-2"},
+            )
+
+        assert first.json() == retry.json() == {"status": "sent", "error": None}
+        assert other.status_code == 200
+        assert mock_process.call_count == 2
+
+    def test_send_message_cancelled_turn(self, client, mock_session_manager):
+        """Test that a turn aborted by a disconnect reports cancellation."""
+        mock_session = SessionInfoModel(session_id="test-session", user_id="test-user")
+        mock_queue = AsyncMock()
+        mock_session.metadata = {
+            "runner": MagicMock(),
+            "adk_session": MagicMock(),
+            "run_config": MagicMock(),
+            "message_queue": mock_queue,
+            # Past the first message, so no acknowledgement is queued
+            "greeting_sent": True,
+        }
+        mock_session_manager.get_session.return_value = mock_session
+
+        async def disconnect_mid_turn(*_args, cancel_token=None, **_kwargs):
+            turn_registry.cancel_session("test-session", "client_disconnected")
+            await asyncio.sleep(10)
+
+        with (
+            patch("src.text.router.process_message", disconnect_mid_turn),
+            patch("src.text.router.get_performance_monitor") as mock_perf,
+        ):
+            mock_monitor = MagicMock()
+            mock_monitor.track_request.return_value.__aenter__ = AsyncMock()
+            mock_monitor.track_request.return_value.__aexit__ = AsyncMock(
+                return_value=False
+            )
+            mock_perf.return_value = mock_monitor
+
+            response = client.post(
+                "/api/send/test-session",
+                json={"data": "Hello", "mime_type": "text/plain"},
+            )
+
+        assert response.status_code == 200
+        assert response.json() == {
+            "status": "cancelled",
+            "error": "client_disconnected",
+        }
+        mock_monitor.record_turn_cancelled.assert_called_once_with(
+            "test-session", "client_disconnected"
+        )
+        mock_queue.put.assert_not_called()
+        assert turn_registry.inflight_count("test-session") == 0
+
     def test_send_message_session_not_found(self, client, mock_session_manager):
         """Test sending message to non-existent session."""
         mock_session_manager.get_session.return_value = None
@@ -0,0 +1,108 @@
+"""Tests for per-session turn serialization and coalescing."""
+
+import asyncio
+
+import pytest
+
+from src.text.turn_queue import TurnQueue
+
+
+class TestTurnQueue:
+    """Test turn queue behavior."""
+
+    @pytest.mark.asyncio
+    async def test_single_message_runs_one_turn(self):
+        """Test that an idle queue runs a message immediately."""
+        turns: list[str] = []
+
+        async def run_turn(text):
+            turns.append(text)
+            return f"reply to {text}"
+
+        queue = TurnQueue(run_turn, session_id="s1")
+        assert await queue.submit("hello") == "reply to hello"
+        assert turns == ["hello"]
+        assert not queue.busy
+
+    @pytest.mark.asyncio
+    async def test_turns_never_overlap(self):
+        """Test that turns for one session are serialized."""
+        running = 0
+        max_running = 0
+        release = asyncio.Event()
+
+        async def run_turn(text):
+            nonlocal running, max_running
+            running += 1
+            max_running = max(max_running, running)
+            await release.wait()
+            running -= 1
+            return text
+
+        queue = TurnQueue(run_turn)
+        first = asyncio.create_task(queue.submit("a"))
+        await asyncio.sleep(0)
+        second = asyncio.create_task(queue.submit("b"))
+        await asyncio.sleep(0)
+        release.set()
+
+        assert await first == "a"
+        assert await second == "b"
+        assert max_running == 1
+
+    @pytest.mark.asyncio
+    async def test_messages_queued_during_turn_are_merged(self):
+        """Test that rapid messages are coalesced into a single next turn."""
+        turns: list[str] = []
+        release = asyncio.Event()
+
+        async def run_turn(text):
+            turns.append(text)
+            if len(turns) == 1:
+                await release.wait()
+            return len(turns)
+
+        queue = TurnQueue(run_turn)
+        first = asyncio.create_task(queue.submit("first"))
+        await asyncio.sleep(0)
+        followups = [
+            asyncio.create_task(queue.submit(text)) for text in ("one", "two", "three")
+        ]
+        await asyncio.sleep(0)
+        assert queue.pending_count == 3
+        release.set()
+
+        assert await first == 1
+        assert [await task for task in followups] == [2, 2, 2]
+        assert turns == ["first", "one\ntwo\nthree"]
+
+    @pytest.mark.asyncio
+    async def test_turn_error_reaches_whole_batch(self):
+        """Test that a failed turn fails every message merged into it."""
+        release = asyncio.Event()
+        calls = 0
+
+        async def run_turn(text):
+            nonlocal calls
+            calls += 1
+            if calls == 1:
+                await release.wait()
+                return "ok"
+            raise RuntimeError("model error")
+
+        queue = TurnQueue(run_turn)
+        first = asyncio.create_task(queue.submit("first"))
+        await asyncio.sleep(0)
+        merged = [asyncio.create_task(queue.submit(t)) for t in ("a", "b")]
+        await asyncio.sleep(0)
+        release.set()
+
+        assert await first == "ok"
+        for task in merged:
+            with pytest.raises(RuntimeError):
+                await task
+
+        # The queue keeps working after a failure
+        calls = 0
+        release.set()
+        assert await queue.submit("again") == "ok"
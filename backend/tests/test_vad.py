@@ -0,0 +1,109 @@
+"""Tests for upstream voice activity detection."""
+
+from unittest.mock import MagicMock
+
+import numpy as np
+import pytest
+
+from src.utils.performance_monitor import get_performance_monitor
+from src.voice.session_manager import VoiceSession
+from src.voice.vad import VoiceActivityDetector
+
+RATE = 16000
+FRAME = 320  # 20ms
+
+
+def _tone(frames: int, amplitude: float = 8000.0) -> bytes:
+    t = np.arange(frames * FRAME) / RATE
+    return (np.sin(2 * np.pi * 220 * t) * amplitude).astype(np.int16).tobytes()
+
+
+def _silence(frames: int) -> bytes:
+    return np.zeros(frames * FRAME, dtype=np.int16).tobytes()
+
+
+class TestVoiceActivityDetector:
+    def test_speech_passes_and_silence_is_thinned(self):
+        vad = VoiceActivityDetector(hangover_ms=0, silence_keep_every=4)
+
+        speech, _ = vad.process(_tone(10))
+        silence, _ = vad.process(_silence(40))
+
+        assert speech == _tone(10)
+        assert len(silence) == 10 * FRAME * 2
+        assert vad.suppressed_bytes == 30 * FRAME * 2
+        assert vad.passed_bytes == 20 * FRAME * 2
+
+    def test_silence_can_be_dropped_entirely(self):
+        vad = VoiceActivityDetector(silence_keep_every=0)
+        out, ended = vad.process(_silence(25))
+        assert out == b""
+        assert not ended
+
+    def test_hangover_keeps_tail_and_reports_speech_end(self):
+        vad = VoiceActivityDetector(hangover_ms=100, silence_keep_every=0)
+        vad.process(_tone(5))
+
+        # The first 5 silent frames are the hangover; speech ends after them
+        tail, ended = vad.process(_silence(3))
+        assert len(tail) == 3 * FRAME * 2
+        assert not ended
+        assert vad.in_speech
+
+        rest, ended = vad.process(_silence(5))
+        assert len(rest) == 2 * FRAME * 2
+        assert ended
+        assert vad.speech_ends == 1
+
+    def test_partial_frames_are_held(self):
+        vad = VoiceActivityDetector(hangover_ms=0)
+        audio = _tone(2)
+        first, _ = vad.process(audio[:500])
+        second, _ = vad.process(audio[500:])
+
+        assert first == b""
+        assert second == audio[: 2 * FRAME * 2]
+        assert vad.flush() == b""
+
+    def test_quiet_noise_is_silence(self):
+        noise = np.random.default_rng(0).normal(0, 30, 20 * FRAME)
+        vad = VoiceActivityDetector(silence_keep_every=0)
+        out, _ = vad.process(noise.astype(np.int16).tobytes())
+        assert out == b""
+
+
+class TestVoiceSessionVAD:
+    @pytest.fixture
+    async def session(self):
+        voice_session = VoiceSession("voice-vad")
+        voice_session.status = "active"
+        voice_session.live_request_queue = MagicMock()
+        voice_session._vad = VoiceActivityDetector(hangover_ms=40, silence_keep_every=0)
+        get_performance_monitor().reset_metrics()
+        yield voice_session
+        await voice_session.cleanup()
+        get_performance_monitor().reset_metrics()
+
+    @pytest.mark.asyncio
+    async def test_silence_is_not_sent_and_end_of_speech_closes_turn(self, session):
+        queue = session.live_request_queue
+
+        await session.send_audio(_tone(6), RATE)
+        await session.send_audio(_silence(50), RATE)
+
+        sent = b"".join(c.args[0].data for c in queue.send_realtime.call_args_list)
+        assert len(sent) == (6 + 2) * FRAME * 2
+        queue.send_audio_stream_end.assert_called_once()
+
+        activity = get_performance_monitor().get_metrics()["voice_activity"]
+        assert activity["suppressed_bytes"] == 48 * FRAME * 2
+        assert activity["speech_ends"] == 1
+
+    @pytest.mark.asyncio
+    async def test_end_turn_without_audio_stream_end(self, session):
+        # google-adk releases before send_audio_stream_end
+        del session.live_request_queue.send_audio_stream_end
+
+        await session.send_control("end_turn")
+
+        assert session.status == "active"
@@ -0,0 +1,158 @@
+"""Tests for outbound voice audio coalescing and framing."""
+
+import asyncio
+import base64
+import json
+import struct
+from types import SimpleNamespace
+from unittest.mock import MagicMock, patch
+
+import pytest
+from fastapi.testclient import TestClient
+
+with patch("src.voice.session_manager.voice_session_manager", MagicMock()):
+    from src.main import app
+
+from src.utils.audio_codecs import encode_audio
+from src.voice.outbound import (
+    FRAME_AUDIO,
+    FRAME_MESSAGE,
+    binary_frame,
+    coalesced_items,
+    sse_frame,
+)
+from src.voice.session_manager import VoiceSession
+
+
+def _audio_event(data: bytes):
+    part = SimpleNamespace(
+        inline_data=SimpleNamespace(mime_type="audio/pcm", data=data), text=None
+    )
+    return SimpleNamespace(content=SimpleNamespace(parts=[part]), turn_complete=False)
+
+
+def _turn_complete():
+    return SimpleNamespace(content=None, turn_complete=True, interrupted=False)
+
+
+def _session(*events) -> VoiceSession:
+    session = VoiceSession("voice-outbound")
+    session.status = "active"
+    for event in events:
+        session.agent_queue.put_nowait(event)
+    return session
+
+
+async def _take(items, count: int) -> list:
+    return [await anext(items) for _ in range(count)]
+
+
+class TestCoalescing:
+    @pytest.mark.asyncio
+    async def test_consecutive_audio_is_merged_after_the_first_part(self):
+        session = _session(
+            _audio_event(b"a" * 4),
+            _audio_event(b"b" * 4),
+            _audio_event(b"c" * 4),
+            _turn_complete(),
+            _audio_event(b"d" * 4),
+        )
+        items = await _take(coalesced_items(session, budget_ms=100), 4)
+
+        assert items == [
+            b"a" * 4,  # first audio of the turn goes out at once
+            b"b" * 4 + b"c" * 4,
+            {"type": "turn_complete", "interrupted": False},
+            b"d" * 4,  # next turn starts immediately again
+        ]
+
+    @pytest.mark.asyncio
+    async def test_frames_are_capped_by_the_budget(self):
+        # 1ms of 24kHz 16-bit audio is 48 bytes
+        session = _session(*(_audio_event(b"x" * 40) for _ in range(5)))
+        items = await _take(coalesced_items(session, budget_ms=1), 3)
+
+        assert [len(item) for item in items] == [40, 80, 80]
+
+    @pytest.mark.asyncio
+    async def test_held_audio_is_flushed_after_the_budget(self):
+        session = _session(_audio_event(b"a" * 4), _audio_event(b"b" * 4))
+        items = coalesced_items(session, budget_ms=20)
+        assert await anext(items) == b"a" * 4
+
+        # No further events arrive; the held part still goes out in time
+        held = await asyncio.wait_for(anext(items), timeout=1)
+        assert held == b"b" * 4
+
+
+class TestFraming:
+    def test_sse_audio_envelope(self):
+        frame = sse_frame(b"\x01\x02\x03")
+        assert frame.startswith("data: ") and frame.endswith("\n\n")
+        message = json.loads(frame[len("data: ") :])
+        assert message == {
+            "type": "audio",
+            "data": base64.b64encode(b"\x01\x02\x03").decode(),
+        }
+
+    def test_binary_frames(self):
+        header = struct.pack(">BI", FRAME_AUDIO, 2)
+        assert binary_frame(b"\x01\x02") == header + b"\x01\x02"
+        frame = binary_frame({"type": "error", "error": "boom"})
+        kind, length = struct.unpack(">BI", frame[:5])
+        assert kind == FRAME_MESSAGE
+        assert json.loads(frame[5 : 5 + length]) == {"type": "error", "error": "boom"}
+
+
+class TestStreamNegotiation:
+    @pytest.fixture
+    def client(self):
+        session = _session(
+            _audio_event(b"\x10\x20"), {"type": "error", "error": "done"}
+        )
+        with patch("src.voice.router.voice_session_manager") as manager:
+            manager.get_session.return_value = session
+            yield TestClient(app)
+
+    def test_sse_by_default(self, client):
+        response = client.get("/api/voice/sessions/voice-outbound/stream")
+
+        assert response.headers["content-type"].startswith("text/event-stream")
+        events = [
+            json.loads(line[len("data: ") :])
+            for line in response.text.split("\n\n")
+            if line
+        ]
+        assert [e["type"] for e in events] == ["turn_complete", "audio", "error"]
+        assert base64.b64decode(events[1]["data"]) == b"\x10\x20"
+
+    def test_g711_audio_when_requested(self, client):
+        response = client.get(
+            "/api/voice/sessions/voice-outbound/stream?encoding=pcma",
+            headers={"Accept": "application/octet-stream"},
+        )
+
+        # Skip the connected message; the audio frame follows it
+        body = response.content
+        body = body[5 + struct.unpack(">BI", body[:5])[1] :]
+        assert body[:5] == struct.pack(">BI", FRAME_AUDIO, 1)
+        assert body[5:6] == encode_audio(b"\x10\x20", "pcma")
+
+    def test_binary_frames_when_accepted(self, client):
+        response = client.get(
+            "/api/voice/sessions/voice-outbound/stream",
+            headers={"Accept": "application/octet-stream"},
+        )
+
+        assert response.headers["content-type"] == "application/octet-stream"
+        body, frames = response.content, []
+        while body:
+            kind, length = struct.unpack(">BI", body[:5])
+            frames.append((kind, body[5 : 5 + length]))
+            body = body[5 + length :]
+        assert frames[1] == (FRAME_AUDIO, b"\x10\x20")
+        assert [kind for kind, _ in frames] == [
+            FRAME_MESSAGE,
+            FRAME_AUDIO,
+            FRAME_MESSAGE,
+        ]
@@ -90,6 +90,24 @@ class TestAudioEndpoints:
         )
         assert response.status_code == 200
         assert response.json()["status"] == "received"
+        assert mock_session.send_audio.call_args.args[1] == 48000
+
+    def test_send_audio_chunk_g711_defaults_to_8khz(
+        self, client, mock_voice_session_manager
+    ):
+        """Test that G.711 chunks without a rate are taken as 8kHz."""
+        mock_session = MagicMock(spec=VoiceSession)
+        mock_session.status = "active"
+        mock_session.send_audio = AsyncMock()
+        mock_voice_session_manager.get_session.return_value = mock_session
+
+        response = client.post(
+            "/api/voice/sessions/voice-123/audio",
+            json={"data": "/w==", "timestamp": 1, "encoding": "pcmu"},
+        )
+
+        assert response.status_code == 200
+        assert mock_session.send_audio.call_args.args[1] == 8000
 
     def test_send_audio_chunk_session_not_found(
         self, client, mock_voice_session_manager
@@ -120,6 +138,174 @@ class TestAudioEndpoints:
         assert response.json()["detail"] == "Session is not active"
 
 
+class TestRawAudioEndpoint:
+    """Test the binary audio ingestion endpoint."""
+
+    URL = "/api/voice/sessions/voice-123/audio/raw"
+    OCTET = {"Content-Type": "application/octet-stream"}
+
+    @pytest.fixture
+    def active_session(self, mock_voice_session_manager):
+        session = VoiceSession("voice-123")
+        session.status = "active"
+        session.send_audio = AsyncMock()  # type: ignore[method-assign]
+        mock_voice_session_manager.get_session.return_value = session
+        return session
+
+    def test_raw_audio_is_forwarded_as_memoryview(self, client, active_session):
+        """Test that the body reaches the session without re-encoding."""
+        response = client.post(
+            self.URL,
+            content=b"\x01\x00" * 480,
+            headers={**self.OCTET, "X-Sample-Rate": "24000", "X-Sequence": "7"},
+        )
+
+        assert response.status_code == 200
+        assert response.json() == {"status": "received", "bytes": 960, "sequence": 7}
+        chunk, rate = active_session.send_audio.call_args.args
+        assert isinstance(chunk, memoryview)
+        assert bytes(chunk) == b"\x01\x00" * 480
+        assert rate == 24000
+
+    def test_large_body_is_split(self, client, active_session):
+        """Test that bodies above the per-chunk limit are sent in pieces."""
+        response = client.post(self.URL, content=b"\x00" * 150_000, headers=self.OCTET)
+
+        assert response.status_code == 200
+        sizes = [len(c.args[0]) for c in active_session.send_audio.call_args_list]
+        assert sum(sizes) == 150_000
+        assert max(sizes) <= 65536
+
+    def test_chunked_body_carries_odd_bytes(self, client, active_session):
+        """Test a streamed body whose pieces split samples."""
+
+        def body():
+            yield b"\x01"
+            yield b"\x02\x03"
+            yield b"\x04"
+
+        response = client.post(self.URL, content=body(), headers=self.OCTET)
+
+        assert response.status_code == 200
+        forwarded = b"".join(
+            bytes(c.args[0]) for c in active_session.send_audio.call_args_list
+        )
+        assert forwarded == b"\x01\x02\x03\x04"
+
+    def test_odd_length_body_rejected(self, client, active_session):
+        """Test that a body ending mid-sample is rejected."""
+        response = client.post(self.URL, content=b"\x00" * 3, headers=self.OCTET)
+        assert response.status_code == 400
+
+    def test_duplicate_sequence_is_dropped(self, client, active_session):
+        """Test that replayed sequence numbers are not processed twice."""
+        headers = {**self.OCTET, "X-Sequence": "3"}
+        client.post(self.URL, content=b"\x00\x00", headers=headers)
+        response = client.post(self.URL, content=b"\x00\x00", headers=headers)
+
+        assert response.json() == {"status": "duplicate", "sequence": 3}
+        assert active_session.send_audio.call_count == 1
+
+    def test_failed_upload_can_be_retried(self, client, active_session):
+        """Test that a sequence number is only kept once forwarding succeeds."""
+        headers = {**self.OCTET, "X-Sequence": "4"}
+        active_session.send_audio.side_effect = [RuntimeError("upstream"), None]
+
+        assert (
+            client.post(self.URL, content=b"\x00\x00", headers=headers).status_code
+            == 500
+        )
+        response = client.post(self.URL, content=b"\x00\x00", headers=headers)
+
+        assert response.json() == {"status": "received", "bytes": 2, "sequence": 4}
+        assert active_session.send_audio.call_count == 2
+
+    def test_oversized_body_rejected(self, client, active_session):
+        """Test that bodies over the total size limit are refused."""
+        headers = {**self.OCTET, "X-Sequence": "5"}
+
+        def body():
+            yield b"\x00" * 600
+            yield b"\x00" * 600
+
+        with patch("src.voice.router.MAX_RAW_AUDIO_BYTES", 1000):
+            sized = client.post(self.URL, content=b"\x00" * 1200, headers=headers)
+            chunked = client.post(self.URL, content=body(), headers=headers)
+
+        assert sized.status_code == 413
+        assert chunked.status_code == 413
+        active_session.send_audio.assert_not_called()
+        assert active_session.accept_audio_sequence(5)
+
+    def test_partly_forwarded_upload_is_not_replayed(self, client, active_session):
+        """Test that a retry cannot resend audio that already went upstream."""
+        headers = {**self.OCTET, "X-Sequence": "6"}
+        active_session.send_audio.side_effect = [None, RuntimeError("upstream")]
+        body = b"\x00" * 200_000
+
+        assert client.post(self.URL, content=body, headers=headers).status_code == 500
+        response = client.post(self.URL, content=body, headers=headers)
+
+        assert response.json() == {"status": "duplicate", "sequence": 6}
+        assert active_session.send_audio.call_count == 2
+
+    def test_wrong_content_type_rejected(self, client, active_session):
+        """Test that JSON bodies are refused on the raw endpoint."""
+        response = client.post(self.URL, json={"data": ""})
+        assert response.status_code == 415
+
+    def test_g711_body_is_decoded_to_pcm(self, client, active_session):
+        """Test that G.711 uploads reach the session as 16-bit PCM."""
+        response = client.post(
+            self.URL,
+            content=b"\xff\x80" * 40_000,
+            headers={"Content-Type": "audio/PCMU", "X-Sample-Rate": "8000"},
+        )
+
+        assert response.status_code == 200
+        assert response.json()["bytes"] == 80_000
+        chunks = [bytes(c.args[0]) for c in active_session.send_audio.call_args_list]
+        assert max(len(chunk) for chunk in chunks) <= 65536
+        assert b"".join(chunks) == b"\x00\x00\x7c\x7d" * 40_000
+
+    @pytest.mark.parametrize(
+        "headers,rate",
+        [
+            ({"Content-Type": "audio/PCMU"}, 8000),
+            ({"Content-Type": "audio/L16"}, 16000),
+            ({"Content-Type": "audio/L16; rate=24000"}, 24000),
+            ({"Content-Type": "audio/L16;rate=24000", "X-Sample-Rate": "44100"}, 44100),
+            ({"Content-Type": "application/octet-stream"}, 48000),
+        ],
+    )
+    def test_sample_rate_defaults_per_encoding(
+        self, client, active_session, headers, rate
+    ):
+        """Test the X-Sample-Rate, rate parameter and per-encoding defaults."""
+        response = client.post(self.URL, content=b"\xff\xff", headers=headers)
+
+        assert response.status_code == 200
+        assert active_session.send_audio.call_args.args[1] == rate
+
+    @pytest.mark.parametrize(
+        "content_type",
+        ["audio/L16;rate=fast", "audio/L16;rate=0", "audio/L16;channels=2"],
+    )
+    def test_invalid_content_type_parameters(
+        self, client, active_session, content_type
+    ):
+        """Test that bad rate or channel parameters are refused."""
+        response = client.post(
+            self.URL, content=b"\x00\x00", headers={"Content-Type": content_type}
+        )
+        assert response.status_code == 400
+
+    def test_raw_audio_session_not_found(self, client, mock_voice_session_manager):
+        """Test sending raw audio to a non-existent session."""
+        response = client.post(self.URL, content=b"\x00\x00", headers=self.OCTET)
+        assert response.status_code == 404
+
+
 class TestVoiceControlEndpoints:
     """Test voice control endpoints."""
 
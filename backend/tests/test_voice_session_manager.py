@@ -1,10 +1,22 @@
 """Tests for voice session manager."""
 
+import asyncio
+import os
+from types import SimpleNamespace
 from unittest.mock import AsyncMock, MagicMock, patch
 
+import numpy as np
 import pytest
 
-from src.voice.session_manager import VoiceSessionManager, voice_session_manager
+from src.utils.language_utils import DEFAULT_LANGUAGE
+from src.utils.performance_monitor import get_performance_monitor
+from src.voice.outbound import coalesced_items
+from src.voice.session_manager import (
+    TURN_STAGES,
+    VoiceSession,
+    VoiceSessionManager,
+    voice_session_manager,
+)
 
 
 class TestVoiceSessionManager:
@@ -90,3 +102,212 @@ class TestVoiceSessionManager:
         # Verify cleanup was called and session removed
         mock_session.cleanup.assert_called_once()
         assert "test-session" not in manager.sessions
+
+
+class TestVoiceSessionResampling:
+    """Test input resampling of a voice session."""
+
+    def test_resampler_state_is_kept_across_chunks(self):
+        """Chunks of one stream share a resampler; a new rate replaces it."""
+        session = VoiceSession("voice-resample")
+        chunk = np.zeros(960, dtype=np.int16).tobytes()  # 20ms at 48kHz
+
+        out = session._convert_audio_to_16khz(chunk, input_sample_rate=48000)
+        resampler = session._resampler
+        session._convert_audio_to_16khz(chunk, input_sample_rate=48000)
+
+        assert len(out) == 320 * 2
+        assert session._resampler is resampler
+
+        session._convert_audio_to_16khz(chunk, input_sample_rate=44100)
+        assert session._resampler is not resampler
+        assert session._resampler is not None
+        assert session._resampler.in_rate == 44100
+
+    def test_memoryview_input(self):
+        """Raw-body memoryviews convert like bytes."""
+        session = VoiceSession("voice-memoryview")
+        chunk = np.arange(960, dtype=np.int16).tobytes()
+
+        assert session._convert_audio_to_16khz(memoryview(chunk), 16000) == chunk
+        resampled = session._convert_audio_to_16khz(memoryview(chunk), 48000)
+        assert len(resampled) == 320 * 2
+
+
+class TestVoiceSessionPool:
+    """Test the prewarmed voice session pool."""
+
+    @staticmethod
+    async def _fake_initialize(session):
+        session.status = "active"
+
+    @pytest.fixture
+    def prewarm(self):
+        with (
+            patch.object(
+                VoiceSession,
+                "initialize",
+                autospec=True,
+                side_effect=self._fake_initialize,
+            ) as initialize,
+            patch.object(VoiceSession, "start_streaming", AsyncMock()),
+        ):
+            yield initialize
+
+    @pytest.mark.asyncio
+    async def test_claim_hits_pool_and_refills(self, prewarm):
+        manager = VoiceSessionManager(pool_size=2, pool_languages=["en-US", "es-ES"])
+        await manager.start()
+        await asyncio.sleep(0)
+        assert manager.pool_sizes() == {"en-US": 2, "es-ES": 2}
+
+        with patch("src.voice.session_manager.get_performance_monitor") as get_monitor:
+            session = await manager.create_session("es-ES")
+
+        record = get_monitor.return_value.record_voice_session_created
+        record.assert_called_once()
+        assert record.call_args.args[1] is True  # pooled
+        assert manager.get_session(session.session_id) is session
+        assert session.language == "es-ES"
+        assert manager.pool_sizes()["es-ES"] == 1
+
+        # The background task tops the pool up again
+        await asyncio.sleep(0)
+        assert manager.pool_sizes()["es-ES"] == 2
+        assert prewarm.call_count == 5
+
+        await manager.stop()
+        assert manager.pool_sizes() == {}
+
+    @pytest.mark.asyncio
+    async def test_unpooled_language_is_created_on_demand(self, prewarm):
+        manager = VoiceSessionManager(pool_size=1, pool_languages=["en-US"])
+        await manager.start()
+        await asyncio.sleep(0)
+
+        with patch("src.voice.session_manager.get_performance_monitor") as get_monitor:
+            session = await manager.create_session("fr-FR")
+
+        record = get_monitor.return_value.record_voice_session_created
+        assert record.call_args.args[1] is False  # pooled
+        assert session.status == "active"
+        assert manager.pool_sizes() == {"en-US": 1}
+        await manager.stop()
+
+    @pytest.mark.skipif(
+        "VOICE_POOL_LANGUAGES" in os.environ, reason="pool languages configured"
+    )
+    def test_pool_defaults_to_the_default_language(self):
+        assert VoiceSessionManager().pool_languages == [DEFAULT_LANGUAGE]
+
+
+class TestVoiceSessionLatency:
+    """Test per-stage latency of the voice pipeline."""
+
+    @pytest.fixture
+    async def session(self):
+        voice_session = VoiceSession("voice-latency")
+        voice_session.status = "active"
+        voice_session.live_request_queue = MagicMock()
+        get_performance_monitor().reset_metrics()
+        yield voice_session
+        await voice_session.cleanup()
+        get_performance_monitor().reset_metrics()
+
+    @pytest.mark.asyncio
+    async def test_turn_stages_are_timed_from_user_audio(self, session):
+        audio = SimpleNamespace(
+            inline_data=SimpleNamespace(mime_type="audio/pcm", data=b"\x01\x02"),
+            text=None,
+        )
+        events = [
+            SimpleNamespace(
+                content=SimpleNamespace(parts=[audio]), turn_complete=False
+            ),
+            SimpleNamespace(content=None, turn_complete=True, interrupted=False),
+        ]
+
+        async def live_events():
+            for event in events:
+                yield event
+
+        await session.send_audio(b"\x00\x01" * 480, 48000)
+        await session.flush_audio()
+        session.live_events = live_events()
+        await session._stream_handler()
+        session.status = "active"
+        outbound = coalesced_items(session)
+        assert await anext(outbound) == b"\x01\x02"
+
+        summary = get_performance_monitor().get_metrics()
+        latency = summary["voice_latency"]
+        for stage in (
+            "resample",
+            "enqueue",
+            "first_agent_event",
+            "first_audio",
+            "turn_complete",
+        ):
+            assert latency[stage]["count"] >= 1, stage
+        assert latency["first_agent_event"]["count"] == 1
+        assert summary["voice_ttfa"]["voice-latency"]["turns"] == 1
+
+    @pytest.mark.asyncio
+    async def test_streaming_microphone_does_not_reset_turn_timer(self, session):
+        audio = SimpleNamespace(
+            inline_data=SimpleNamespace(mime_type="audio/pcm", data=b"\x01\x02"),
+            text=None,
+        )
+        frame = b"\x00\x01" * 480
+
+        await session.send_audio(frame, 48000)
+        await session.flush_audio()
+        started = session._turn_input_at
+
+        async def live_events():
+            yield SimpleNamespace(
+                content=SimpleNamespace(parts=[audio]), turn_complete=False
+            )
+            # The microphone keeps streaming while the agent speaks
+            for _ in range(3):
+                await session.send_audio(frame, 48000)
+                await session.flush_audio()
+            assert session._turn_input_at == started
+            yield SimpleNamespace(
+                content=SimpleNamespace(parts=[audio]), turn_complete=False
+            )
+            yield SimpleNamespace(content=None, turn_complete=True, interrupted=False)
+
+        session.live_events = live_events()
+        await session._stream_handler()
+        session.status = "active"
+
+        latency = get_performance_monitor().get_metrics()["voice_latency"]
+        assert latency["first_agent_event"]["count"] == 1
+        assert latency["turn_complete"]["count"] == 1
+        assert session._pending_stages == {"first_audio"}
+
+        # Once the client played the answer, the next frame starts a new turn
+        session.record_turn_stage("first_audio")
+        await session.send_audio(frame, 48000)
+        await session.flush_audio()
+        assert session._turn_input_at > started
+        assert session._pending_stages == set(TURN_STAGES)
+
+    @pytest.mark.asyncio
+    async def test_end_turn_replaces_estimated_turn_start(self, session):
+        await session.send_audio(b"\x00\x01" * 480, 48000)
+        await session.flush_audio()
+        estimated = session._turn_input_at
+
+        await session.send_control("end_turn")
+        assert session._turn_input_at > estimated
+
+        # A second end of speech does not restart a turn already timed
+        ended = session._turn_input_at
+        await session.send_control("end_turn")
+        assert session._turn_input_at == ended
+
+    def test_agent_output_without_user_audio_is_not_timed(self, session):
+        session.record_turn_stage("first_audio")
+        assert "voice_ttfa" not in get_performance_monitor().get_metrics()
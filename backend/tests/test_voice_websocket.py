@@ -0,0 +1,137 @@
+"""Tests for the voice WebSocket endpoint."""
+
+import json
+from types import SimpleNamespace
+from unittest.mock import AsyncMock, MagicMock, patch
+
+import pytest
+from fastapi.testclient import TestClient
+from starlette.websockets import WebSocketDisconnect
+
+with patch("src.voice.session_manager.voice_session_manager", MagicMock()):
+    from src.main import app
+
+from src.voice.session_manager import VoiceSession
+
+URL = "/api/voice/sessions/voice-ws/ws"
+
+
+def _audio_event(data: bytes):
+    part = SimpleNamespace(
+        inline_data=SimpleNamespace(mime_type="audio/pcm", data=data), text=None
+    )
+    return SimpleNamespace(content=SimpleNamespace(parts=[part]), turn_complete=False)
+
+
+def _text_event(text: str, partial: bool = False):
+    part = SimpleNamespace(inline_data=None, text=text)
+    return SimpleNamespace(
+        content=SimpleNamespace(parts=[part]), partial=partial, turn_complete=False
+    )
+
+
+@pytest.fixture
+def session():
+    voice_session = VoiceSession("voice-ws")
+    voice_session.status = "active"
+    voice_session.send_audio = AsyncMock()  # type: ignore[method-assign]
+    return voice_session
+
+
+@pytest.fixture
+def client(session):
+    with patch("src.voice.router.voice_session_manager") as manager:
+        manager.get_session.return_value = session
+        yield TestClient(app)
+
+
+class TestVoiceWebSocket:
+    def test_binary_audio_reaches_session(self, client, session):
+        with client.websocket_connect(f"{URL}?sample_rate=24000") as ws:
+            assert json.loads(ws.receive_text())["type"] == "connected"
+            ws.send_bytes(b"\x00\x01" * 240)
+            ws.send_text(json.dumps({"type": "config", "sample_rate": 16000}))
+            ws.send_bytes(b"\x00\x02" * 160)
+            # Round-trip a message so both frames have been handled
+            ws.send_text("not json")
+            assert json.loads(ws.receive_text())["type"] == "error"
+
+        calls = session.send_audio.call_args_list
+        assert [bytes(c.args[0]) for c in calls] == [
+            b"\x00\x01" * 240,
+            b"\x00\x02" * 160,
+        ]
+        assert [c.args[1] for c in calls] == [24000, 16000]
+
+    def test_g711_in_both_directions(self, client, session):
+        session.agent_queue.put_nowait(_audio_event(b"\x00\x00\x7c\x7d"))
+
+        with client.websocket_connect(f"{URL}?sample_rate=8000&encoding=pcmu") as ws:
+            assert json.loads(ws.receive_text())["type"] == "connected"
+            assert ws.receive_bytes() == b"\xff\x80"
+            ws.send_bytes(b"\xff\x80")
+            ws.send_text(json.dumps({"type": "config", "encoding": "opus"}))
+            assert json.loads(ws.receive_text()) == {
+                "type": "error",
+                "error": "Invalid encoding",
+            }
+
+        assert bytes(session.send_audio.call_args.args[0]) == b"\x00\x00\x7c\x7d"
+
+    def test_agent_events_are_streamed(self, client, session):
+        session.agent_queue.put_nowait(_text_event("Hello"))
+        session.agent_queue.put_nowait(_audio_event(b"\x10\x20"))
+        session.agent_queue.put_nowait(
+            SimpleNamespace(content=None, turn_complete=True, interrupted=False)
+        )
+
+        with client.websocket_connect(URL) as ws:
+            assert json.loads(ws.receive_text())["type"] == "connected"
+            assert json.loads(ws.receive_text())["text"] == "Hello"
+            assert ws.receive_bytes() == b"\x10\x20"
+            assert json.loads(ws.receive_text()) == {
+                "type": "turn_complete",
+                "interrupted": False,
+            }
+
+    def test_end_session_control_closes_connection(self, client, session):
+        session.send_control = AsyncMock(  # type: ignore[method-assign]
+            side_effect=lambda action: setattr(session, "status", "ended")
+        )
+
+        with client.websocket_connect(URL) as ws:
+            ws.receive_text()
+            ws.send_text(json.dumps({"type": "control", "action": "end_session"}))
+            with pytest.raises(WebSocketDisconnect):
+                ws.receive_text()
+
+        session.send_control.assert_awaited_once_with("end_session")
+
+    def test_invalid_audio_frame_reports_error(self, client, session):
+        session.send_audio.side_effect = ValueError("Audio data length must be even")
+
+        with client.websocket_connect(URL) as ws:
+            ws.receive_text()
+            ws.send_bytes(b"\x00")
+            assert "even" in json.loads(ws.receive_text())["error"]
+
+    def test_unknown_session_is_rejected(self, client):
+        with patch("src.voice.router.voice_session_manager") as manager:
+            manager.get_session.return_value = None
+            with (
+                pytest.raises(WebSocketDisconnect) as exc,
+                client.websocket_connect(URL),
+            ):
+                pass
+        assert exc.value.code == 1008
+
+    def test_loop_failure_is_logged(self, client, session, caplog):
+        session.send_audio.side_effect = RuntimeError("queue closed")
+
+        with client.websocket_connect(URL) as ws:
+            ws.receive_text()
+            ws.send_bytes(b"\x00\x00")
+            with pytest.raises(WebSocketDisconnect):
+                ws.receive_text()
+
+        assert "queue closed" in caplog.text